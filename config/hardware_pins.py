@@ -12,6 +12,7 @@ class HardwarePins:
     DISTANCE_SENSOR_SDA: int = 2   # I2C SDA
     DISTANCE_SENSOR_SCL: int = 3   # I2C SCL
     DISTANCE_SENSOR_SHUTDOWN: int = 4  # Optional shutdown pin
+    DISTANCE_SENSOR_INTERRUPT: int = 12  # GPIO1 data-ready (active low, open drain)
     
     # Light sensor (TSL2561)
     LIGHT_SENSOR_SDA: int = 2   # I2C SDA (shared with distance sensor)
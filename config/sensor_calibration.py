@@ -1,8 +1,15 @@
 """Sensor calibration configuration for Zolo robot sensors"""
 
+import csv
+import json
 import time
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.core.constants.global_constants import ZoloConstants
+from src.core.utils.calibration import CalibrationModel
+from src.core.utils.lazy_import import lazy_import
 from src.core.utils.logger import ZoloLogger
+from src.senses.light.tsl2561.constants import LightConstants
+from src.senses.proximity.vl53l0x.constants import DistanceConstants
 
 
 class SensorCalibration:
@@ -13,12 +20,16 @@ class SensorCalibration:
         self.logger = ZoloLogger("SensorCalibration")
         self.calibration_data: Dict[str, Any] = {}
         self.is_calibrated: Dict[str, bool] = {}
+        self.models: Dict[str, CalibrationModel] = {}  # Compiled corrections by sensor name
     
-    def calibrate_distance_sensor(self, sensor, reference_distances: list = None) -> bool:
+    def calibrate_distance_sensor(self, sensor, reference_distances: list = None, pairs_file: Optional[str] = None,
+                                  method: str = ZoloConstants.CALIBRATION_PIECEWISE) -> bool:
         """
-        <summary>Calibrate VL53L0X distance sensor with known reference distances</summary>
+        <summary>Fit a correction for the VL53L0X distance sensor and apply it to the sensor's readings</summary>
         <param name="sensor">Distance sensor instance</param>
-        <param name="reference_distances">List of reference distances in cm</param>
+        <param name="reference_distances">List of reference distances in cm (simulated backend)</param>
+        <param name="pairs_file">CSV/JSON file of (reference, measured) pairs in mm; required on hardware</param>
+        <param name="method">CALIBRATION_PIECEWISE or CALIBRATION_LEAST_SQUARES</param>
         <returns>True if calibration successful, False otherwise</returns>
         """
         if reference_distances is None:
@@ -26,42 +37,29 @@ class SensorCalibration:
         
         try:
             self.logger.info("Starting distance sensor calibration")
-            calibration_points = []
-            
-            for distance in reference_distances:
-                input(f"Place object at {distance}cm and press Enter...")
-                
-                # Take multiple readings
-                readings = []
-                for _ in range(10):
-                    reading = sensor.get_distance_cm()
-                    if reading is not None:
-                        readings.append(reading)
-                    time.sleep(0.1)
-                
-                if readings:
-                    avg_reading = sum(readings) / len(readings)
-                    calibration_points.append({
-                        'reference': distance,
-                        'measured': avg_reading,
-                        'error': abs(distance - avg_reading)
-                    })
-                    self.logger.info(f"Reference: {distance}cm, Measured: {avg_reading:.2f}cm")
-            
-            self.calibration_data['distance_sensor'] = calibration_points
-            self.is_calibrated['distance_sensor'] = True
-            self.logger.info("Distance sensor calibration completed")
-            return True
+            if pairs_file:
+                pairs = self.load_pairs(pairs_file)
+            else:
+                pairs = self.collect_pairs(
+                    sensor.read_raw_distance, self._simulated_reference("VL53L0X", "distance_override_mm"),
+                    [distance * 10.0 for distance in reference_distances], DistanceConstants.CALIBRATION_SAMPLES,
+                    lambda reading: DistanceConstants.MIN_DISTANCE_MM <= reading <= DistanceConstants.MAX_DISTANCE_MM
+                )
+            domain = (DistanceConstants.MIN_DISTANCE_MM, DistanceConstants.MAX_DISTANCE_MM)
+            return self.fit_sensor('distance_sensor', sensor, pairs, method, domain, unit="mm")
             
         except Exception as e:
             self.logger.error(f"Distance sensor calibration failed: {e}")
             return False
     
-    def calibrate_light_sensor(self, sensor, reference_levels: list = None) -> bool:
+    def calibrate_light_sensor(self, sensor, reference_levels: list = None, pairs_file: Optional[str] = None,
+                               method: str = ZoloConstants.CALIBRATION_PIECEWISE) -> bool:
         """
-        <summary>Calibrate TSL2561 light sensor with known reference light levels</summary>
+        <summary>Fit a correction for the TSL2561 light sensor (in log units) and apply it to the sensor's readings</summary>
         <param name="sensor">Light sensor instance</param>
-        <param name="reference_levels">List of reference light levels in lux</param>
+        <param name="reference_levels">List of reference light levels in lux (simulated backend)</param>
+        <param name="pairs_file">CSV/JSON file of (reference, measured) pairs in lux; required on hardware</param>
+        <param name="method">CALIBRATION_PIECEWISE or CALIBRATION_LEAST_SQUARES</param>
         <returns>True if calibration successful, False otherwise</returns>
         """
         if reference_levels is None:
@@ -69,37 +67,106 @@ class SensorCalibration:
         
         try:
             self.logger.info("Starting light sensor calibration")
-            calibration_points = []
-            
-            for level in reference_levels:
-                input(f"Set light level to {level} lux and press Enter...")
-                
-                # Take multiple readings
-                readings = []
-                for _ in range(10):
-                    reading = sensor.get_luminosity()
-                    if reading is not None:
-                        readings.append(reading)
-                    time.sleep(0.1)
-                
-                if readings:
-                    avg_reading = sum(readings) / len(readings)
-                    calibration_points.append({
-                        'reference': level,
-                        'measured': avg_reading,
-                        'error': abs(level - avg_reading)
-                    })
-                    self.logger.info(f"Reference: {level} lux, Measured: {avg_reading:.2f} lux")
-            
-            self.calibration_data['light_sensor'] = calibration_points
-            self.is_calibrated['light_sensor'] = True
-            self.logger.info("Light sensor calibration completed")
-            return True
+            if pairs_file:
+                pairs = self.load_pairs(pairs_file)
+            else:
+                pairs = self.collect_pairs(
+                    sensor.read_raw_lux, self._simulated_reference("adafruit_tsl2561", "lux_override"),
+                    reference_levels, LightConstants.CALIBRATION_SAMPLES,
+                    lambda reading: LightConstants.MIN_LUX < reading <= LightConstants.MAX_LUX
+                )
+            domain = (LightConstants.MIN_LUX, LightConstants.MAX_LUX)
+            return self.fit_sensor('light_sensor', sensor, pairs, method, domain, unit="lux", log_scale=True)
             
         except Exception as e:
             self.logger.error(f"Light sensor calibration failed: {e}")
             return False
     
+    def collect_pairs(self, read_raw: Callable[[], Optional[float]], set_reference: Optional[Callable[[float], None]],
+                      references: list, samples: int, is_valid: Callable[[float], bool]) -> List[Tuple[float, float]]:
+        """
+        <summary>Measure each reference point without operator input</summary>
+        <param name="read_raw">Reads one uncalibrated value</param>
+        <param name="set_reference">Puts the scene at a reference value (None: no reference source)</param>
+        <param name="references">Reference values in the sensor's unit</param>
+        <param name="samples">Readings per reference point</param>
+        <param name="is_valid">Filter for readings (out-of-range / saturated values are dropped)</param>
+        <returns>List of (reference, median measured) pairs</returns>
+        """
+        if set_reference is None:
+            raise RuntimeError("No reference source on the hardware backend, pass a pairs file")
+        
+        pairs = []
+        try:
+            for reference in references:
+                set_reference(reference)
+                read_raw()  # Measurement started before the scene changed
+                readings = sorted(value for value in (read_raw() for _ in range(samples))
+                                  if value is not None and is_valid(value))
+                if readings:
+                    # Median: spurious returns do not move the point
+                    measured = float(readings[len(readings) // 2])
+                    pairs.append((float(reference), measured))
+                    self.logger.info(f"Reference: {reference}, Measured: {measured:.2f}")
+        finally:
+            set_reference(None)
+        return pairs
+    
+    def fit_sensor(self, sensor_name: str, sensor, pairs: List[Tuple[float, float]], method: str,
+                   domain: Tuple[float, float], unit: str = "", log_scale: bool = False) -> bool:
+        """
+        <summary>Fit and compile a correction, store it with its pairs and apply it to the sensor</summary>
+        <param name="sensor_name">Calibration data key</param>
+        <param name="sensor">Sensor instance with set_calibration() (None to only store the model)</param>
+        <param name="pairs">List of (reference, measured) pairs</param>
+        <param name="method">CALIBRATION_PIECEWISE or CALIBRATION_LEAST_SQUARES</param>
+        <param name="domain">Range of measured values covered by the lookup table</param>
+        <param name="unit">Unit for log messages</param>
+        <param name="log_scale">Fit in log10 units</param>
+        <returns>True if successful, False otherwise</returns>
+        """
+        model = CalibrationModel.fit(pairs, method, domain, log_scale=log_scale)
+        data = model.to_dict()
+        data['pairs'] = [list(pair) for pair in pairs]
+        self.calibration_data[sensor_name] = data
+        self.models[sensor_name] = model
+        self.is_calibrated[sensor_name] = True
+        if sensor is not None:
+            sensor.set_calibration(model)
+        stats = model.stats
+        self.logger.info(f"{sensor_name} calibration completed: {method}, {stats['points']} points, "
+                         f"RMSE {stats['rmse_before']:.2f} -> {stats['rmse_after']:.2f} {unit}")
+        return True
+    
+    def load_pairs(self, filename: str) -> List[Tuple[float, float]]:
+        """
+        <summary>Read reference/measured pairs from a file</summary>
+        <param name="filename">CSV with reference,measured rows (header allowed) or JSON list of pairs / {'reference', 'measured'} objects</param>
+        <returns>List of (reference, measured) pairs</returns>
+        """
+        with open(filename, 'r') as f:
+            if filename.endswith('.json'):
+                rows = [(row['reference'], row['measured']) if isinstance(row, dict) else row for row in json.load(f)]
+            else:
+                rows = [row for row in csv.reader(f) if row and not row[0].lstrip().startswith('#')]
+        
+        pairs = []
+        for row in rows:
+            try:
+                pairs.append((float(row[0]), float(row[1])))
+            except (ValueError, IndexError):
+                # Header or malformed row
+                continue
+        self.logger.info(f"Loaded {len(pairs)} calibration pairs from {filename}")
+        return pairs
+    
+    def _simulated_reference(self, module_name: str, setting: str) -> Optional[Callable[[float], None]]:
+        """Reference setter driving the simulated scene, None on real hardware"""
+        if not lazy_import(module_name).is_simulated:
+            return None
+        from src.simulation.settings import settings
+        return lambda value: setattr(settings, setting, value)
+    
     def calibrate_camera(self, camera) -> bool:
         """
         <summary>Calibrate camera focus and exposure settings</summary>
@@ -148,6 +215,19 @@ class SensorCalibration:
         """
         return self.is_calibrated.get(sensor_name, False)
     
+    def apply_calibration(self, sensor_name: str, sensor) -> bool:
+        """
+        <summary>Apply a fitted or loaded correction to a sensor instance</summary>
+        <param name="sensor_name">Name of the sensor ('distance_sensor' or 'light_sensor')</param>
+        <param name="sensor">Sensor instance with set_calibration()</param>
+        <returns>True if a model was applied, False if the sensor has none</returns>
+        """
+        model = self.models.get(sensor_name)
+        if model is None or sensor is None:
+            return False
+        sensor.set_calibration(model)
+        return True
+    
     def save_calibration(self, filename: str = "sensor_calibration.json") -> bool:
         """
         <summary>Save calibration data to file</summary>
@@ -155,7 +235,6 @@ class SensorCalibration:
         <returns>True if successful, False otherwise</returns>
         """
         try:
-            import json
             with open(filename, 'w') as f:
                 json.dump(self.calibration_data, f, indent=2)
             self.logger.info(f"Calibration data saved to {filename}")
@@ -171,13 +250,15 @@ class SensorCalibration:
         <returns>True if successful, False otherwise</returns>
         """
         try:
-            import json
             with open(filename, 'r') as f:
                 self.calibration_data = json.load(f)
             
             # Mark all loaded sensors as calibrated
-            for sensor_name in self.calibration_data.keys():
+            self.models = {}
+            for sensor_name, data in self.calibration_data.items():
                 self.is_calibrated[sensor_name] = True
+                if isinstance(data, dict) and 'method' in data:
+                    self.models[sensor_name] = CalibrationModel.from_dict(data)
             
             self.logger.info(f"Calibration data loaded from {filename}")
             return True
@@ -187,11 +268,38 @@ class SensorCalibration:
 
 
 if __name__ == "__main__":
-    # Standalone calibration script
+    # Batch calibration, no prompts:
+    #   python -m config.sensor_calibration [output.json] [distance_pairs.csv] [light_pairs.csv]
+    # Pairs files are required on hardware; the simulated backend (ZOLO_BACKEND=simulated)
+    # places the synthetic scene at each reference point, with a known ranging error to correct.
+    import sys
+    from src.core.utils.lazy_import import get_backend
+    from src.senses.light.tsl2561 import LightSensor
+    from src.senses.proximity.vl53l0x import DistanceSensor
+    
+    output = sys.argv[1] if len(sys.argv) > 1 else "sensor_calibration.json"
+    distance_pairs = sys.argv[2] if len(sys.argv) > 2 else None
+    light_pairs = sys.argv[3] if len(sys.argv) > 3 else None
+    if get_backend() == ZoloConstants.BACKEND_SIMULATED:
+        from src.simulation.settings import settings
+        settings.configure(distance_gain=1.04, distance_offset_mm=18.0)
+    
     calibration = SensorCalibration()
     print("Zolo Robot Sensor Calibration")
-    print("Follow the prompts to calibrate each sensor")
+    distance_sensor = DistanceSensor()
+    light_sensor = LightSensor()
+    if distance_sensor.initialize():
+        calibration.calibrate_distance_sensor(distance_sensor, pairs_file=distance_pairs)
+    if light_sensor.initialize():
+        calibration.calibrate_light_sensor(light_sensor, pairs_file=light_pairs)
+    distance_sensor.cleanup()
+    light_sensor.cleanup()
     
-    # Note: This would require actual sensor instances
-    # This is a skeleton implementation
-    print("Calibration complete!")
\ No newline at end of file
+    for name in ('distance_sensor', 'light_sensor'):
+        model = calibration.models.get(name)
+        if model:
+            print(f"{name}: {model.method}, RMSE {model.stats['rmse_before']:.2f} -> {model.stats['rmse_after']:.2f}")
+        else:
+            print(f"{name}: not calibrated")
+    if calibration.models and calibration.save_calibration(output):
+        print(f"Calibration saved to {output}")
\ No newline at end of file
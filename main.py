@@ -7,28 +7,42 @@ Main entry point for Zolo robot system
 <dependencies>All Zolo components</dependencies>
 """
 
+import os
 import sys
 import signal
-import time
 import atexit
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
 
 # Core imports
+from src.core.utils.lazy_import import ImportTrace
 from src.core.utils.logger import ZoloLogger
-from src.core.utils.hardware_utils import HardwareUtils
+from src.core.utils.latency_tracker import LatencyTracker
+from src.core.utils.metrics import metrics
+from src.core.utils.config_loader import ConfigLoader
+from src.core.utils.time_series import TimeSeriesStore
 from src.core.constants.global_constants import ZoloConstants
+from src.core.runtime import (
+    AsyncRuntime, SenseSource, ComponentInitializer, ComponentShutdown, ComponentSupervisor,
+    EmergencyStopWatcher, RuntimeConstants
+)
 from config.hardware_pins import HardwarePins
+from config.sensor_calibration import SensorCalibration
 
 # Sensor imports
-from src.senses.vision.camera import CameraController
-from src.senses.vision.processing import ImageProcessor
-from src.senses.hearing.emeet import MicrophoneController
-from src.senses.hearing.recognition import SpeechRecognizer
-from src.senses.voice.emeet import SpeakerController
-from src.senses.voice.synthesis import TextToSpeech
-from src.senses.eyes.neopixel import NeoPixelController
-from src.senses.proximity.vl53l0x import DistanceSensor
-from src.senses.light.tsl2561 import LightSensor
+from src.senses.vision.camera import CameraController, CameraConstants
+from src.senses.vision.processing import ImageProcessor, ProcessingConstants
+from src.senses.hearing.emeet import MicrophoneController, MicrophoneConstants
+from src.senses.hearing.recognition import SpeechRecognizer, IntentMatcher, RecognitionConstants
+from src.senses.voice.emeet import SpeakerController, SpeakerConstants
+from src.senses.voice.synthesis import TextToSpeech, SynthesisConstants
+from src.senses.eyes.neopixel import NeoPixelController, NeoPixelConstants
+from src.senses.proximity.vl53l0x import DistanceSensor, DistanceConstants
+from src.senses.light.tsl2561 import LightSensor, LightConstants
+
+# Hardware libraries are deferred until each controller initializes
+ImportTrace.mark("imports_complete")
 
 
 class ZoloRobot:
@@ -47,6 +61,22 @@ class ZoloRobot:
         self.state = ZoloConstants.STATE_IDLE
         self.is_running = False
         self.emergency_stop_triggered = False
+        self.runtime: Optional[AsyncRuntime] = None
+        self.initializer: Optional[ComponentInitializer] = None
+        self.estop: Optional[EmergencyStopWatcher] = None
+        self.supervisor = ComponentSupervisor(on_restart=self._on_component_restarted)
+        self._cleanup_lock = threading.Lock()
+        self._cleaned_up = False
+        self.latency = LatencyTracker(on_overrun=self._on_tick_overrun)
+        self._tick_seconds = metrics.histogram("zolo_tick_seconds", "Polling main loop pass duration")
+        metrics.gauge("zolo_robot_running", "1 while the robot is running").set_function(lambda: int(self.is_running))
+        self.config = self._build_config()
+        self.history = TimeSeriesStore()
+        self.calibration = SensorCalibration()
+        
+        # Voice command dispatch table, compiled once
+        self.intent_matcher = IntentMatcher.from_registry()
+        self._intent_handlers = self._build_intent_handlers()
         
         # Initialize components
         self.camera: Optional[CameraController] = None
@@ -58,6 +88,7 @@ class ZoloRobot:
         self.eyes: Optional[NeoPixelController] = None
         self.distance_sensor: Optional[DistanceSensor] = None
         self.light_sensor: Optional[LightSensor] = None
+        self.latest_frame = None
         
         # Register cleanup handlers
         atexit.register(self.cleanup)
@@ -73,6 +104,9 @@ class ZoloRobot:
         self.state = ZoloConstants.STATE_INITIALIZING
         
         try:
+            # Overlay the configuration file before components read their constants
+            self.config.watch()
+            
             # Initialize vision components
             self.camera = CameraController()
             self.image_processor = ImageProcessor()
@@ -93,26 +127,51 @@ class ZoloRobot:
             # Initialize sensors
             self.distance_sensor = DistanceSensor()
             self.light_sensor = LightSensor()
+            # Range in the background; every distance read is then a cached sample
+            self.distance_sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
             
-            # Initialize hardware components
-            initialization_results = {
-                'camera': self.camera.initialize(),
-                'microphone': self.microphone.initialize(),
-                'speech_recognizer': self.speech_recognizer.initialize(),
-                'speaker': self.speaker.initialize(),
-                'text_to_speech': self.text_to_speech.initialize(),
-                'eyes': self.eyes.initialize(),
-                'distance_sensor': self.distance_sensor.initialize(),
-                'light_sensor': self.light_sensor.initialize()
-            }
+            # Keep every published reading for the dashboard history
+            # Sized for the fastest budget adaptive timing runs at, so the ring covers the configured history
+            self.history.attach('distance', self.distance_sensor, 1_000_000 / DistanceConstants.TIMING_BUDGET_FAST)
+            self.history.attach('light', self.light_sensor,
+                                1000 / LightConstants.INTEGRATION_WINDOW_MS[LightConstants.INTEGRATION_TIME_FAST])
+            
+            # Reading corrections fitted by config/sensor_calibration.py
+            if os.path.exists(ZoloConstants.CALIBRATION_FILE_PATH) and \
+                    self.calibration.load_calibration(ZoloConstants.CALIBRATION_FILE_PATH):
+                self.calibration.apply_calibration('distance_sensor', self.distance_sensor)
+                self.calibration.apply_calibration('light_sensor', self.light_sensor)
+            
+            # Arm the emergency stop before any device starts moving data
+            self.estop = self._build_emergency_stop()
+            self.estop.start()
+            
+            # Initialize hardware components in parallel; only wait for the
+            # critical ones, slow devices finish in the background
+            self.initializer = ComponentInitializer()
+            self.initializer.start(self._components(), on_complete=self._on_component_initialized)
+            critical_ready = self.initializer.wait_for(RuntimeConstants.CRITICAL_COMPONENTS)
             
             # Check initialization results
-            failed_components = [name for name, result in initialization_results.items() if not result]
+            report = self.initializer.get_report()
+            for name, entry in report.items():
+                duration = f"{entry['duration']:.3f}s" if entry['duration'] is not None else "pending"
+                self.logger.info(f"Component '{name}': {entry['state']} ({duration})")
+            
+            failed_components = [
+                name for name, entry in report.items()
+                if entry['state'] in (RuntimeConstants.INIT_STATE_FAILED, RuntimeConstants.INIT_STATE_TIMED_OUT)
+            ]
             
             if failed_components:
                 self.logger.warning(f"Failed to initialize components: {failed_components}")
                 # Continue with available components
             
+            if not critical_ready:
+                self.logger.warning("Not all critical components are ready, continuing in degraded mode")
+            
+            ImportTrace.mark("initialized")
+            self.logger.info(f"Startup trace:\n{ImportTrace.format_trace()}")
             self.logger.info("Zolo robot initialization completed")
             self.state = ZoloConstants.STATE_READY
             return True
@@ -141,12 +200,21 @@ class ZoloRobot:
         # Greeting message
         if self.text_to_speech:
             self.text_to_speech.speak("Hello! I'm Zolo, your robot companion. I'm ready to help!")
+        greeting_at = ImportTrace.mark("first_greeting")
+        self.logger.info(f"Time to first greeting: {greeting_at:.2f}s")
+        
+        # Event-driven runtime - each sense reacts as soon as new data arrives
+        self.runtime = AsyncRuntime(
+            after_event=self._update_visual_feedback,
+            latency_tracker=self.latency,
+            supervisor=self.supervisor
+        )
+        self._register_senses(self.runtime)
+        self.supervisor.start()
         
         try:
-            # Main operation loop
-            while self.is_running and not self.emergency_stop_triggered:
-                self._main_loop()
-                time.sleep(0.1)  # Small delay to prevent high CPU usage
+            if self.is_running and not self.emergency_stop_triggered:
+                self.runtime.run()
                 
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt, shutting down...")
@@ -155,19 +223,240 @@ class ZoloRobot:
         finally:
             self.cleanup()
     
-    def _main_loop(self) -> None:
+    def stop(self) -> None:
+        """
+        <summary>Request robot shutdown (safe to call from any thread)</summary>
+        <returns>None</returns>
+        """
+        self.is_running = False
+        if self.runtime:
+            self.runtime.request_stop()
+    
+    def _build_config(self) -> ConfigLoader:
+        """
+        <summary>Create the configuration loader with one section per tunable constants class</summary>
+        <returns>Configuration loader (not loaded yet)</returns>
+        """
+        config = ConfigLoader()
+        sections = {
+            'zolo': ZoloConstants,
+            'runtime': RuntimeConstants,
+            'camera': CameraConstants,
+            'processing': ProcessingConstants,
+            'microphone': MicrophoneConstants,
+            'recognition': RecognitionConstants,
+            'speaker': SpeakerConstants,
+            'synthesis': SynthesisConstants,
+            'neopixel': NeoPixelConstants,
+            'distance': DistanceConstants,
+            'light': LightConstants,
+        }
+        for section, constants in sections.items():
+            config.register_constants(section, constants)
+            config.subscribe(section, lambda values, changed, section=section: self._on_config_changed(
+                section, values, changed
+            ))
+        return config
+    
+    def _on_config_changed(self, section: str, values: tuple, changed: frozenset) -> None:
+        """
+        <summary>Push changed settings that components captured at initialization</summary>
+        <param name="section">Configuration section</param>
+        <param name="values">New section values</param>
+        <param name="changed">Changed keys</param>
+        <returns>None</returns>
+        """
+        # Everything else is read from the constants classes at use time
+        if section == 'zolo' and 'tick_budget' in changed:
+            self.latency.tick_budget = values.tick_budget
+        elif section == 'distance' and self.distance_sensor:
+            if 'timing_budget_default' in changed:
+                self.distance_sensor.set_timing_budget(values.timing_budget_default)
+            if 'adaptive_timing' in changed:
+                self.distance_sensor.set_adaptive_timing(values.adaptive_timing)
+        elif section == 'light' and self.light_sensor:
+            if 'default_gain' in changed:
+                self.light_sensor.set_gain(values.default_gain)
+            if 'default_integration_time' in changed:
+                self.light_sensor.set_integration_time(values.default_integration_time)
+            if 'auto_range' in changed:
+                self.light_sensor.set_auto_range(values.auto_range)
+        elif section == 'microphone' and self.microphone:
+            if 'default_gain' in changed:
+                self.microphone.set_gain(values.default_gain)
+        elif section == 'speaker' and self.speaker:
+            if 'default_volume' in changed:
+                self.speaker.set_volume(values.default_volume)
+        elif section == 'synthesis' and self.text_to_speech:
+            if 'default_rate' in changed:
+                self.text_to_speech.set_rate(values.default_rate)
+            if 'default_volume' in changed:
+                self.text_to_speech.set_volume(values.default_volume)
+    
+    def _build_emergency_stop(self) -> EmergencyStopWatcher:
+        """
+        <summary>Create the emergency stop watcher with a direct halt action per device</summary>
+        <returns>Emergency stop watcher (not started)</returns>
+        """
+        watcher = EmergencyStopWatcher(on_halt=self._on_emergency_halt, latency_tracker=self.latency)
+        watcher.add_halt_action('eyes', lambda: self.eyes and self.eyes.clear())
+        watcher.add_halt_action('speaker', lambda: self.speaker and self.speaker.stop_playback())
+        watcher.add_halt_action('text_to_speech', lambda: self.text_to_speech and self.text_to_speech.stop_speaking())
+        watcher.add_halt_action('microphone', lambda: self.microphone and self.microphone.stop_recording())
+        # Sensors only signal here; their bus work would wait behind a read in progress
+        watcher.add_halt_action('distance_sensor', lambda: self.distance_sensor and self.distance_sensor.halt())
+        watcher.add_halt_action('light_sensor', lambda: self.light_sensor and self.light_sensor.halt())
+        return watcher
+    
+    def _on_emergency_halt(self, source: str) -> None:
+        """
+        <summary>Stop robot operation after the emergency stop halted the hardware</summary>
+        <param name="source">What triggered the stop</param>
+        <returns>None</returns>
+        """
+        self.emergency_stop_triggered = True
+        self.state = ZoloConstants.STATE_SHUTDOWN
+        self.stop()
+    
+    def _components(self) -> Dict[str, Any]:
+        """
+        <summary>Get all hardware components by name</summary>
+        <returns>Dictionary mapping component name to component instance</returns>
+        """
+        components = {
+            'camera': self.camera,
+            'microphone': self.microphone,
+            'speech_recognizer': self.speech_recognizer,
+            'speaker': self.speaker,
+            'text_to_speech': self.text_to_speech,
+            'eyes': self.eyes,
+            'distance_sensor': self.distance_sensor,
+            'light_sensor': self.light_sensor
+        }
+        return {name: component for name, component in components.items() if component is not None}
+    
+    def _on_component_initialized(self, name: str, success: bool) -> None:
+        """
+        <summary>Attach a component that finished initializing in the background</summary>
+        <param name="name">Component name</param>
+        <param name="success">True if initialization succeeded</param>
+        <returns>None</returns>
         """
-        <summary>Main robot operation loop</summary>
+        if not success or self.runtime is None:
+            return
+        
+        if self._attach_sense(self.runtime, name):
+            self.logger.info(f"Component '{name}' ready, sense attached")
+    
+    def _on_component_restarted(self, name: str) -> None:
+        """
+        <summary>Replace the sense task of a component the supervisor restarted</summary>
+        <param name="name">Component name</param>
+        <returns>None</returns>
+        """
+        if self.runtime is not None:
+            self._attach_sense(self.runtime, name)
+    
+    def _register_senses(self, runtime: AsyncRuntime) -> None:
+        """
+        <summary>Register every available sense with the event-driven runtime</summary>
+        <param name="runtime">Runtime to register senses with</param>
         <returns>None</returns>
         """
-        # Check sensors
-        self._check_sensors()
+        for name in self._components():
+            self._attach_sense(runtime, name)
+    
+    def _attach_sense(self, runtime: AsyncRuntime, name: str) -> bool:
+        """
+        <summary>Register (or replace) a component's sense task and supervise the component</summary>
+        <param name="runtime">Runtime to register the sense with</param>
+        <param name="name">Component name</param>
+        <returns>True if the component has a sense, False otherwise</returns>
+        """
+        source = self._build_sense_source(name)
+        if source is None:
+            return False
         
-        # Listen for commands
-        self._listen_for_commands()
+        runtime.register_sense(source)
+        self.supervisor.watch(name, self._components()[name])
+        return True
+    
+    def _build_sense_source(self, component_name: str) -> Optional[SenseSource]:
+        """
+        <summary>Build the runtime sense source for an initialized component</summary>
+        <param name="component_name">Component name</param>
+        <returns>Sense source or None if the component has no sense or is not ready</returns>
+        """
+        component = self._components().get(component_name)
+        if not component or not getattr(component, 'is_initialized', False):
+            return None
         
-        # Update visual feedback
-        self._update_visual_feedback()
+        if component_name == 'distance_sensor':
+            return SenseSource(
+                RuntimeConstants.SENSE_DISTANCE,
+                # The continuous reader publishes every measurement the moment it completes
+                stream=component.stream,
+                reader=lambda sample: sample.value / 10.0 if sample.value is not None else None,
+                component=component_name,
+                handler=self._handle_distance,
+                # Only react when an object crosses into / out of the close range
+                change_key=lambda d: bool(d and d < DistanceConstants.CLOSE_THRESHOLD_CM)
+            )
+        
+        if component_name == 'light_sensor':
+            return SenseSource(
+                RuntimeConstants.SENSE_LIGHT,
+                reader=component.get_light_level,
+                component=component_name,
+                handler=self._handle_light_level,
+                # Auto-ranging changes the window; no new counts exist before it ends
+                min_interval=lambda: LightConstants.INTEGRATION_WINDOW_MS[component.integration_time] / 1000,
+                change_key=lambda level: level
+            )
+        
+        if component_name == 'speech_recognizer':
+            return SenseSource(
+                RuntimeConstants.SENSE_WAKE_WORD,
+                reader=lambda: component.recognize_wake_word("zolo"),
+                component=component_name,
+                handler=self._handle_wake_word,
+                min_interval=RuntimeConstants.WAKE_WORD_MIN_INTERVAL
+            )
+        
+        return None
+    
+    def _main_loop(self) -> None:
+        """
+        <summary>Run a single synchronous pass over all senses (polling adapter)</summary>
+        <returns>None</returns>
+        """
+        self.latency.begin_tick()
+        try:
+            # Check sensors
+            with self.latency.stage("check_sensors"):
+                self._check_sensors()
+            
+            # Listen for commands
+            with self.latency.stage("listen_for_commands"):
+                self._listen_for_commands()
+            
+            # Update visual feedback
+            with self.latency.stage("update_visual_feedback"):
+                self._update_visual_feedback()
+        finally:
+            self._tick_seconds.observe(self.latency.end_tick())
+    
+    def _on_tick_overrun(self, tick_name: str, seconds: float) -> None:
+        """
+        <summary>Report a tick or reaction that exceeded the tick budget</summary>
+        <param name="tick_name">Tick name</param>
+        <param name="seconds">Tick duration in seconds</param>
+        <returns>None</returns>
+        """
+        metrics.counter("zolo_tick_overruns_total", "Ticks and reactions over the tick budget", tick=tick_name).inc()
+        self.logger.warning(
+            f"{tick_name} took {seconds * 1000:.1f}ms (budget {self.latency.tick_budget * 1000:.0f}ms)"
+        )
     
     def _check_sensors(self) -> None:
         """
@@ -176,28 +465,45 @@ class ZoloRobot:
         """
         # Check distance sensor
         if self.distance_sensor:
-            distance = self.distance_sensor.get_distance_cm()
-            if distance and distance < 10:
-                self.logger.info(f"Object detected at {distance:.1f}cm")
-                
-                # React to close object
-                if self.eyes:
-                    self.eyes.set_color((255, 255, 0))  # Yellow for attention
-                
-                if self.text_to_speech:
-                    self.text_to_speech.speak("I see something close to me!")
+            self._handle_distance(self.distance_sensor.get_distance_cm())
         
         # Check light sensor
         if self.light_sensor:
-            light_level = self.light_sensor.get_light_level()
-            if light_level == "dark":
-                # Adjust behavior for dark conditions
-                if self.eyes:
-                    self.eyes.set_brightness(0.2)  # Dim in dark
-            elif light_level == "bright":
-                # Adjust behavior for bright conditions
-                if self.eyes:
-                    self.eyes.set_brightness(0.8)  # Bright in daylight
+            self._handle_light_level(self.light_sensor.get_light_level())
+    
+    def _handle_distance(self, distance: Optional[float]) -> None:
+        """
+        <summary>React to a new distance reading</summary>
+        <param name="distance">Distance in cm or None if unavailable</param>
+        <returns>None</returns>
+        """
+        if distance and distance < DistanceConstants.CLOSE_THRESHOLD_CM:
+            self.logger.info(f"Object detected at {distance:.1f}cm")
+            
+            # React to close object
+            if self.eyes:
+                self.eyes.set_color((255, 255, 0))  # Yellow for attention
+            
+            # Look at it - the camera only captures when something happens
+            self._capture_frame()
+            
+            if self.text_to_speech:
+                self.text_to_speech.speak("I see something close to me!")
+    
+    def _handle_light_level(self, light_level: str) -> None:
+        """
+        <summary>React to a new ambient light level</summary>
+        <param name="light_level">Qualitative light level</param>
+        <returns>None</returns>
+        """
+        if light_level == "dark":
+            # Adjust behavior for dark conditions
+            if self.eyes:
+                self.eyes.set_brightness(0.2)  # Dim in dark
+        elif light_level == "bright":
+            # Adjust behavior for bright conditions
+            if self.eyes:
+                self.eyes.set_brightness(0.8)  # Bright in daylight
     
     def _listen_for_commands(self) -> None:
         """
@@ -209,19 +515,42 @@ class ZoloRobot:
         
         # Check for wake word
         if self.speech_recognizer.recognize_wake_word("zolo"):
-            self.logger.info("Wake word detected")
-            
-            if self.eyes:
-                self.eyes.show_status('listening')
-            
-            if self.text_to_speech:
-                self.text_to_speech.speak("Yes, I'm listening!")
-            
-            # Listen for command
-            command = self.speech_recognizer.listen_for_command(timeout=5.0)
-            if command:
-                self.logger.info(f"Received command: {command}")
-                self._process_command(command)
+            self._handle_wake_word(True)
+    
+    def _handle_wake_word(self, detected: bool) -> None:
+        """
+        <summary>Listen for a command after the wake word and respond</summary>
+        <param name="detected">True if the wake word was detected</param>
+        <returns>None</returns>
+        """
+        if not detected or not self.speech_recognizer:
+            return
+        
+        self.logger.info("Wake word detected")
+        
+        if self.eyes:
+            self.eyes.show_status('listening')
+        
+        if self.text_to_speech:
+            self.text_to_speech.speak("Yes, I'm listening!")
+        
+        # Listen for command
+        command = self.speech_recognizer.listen_for_command(timeout=5.0)
+        if command:
+            self.logger.info(f"Received command: {command}")
+            self._process_command(command)
+    
+    def _capture_frame(self):
+        """
+        <summary>Capture a frame on demand and keep it as the most recent one for commands and the GUI</summary>
+        <returns>Captured image array or None if unavailable</returns>
+        """
+        if not self.camera:
+            return None
+        frame = self.camera.capture_image()
+        if frame is not None:
+            self.latest_frame = frame
+        return frame
     
     def _process_command(self, command: str) -> None:
         """
@@ -229,49 +558,11 @@ class ZoloRobot:
         <param name="command">Voice command text</param>
         <returns>None</returns>
         """
-        command = command.lower()
+        intent = self.intent_matcher.match(command)
+        handler = self._intent_handlers.get(intent)
         
-        if "hello" in command or "hi" in command:
-            response = "Hello! Nice to meet you!"
-        elif "lights on" in command:
-            if self.eyes:
-                self.eyes.set_color((255, 255, 255))
-            response = "Lights are on!"
-        elif "lights off" in command:
-            if self.eyes:
-                self.eyes.clear()
-            response = "Lights are off!"
-        elif "rainbow" in command:
-            if self.eyes:
-                self.eyes.rainbow_cycle()
-            response = "Showing rainbow colors!"
-        elif "take photo" in command or "capture" in command:
-            if self.camera:
-                image = self.camera.capture_image()
-                if image is not None:
-                    response = "Photo captured successfully!"
-                else:
-                    response = "Sorry, I couldn't take a photo."
-            else:
-                response = "Camera is not available."
-        elif "distance" in command:
-            if self.distance_sensor:
-                distance = self.distance_sensor.get_distance_cm()
-                if distance:
-                    response = f"I detect an object at {distance:.1f} centimeters."
-                else:
-                    response = "I don't see any objects nearby."
-            else:
-                response = "Distance sensor is not available."
-        elif "brightness" in command or "light level" in command:
-            if self.light_sensor:
-                level = self.light_sensor.get_light_level()
-                response = f"The current light level is {level}."
-            else:
-                response = "Light sensor is not available."
-        elif "shutdown" in command or "goodbye" in command:
-            response = "Goodbye! Shutting down now."
-            self.is_running = False
+        if handler:
+            response = handler()
         else:
             response = "I didn't understand that command. Can you try again?"
         
@@ -283,12 +574,80 @@ class ZoloRobot:
         if self.eyes:
             self.eyes.show_status('ready')
     
+    def _build_intent_handlers(self) -> Dict[str, Callable[[], str]]:
+        """
+        <summary>Map command intents to handlers returning the spoken response</summary>
+        <returns>Dictionary mapping intent name to handler</returns>
+        """
+        return {
+            RecognitionConstants.INTENT_GREETING: self._on_greeting,
+            RecognitionConstants.INTENT_LIGHTS_ON: self._on_lights_on,
+            RecognitionConstants.INTENT_LIGHTS_OFF: self._on_lights_off,
+            RecognitionConstants.INTENT_RAINBOW: self._on_rainbow,
+            RecognitionConstants.INTENT_TAKE_PHOTO: self._on_take_photo,
+            RecognitionConstants.INTENT_DISTANCE: self._on_distance,
+            RecognitionConstants.INTENT_LIGHT_LEVEL: self._on_light_level,
+            RecognitionConstants.INTENT_SHUTDOWN: self._on_shutdown,
+        }
+    
+    def _on_greeting(self) -> str:
+        """Respond to a greeting"""
+        return "Hello! Nice to meet you!"
+    
+    def _on_lights_on(self) -> str:
+        """Turn the eyes on"""
+        if self.eyes:
+            self.eyes.set_color((255, 255, 255))
+        return "Lights are on!"
+    
+    def _on_lights_off(self) -> str:
+        """Turn the eyes off"""
+        if self.eyes:
+            self.eyes.clear()
+        return "Lights are off!"
+    
+    def _on_rainbow(self) -> str:
+        """Show rainbow animation"""
+        if self.eyes:
+            self.eyes.rainbow_cycle()
+        return "Showing rainbow colors!"
+    
+    def _on_take_photo(self) -> str:
+        """Capture a photo"""
+        if not self.camera:
+            return "Camera is not available."
+        image = self._capture_frame()
+        if image is not None:
+            return "Photo captured successfully!"
+        return "Sorry, I couldn't take a photo."
+    
+    def _on_distance(self) -> str:
+        """Report distance to the nearest object"""
+        if not self.distance_sensor:
+            return "Distance sensor is not available."
+        distance = self.distance_sensor.get_distance_cm()
+        if distance:
+            return f"I detect an object at {distance:.1f} centimeters."
+        return "I don't see any objects nearby."
+    
+    def _on_light_level(self) -> str:
+        """Report ambient light level"""
+        if not self.light_sensor:
+            return "Light sensor is not available."
+        level = self.light_sensor.get_light_level()
+        return f"The current light level is {level}."
+    
+    def _on_shutdown(self) -> str:
+        """Shut the robot down"""
+        self.stop()
+        return "Goodbye! Shutting down now."
+    
     def _update_visual_feedback(self) -> None:
         """
         <summary>Update visual feedback based on robot state</summary>
         <returns>None</returns>
         """
-        if not self.eyes:
+        if not self.eyes or self.emergency_stop_triggered:
             return
         
         if self.state == ZoloConstants.STATE_READY:
@@ -304,6 +663,14 @@ class ZoloRobot:
             # Red warning
             self.eyes.set_color((255, 0, 0))
     
+    def get_sensor_history(self, window: float = ZoloConstants.SENSOR_HISTORY_DEFAULT_WINDOW) -> Dict[str, Any]:
+        """
+        <summary>Get recent history of every sensor channel (SENSOR_ALL payload)</summary>
+        <param name="window">Seconds of history per channel</param>
+        <returns>Dictionary keyed by channel name with timestamps, values and the latest sample</returns>
+        """
+        return self.history.snapshot(window)
+    
     def _signal_handler(self, signum: int, frame) -> None:
         """
         <summary>Handle system signals for graceful shutdown</summary>
@@ -312,53 +679,66 @@ class ZoloRobot:
         <returns>None</returns>
         """
         self.logger.info(f"Received signal {signum}, shutting down...")
-        self.is_running = False
+        self.stop()
     
     def emergency_stop(self) -> None:
         """
         <summary>Emergency stop function to halt all operations</summary>
         <returns>None</returns>
         """
-        self.logger.critical("EMERGENCY STOP ACTIVATED")
-        self.emergency_stop_triggered = True
-        self.is_running = False
-        
-        # Stop all hardware operations
-        HardwareUtils.emergency_stop()
-        
-        # Turn off all LEDs
-        if self.eyes:
-            self.eyes.clear()
-        
-        # Stop all audio
-        if self.speaker:
-            self.speaker.stop_playback()
+        if self.estop is None:
+            self.estop = self._build_emergency_stop()
         
-        if self.text_to_speech:
-            self.text_to_speech.stop_speaking()
+        # Halts LEDs, audio and sensors, then stops the runtime
+        self.estop.trigger("software")
     
     def cleanup(self) -> None:
         """
-        <summary>Clean up all robot resources</summary>
+        <summary>Clean up all robot resources (runs once, later calls return immediately)</summary>
         <returns>None</returns>
         """
+        with self._cleanup_lock:
+            if self._cleaned_up:
+                return
+            self._cleaned_up = True
+        atexit.unregister(self.cleanup)
+        
         self.logger.info("Cleaning up robot resources...")
+        started = time.monotonic()
+        self.state = ZoloConstants.STATE_SHUTDOWN
+        self.stop()
+        
+        if self.estop:
+            self.estop.stop()
+        
+        self.config.stop()
+        self.history.close()
+        self.supervisor.stop()
+        for name, entry in self.supervisor.get_report().items():
+            if entry['restarts'] or entry['failed_restarts']:
+                self.logger.info(
+                    f"Component '{name}' supervision: {entry['restarts']} restarts, "
+                    f"{entry['failed_restarts']} failed, {entry['downtime']:.1f}s downtime"
+                )
+        
+        if self.latency.get_snapshot()['stages']:
+            self.logger.info(self.latency.format_snapshot())
+        
+        # Components shut down concurrently in dependency order, each
+        # against its own deadline, within SHUTDOWN_TIMEOUT overall
+        components = {
+            name: component for name, component in self._components().items()
+            if hasattr(component, 'cleanup')
+        }
+        report = ComponentShutdown().run(components)
+        for name, entry in report.items():
+            message = f"Component '{name}' shutdown: {entry['state']} ({entry['duration']:.3f}s)"
+            if entry['error']:
+                self.logger.warning(f"{message} - {entry['error']}")
+            else:
+                self.logger.info(message)
         
-        # Cleanup all components
-        components = [
-            self.camera, self.microphone, self.speech_recognizer,
-            self.speaker, self.text_to_speech, self.eyes,
-            self.distance_sensor, self.light_sensor
-        ]
-        
-        for component in components:
-            if component and hasattr(component, 'cleanup'):
-                try:
-                    component.cleanup()
-                except Exception as e:
-                    self.logger.error(f"Error during cleanup: {e}")
-        
-        self.logger.info("Robot cleanup completed")
+        self.logger.info(f"Robot cleanup completed in {time.monotonic() - started:.2f}s")
 
 
 def main() -> None:
@@ -15,6 +15,16 @@ class ZoloConstants:
     INITIALIZATION_TIMEOUT: float = 10.0
     SHUTDOWN_TIMEOUT: float = 30.0
     
+    # Retry backoff and circuit breakers
+    RETRY_BASE_DELAY: float = 0.1             # Backoff bound before the first retry (seconds)
+    RETRY_MAX_DELAY: float = 1.0              # Backoff cap (seconds)
+    CIRCUIT_FAILURE_THRESHOLD: int = 3        # Consecutive failed calls before failing fast
+    CIRCUIT_RESET_TIMEOUT: float = 5.0        # Delay before the first background probe (seconds)
+    CIRCUIT_PROBE_MAX_INTERVAL: float = 60.0  # Probe backoff cap (seconds)
+    CIRCUIT_CLOSED: str = "closed"
+    CIRCUIT_OPEN: str = "open"
+    CIRCUIT_HALF_OPEN: str = "half_open"
+    
     # System states
     STATE_IDLE: str = "idle"
     STATE_INITIALIZING: str = "initializing"
@@ -25,6 +35,19 @@ class ZoloConstants:
     STATE_ERROR: str = "error"
     STATE_SHUTDOWN: str = "shutdown"
     
+    # Logging pipeline
+    LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    LOG_QUEUE_SIZE: int = 10000        # Records buffered for the background writer
+    LOG_DROP_THRESHOLD_INFO: float = 0.8      # Queue fill ratio above which DEBUG/INFO are dropped
+    LOG_DROP_THRESHOLD_WARNING: float = 0.95  # ... and WARNING; ERROR/CRITICAL only when full
+    LOG_BATCH_SIZE: int = 256          # Records written per flush
+    LOG_FLUSH_INTERVAL: float = 0.5    # Writer idle wake-up (seconds)
+    LOG_FLUSH_TIMEOUT: float = 2.0     # Max wait for an explicit flush / shutdown drain (seconds)
+    LOG_MAX_BYTES: int = 5 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 3
+    LOG_BUFFER_SIZE: int = 2000        # Recent records kept in memory for queries/streaming
+    LOG_SUBSCRIBER_QUEUE_SIZE: int = 500  # Pending records per streaming subscriber
+    
     # Log levels
     LOG_LEVEL_DEBUG: str = "DEBUG"
     LOG_LEVEL_INFO: str = "INFO"
@@ -35,10 +58,56 @@ class ZoloConstants:
     
     # File paths
     LOG_FILE_PATH: str = "/var/log/zolo/zolo.log"
+    LOG_FALLBACK_FILE_PATH: str = "zolo.log"  # Used when LOG_FILE_PATH is not writable
     CONFIG_FILE_PATH: str = "/etc/zolo/config.yaml"
     CACHE_DIR: str = "/var/cache/zolo"
+    CACHE_FALLBACK_DIR: str = "~/.cache/zolo"  # Used when CACHE_DIR is not writable
+    CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # Least recently used entries are evicted beyond this
+    CALIBRATION_FILE_PATH: str = "/etc/zolo/sensor_calibration.json"  # Written by config/sensor_calibration.py
     
     # Performance settings
     MAX_THREADS: int = 4
     MAX_QUEUE_SIZE: int = 100
-    WATCHDOG_TIMEOUT: float = 60.0
\ No newline at end of file
+    WATCHDOG_TIMEOUT: float = 60.0
+    
+    # Hardware backends
+    BACKEND_ENV_VAR: str = "ZOLO_BACKEND"
+    BACKEND_HARDWARE: str = "hardware"    # Real device libraries only
+    BACKEND_SIMULATED: str = "simulated"  # Simulated devices only
+    BACKEND_AUTO: str = "auto"            # Real devices, simulated where a library is missing
+    DEFAULT_BACKEND: str = BACKEND_HARDWARE
+    
+    # Latency instrumentation
+    TICK_BUDGET: float = 0.1  # seconds per main loop tick / event reaction
+    LATENCY_WINDOW_SIZE: int = 1024  # samples kept per stage
+    
+    # Metrics
+    METRICS_LATENCY_BUCKETS: tuple = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    METRICS_SPEECH_BUCKETS: tuple = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+    
+    # Configuration file (CONFIG_FILE_PATH)
+    CONFIG_POLL_INTERVAL: float = 2.0     # mtime polling period without inotify (seconds)
+    CONFIG_RELOAD_DEBOUNCE: float = 0.2   # Quiet time before a changed file is reloaded (seconds)
+    
+    # Sensor sample streaming
+    SENSOR_STREAM_QUEUE_SIZE: int = 256   # Pending samples per async stream consumer
+    
+    # Shared I2C bus (transaction priorities: lower runs first)
+    I2C_PRIORITY_RANGING: int = 0
+    I2C_PRIORITY_DEFAULT: int = 5
+    I2C_PRIORITY_LUX: int = 10
+    I2C_BUS_TIMEOUT: float = 1.0          # Max wait for the bus before a transaction fails (seconds)
+    I2C_UTILIZATION_WINDOW: float = 5.0   # Window of the reported bus utilization (seconds)
+    
+    # Sensor history (numpy ring buffers per channel)
+    SENSOR_HISTORY_RAW_SECONDS: float = 600.0        # Raw samples kept (seconds at the channel rate)
+    SENSOR_HISTORY_SECONDS_KEPT: int = 24 * 60 * 60  # 1 s aggregates kept (one day)
+    SENSOR_HISTORY_MINUTES_KEPT: int = 7 * 24 * 60   # 1 min aggregates kept (one week)
+    SENSOR_HISTORY_DEFAULT_WINDOW: float = 300.0     # Range of a query without start (seconds)
+    SENSOR_HISTORY_MAX_POINTS: int = 1000            # Points per chart query
+    
+    # Sensor calibration (corrections fitted to reference/measured pairs)
+    CALIBRATION_LEAST_SQUARES: str = "least_squares"  # Polynomial, smooth, needs few points
+    CALIBRATION_PIECEWISE: str = "piecewise"          # Straight lines between points, follows any shape
+    CALIBRATION_DEGREE: int = 1                       # Least-squares polynomial degree (1 = gain and offset)
+    CALIBRATION_TABLE_SIZE: int = 4096                # Lookup entries across the sensor range
\ No newline at end of file
@@ -1,22 +1,132 @@
 """
 <summary>
-Abstract base class for all sensor interfaces in the Zolo robot system
+Abstract base class for all sensor interfaces in the Zolo robot system,
+with timestamped samples that are pushed to callbacks and async streams
 </summary>
 <hardware>Generic sensor interface for all hardware components</hardware>
-<dependencies>abc</dependencies>
+<dependencies>abc, asyncio</dependencies>
 """
 
+import asyncio
+import itertools
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..constants.global_constants import ZoloConstants
+
+
+class SensorSample:
+    """
+    <summary>
+    One timestamped sensor reading. Timestamps come from time.monotonic(), so
+    samples of different sensors can be lined up; sequence numbers are per
+    sensor and reveal samples a consumer missed.
+    </summary>
+    """
+
+    __slots__ = ('sequence', 'timestamp', 'value', 'status')
+
+    def __init__(self, sequence: int, timestamp: float, value: Any, status: int) -> None:
+        """
+        <summary>Create sample</summary>
+        <param name="sequence">Per-sensor sequence number (starts at 1)</param>
+        <param name="timestamp">Acquisition time (time.monotonic() seconds)</param>
+        <param name="value">Reading, None if the read failed</param>
+        <param name="status">Sensor status code (STATUS_OK on success)</param>
+        <returns>None</returns>
+        """
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.value = value
+        self.status = status
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        <summary>Convert to a JSON-serializable dictionary</summary>
+        <returns>Dictionary representation</returns>
+        """
+        return {
+            'sequence': self.sequence,
+            'timestamp': self.timestamp,
+            'value': self.value,
+            'status': self.status
+        }
+
+    def __repr__(self) -> str:
+        return f"SensorSample(sequence={self.sequence}, timestamp={self.timestamp:.6f}, value={self.value!r}, status={self.status})"
+
+
+class SensorStream:
+    """
+    <summary>
+    Async iterator over a sensor's new samples. A slow consumer loses its
+    oldest pending samples (visible as sequence gaps) instead of slowing
+    the sensor.
+    </summary>
+    """
+
+    def __init__(self, sensor: 'SensorInterface', capacity: int = ZoloConstants.SENSOR_STREAM_QUEUE_SIZE) -> None:
+        """
+        <summary>Create stream bound to the running event loop</summary>
+        <param name="sensor">Sensor to stream from</param>
+        <param name="capacity">Pending samples kept for a slow consumer</param>
+        <returns>None</returns>
+        """
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=capacity)
+        self.dropped = 0
+        self._sensor = sensor
+        self._token = sensor.subscribe(self._deliver)
+
+    def _deliver(self, sample: SensorSample) -> None:
+        """Called on the thread that read the sensor"""
+        try:
+            self.loop.call_soon_threadsafe(self._enqueue, sample)
+        except RuntimeError:
+            # Event loop closed
+            self.close()
+
+    def _enqueue(self, sample: SensorSample) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(sample)
+
+    def close(self) -> None:
+        """Stop receiving samples"""
+        self._sensor.unsubscribe(self._token)
+
+    def __aiter__(self) -> 'SensorStream':
+        return self
+
+    async def __anext__(self) -> SensorSample:
+        return await self.queue.get()
 
 
 class SensorInterface(ABC):
     """
     <summary>
-    Abstract base class that defines the common interface for all sensors
+    Abstract base class that defines the common interface for all sensors.
+    Drivers publish() every reading they take; consumers either subscribe a
+    callback, iterate stream() or read the latest cached sample, which never
+    touches the bus.
     </summary>
     """
     
+    def __init__(self) -> None:
+        """
+        <summary>Initialize sample publishing state (call from subclasses)</summary>
+        <returns>None</returns>
+        """
+        self._latest_sample: Optional[SensorSample] = None
+        self._sequence = itertools.count(1)
+        # Copy-on-write so publish() iterates without taking the lock
+        self._subscribers: Tuple[Tuple[int, Callable[[SensorSample], None]], ...] = ()
+        self._subscriber_ids = itertools.count(1)
+        self._subscriber_lock = threading.Lock()
+    
     @abstractmethod
     def initialize(self) -> bool:
         """
@@ -25,13 +135,78 @@ class SensorInterface(ABC):
         """
         pass
     
-    @abstractmethod
     def get_reading(self) -> Optional[Any]:
         """
-        <summary>Get the current sensor reading</summary>
-        <returns>Sensor reading or None if failed</returns>
+        <summary>Get the latest sensor reading from the sample cache (no bus transaction)</summary>
+        <returns>Sensor reading or None if nothing was read yet or the last read failed</returns>
         """
-        pass
+        sample = self._latest_sample
+        return sample.value if sample else None
+    
+    def get_sample(self) -> Optional[SensorSample]:
+        """
+        <summary>Get the latest sample (value with timestamp, sequence number and status)</summary>
+        <returns>Latest sample or None if nothing was read yet</returns>
+        """
+        return self._latest_sample
+    
+    def publish(self, value: Any, status: int = 0, timestamp: Optional[float] = None) -> SensorSample:
+        """
+        <summary>Record a new reading as the latest sample and push it to subscribers</summary>
+        <param name="value">Reading, None if the read failed</param>
+        <param name="status">Sensor status code (0 is STATUS_OK for every sensor)</param>
+        <param name="timestamp">Acquisition time (time.monotonic()), now if omitted</param>
+        <returns>Published sample</returns>
+        """
+        sample = SensorSample(next(self._sequence), time.monotonic() if timestamp is None else timestamp, value, status)
+        self._latest_sample = sample
+        for _, callback in self._subscribers:
+            try:
+                callback(sample)
+            except Exception:
+                # A failing consumer must not break the sensor read
+                pass
+        return sample
+    
+    def subscribe(self, callback: Callable[[SensorSample], None]) -> int:
+        """
+        <summary>Call callback with every new sample (on the thread that read the sensor; keep it short)</summary>
+        <param name="callback">Callable receiving a SensorSample</param>
+        <returns>Subscription token for unsubscribe()</returns>
+        """
+        with self._subscriber_lock:
+            token = next(self._subscriber_ids)
+            self._subscribers = self._subscribers + ((token, callback),)
+        return token
+    
+    def unsubscribe(self, token: int) -> None:
+        """
+        <summary>Remove a subscription</summary>
+        <param name="token">Token returned by subscribe()</param>
+        <returns>None</returns>
+        """
+        with self._subscriber_lock:
+            self._subscribers = tuple(entry for entry in self._subscribers if entry[0] != token)
+    
+    def stream(self, capacity: int = ZoloConstants.SENSOR_STREAM_QUEUE_SIZE) -> SensorStream:
+        """
+        <summary>Open an async iterator over new samples (call from a running event loop; close() when done)</summary>
+        <param name="capacity">Pending samples kept for a slow consumer</param>
+        <returns>Sensor stream</returns>
+        """
+        return SensorStream(self, capacity)
+    
+    def get_stream_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get sample publishing state for get_status()</summary>
+        <returns>Dictionary with the latest sample, its age and the subscriber count</returns>
+        """
+        sample = self._latest_sample
+        return {
+            'latest_sample': sample.to_dict() if sample else None,
+            'sample_age': time.monotonic() - sample.timestamp if sample else None,
+            'subscribers': len(self._subscribers)
+        }
     
     @abstractmethod
     def is_ready(self) -> bool:
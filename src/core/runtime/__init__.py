@@ -0,0 +1,10 @@
+"""Event-driven asyncio runtime for Zolo robot"""
+
+from .async_runtime import AsyncRuntime, SenseSource
+from .component_initializer import ComponentInitializer
+from .component_shutdown import ComponentShutdown
+from .component_supervisor import ComponentSupervisor
+from .emergency_stop import EmergencyStopWatcher
+from .constants import RuntimeConstants
+
+__all__ = ['AsyncRuntime', 'SenseSource', 'ComponentInitializer', 'ComponentShutdown', 'ComponentSupervisor', 'EmergencyStopWatcher', 'RuntimeConstants']
@@ -0,0 +1,306 @@
+"""
+<summary>
+Event-driven asyncio runtime that runs each sense as its own task and
+dispatches reactions as soon as new data arrives
+</summary>
+<hardware>Generic runtime for all sensor components</hardware>
+<dependencies>asyncio, concurrent.futures, time</dependencies>
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..constants.global_constants import ZoloConstants
+from ..interfaces.sensor_interface import SensorStream
+from ..utils.latency_tracker import LatencyTracker
+from ..utils.logger import ZoloLogger
+from ..utils.metrics import Histogram, metrics
+from .component_supervisor import ComponentSupervisor
+from .constants import RuntimeConstants
+
+
+class SenseSource:
+    """
+    <summary>
+    Describes a single sense: how to read it (polled, or fed by the
+    component's sample stream), how fast it can produce data and which
+    handler reacts to new data
+    </summary>
+    """
+
+    __slots__ = ('name', 'reader', 'handler', 'min_interval', 'change_key', 'component', 'stream', '_last_key')
+
+    def __init__(self, name: str, reader: Callable[..., Any], handler: Callable[[Any], None],
+                 min_interval: Union[float, Callable[[], float]] = 0.0,
+                 change_key: Optional[Callable[[Any], Any]] = None, component: Optional[str] = None,
+                 stream: Optional[Callable[[], SensorStream]] = None) -> None:
+        """
+        <summary>Create sense source description</summary>
+        <param name="name">Sense name (e.g., 'distance')</param>
+        <param name="reader">Blocking callable returning the latest sense value (with stream: maps a sample to the value)</param>
+        <param name="handler">Blocking callable reacting to a published value</param>
+        <param name="min_interval">Minimum seconds between two polled reads, or a callable returning it before each read</param>
+        <param name="change_key">Optional key function; when given, values are only published when the key changes</param>
+        <param name="component">Optional name of the component behind the sense; each completed read is its heartbeat</param>
+        <param name="stream">Optional callable opening the component's sample stream; when given the sense waits for published samples instead of polling</param>
+        <returns>None</returns>
+        """
+        self.name = name
+        self.reader = reader
+        self.handler = handler
+        self.min_interval = min_interval
+        self.change_key = change_key
+        self.component = component
+        self.stream = stream
+        self._last_key = None
+
+    def should_publish(self, value: Any) -> bool:
+        """
+        <summary>Decide whether a freshly read value is an event worth dispatching</summary>
+        <param name="value">Value returned by the reader</param>
+        <returns>True if the value should be dispatched, False otherwise</returns>
+        """
+        if self.change_key is None:
+            return value is not None and value is not False
+
+        key = self.change_key(value)
+        if key == self._last_key:
+            return False
+        self._last_key = key
+        return True
+
+    def get_min_interval(self) -> float:
+        """
+        <summary>Get the current minimum seconds between two reads</summary>
+        <returns>Seconds</returns>
+        """
+        if callable(self.min_interval):
+            return self.min_interval()
+        return self.min_interval
+
+
+class AsyncRuntime:
+    """
+    <summary>
+    Runs every registered sense as an asyncio task. Blocking driver calls are
+    offloaded to a small thread pool so the event loop sleeps while nothing happens.
+    </summary>
+    """
+
+    def __init__(self, after_event: Optional[Callable[[], None]] = None,
+                 latency_tracker: Optional[LatencyTracker] = None,
+                 supervisor: Optional[ComponentSupervisor] = None) -> None:
+        """
+        <summary>Initialize runtime</summary>
+        <param name="after_event">Optional blocking callable run after each dispatched event</param>
+        <param name="latency_tracker">Optional tracker for read and reaction latency</param>
+        <param name="supervisor">Optional supervisor receiving a heartbeat per completed read</param>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("AsyncRuntime")
+        self.after_event = after_event
+        self.latency_tracker = latency_tracker
+        self.supervisor = supervisor
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.events_dispatched = 0
+        self._sources: Dict[str, SenseSource] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._stop_requested = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._reaction_seconds: Dict[str, Histogram] = {}
+        self._events_total = metrics.counter("zolo_runtime_events_total", "Events dispatched by the runtime")
+        metrics.gauge("zolo_runtime_queue_depth", "Events waiting for dispatch").set_function(
+            lambda: self._queue.qsize() if self._queue is not None else 0
+        )
+
+    def register_sense(self, source: SenseSource) -> None:
+        """
+        <summary>Register a sense to be run as its own task</summary>
+        <param name="source">Sense source description</param>
+        <returns>None</returns>
+        """
+        self._sources[source.name] = source
+        self._reaction_seconds[source.name] = metrics.histogram(
+            "zolo_event_reaction_seconds", "Handler and visual feedback time per event", sense=source.name
+        )
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._start_source, source)
+
+    def is_running(self) -> bool:
+        """
+        <summary>Check if runtime event loop is running</summary>
+        <returns>True if running, False otherwise</returns>
+        """
+        return self.loop is not None and not self._stop_requested
+
+    def request_stop(self) -> None:
+        """
+        <summary>Request runtime shutdown (safe to call from any thread or signal handler)</summary>
+        <returns>None</returns>
+        """
+        self._stop_requested = True
+        if self.loop is not None and self._stop_event is not None:
+            try:
+                self.loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+
+    def run(self) -> None:
+        """
+        <summary>Synchronous adapter - run the runtime until stop is requested</summary>
+        <returns>None</returns>
+        """
+        asyncio.run(self.run_async())
+
+    async def run_async(self) -> None:
+        """
+        <summary>Run all sense tasks and the event dispatcher until stop is requested</summary>
+        <returns>None</returns>
+        """
+        self.loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=ZoloConstants.MAX_QUEUE_SIZE)
+        self._stop_event = asyncio.Event()
+        # At least one worker per sense plus one for the dispatcher, so a
+        # blocking reaction never starves the readers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(ZoloConstants.MAX_THREADS, len(self._sources) + 1),
+            thread_name_prefix="zolo-runtime"
+        )
+
+        if self._stop_requested:
+            self._stop_event.set()
+
+        for source in self._sources.values():
+            self._start_source(source)
+        dispatcher = asyncio.create_task(self._dispatch(), name="zolo-dispatcher")
+
+        self.logger.info(f"Runtime started with senses: {list(self._sources)}")
+        try:
+            await self._stop_event.wait()
+        finally:
+            tasks = list(self._tasks.values()) + [dispatcher]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tasks.clear()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self.loop = None
+            self.logger.info(f"Runtime stopped after {self.events_dispatched} events")
+
+    def _start_source(self, source: SenseSource) -> None:
+        """
+        <summary>Create the task for a sense source (must run on the event loop)</summary>
+        <param name="source">Sense source description</param>
+        <returns>None</returns>
+        """
+        previous = self._tasks.get(source.name)
+        if previous and not previous.done():
+            previous.cancel()
+        run = self._follow_stream if source.stream is not None else self._run_source
+        self._tasks[source.name] = asyncio.create_task(run(source), name=f"zolo-sense-{source.name}")
+
+    async def _run_source(self, source: SenseSource) -> None:
+        """
+        <summary>Read a sense at its natural rate and publish new data as events</summary>
+        <param name="source">Sense source description</param>
+        <returns>None</returns>
+        """
+        loop = self.loop
+        read_seconds = metrics.histogram("zolo_sense_read_seconds", "Sense read time including queueing",
+                                         sense=source.name)
+        read_errors = metrics.counter("zolo_sense_read_errors_total", "Sense reads that raised", sense=source.name)
+        while True:
+            started = loop.time()
+            try:
+                value = await loop.run_in_executor(self._executor, source.reader)
+            except Exception as e:
+                read_errors.inc()
+                self.logger.error(f"Sense '{source.name}' read failed: {e}")
+                await asyncio.sleep(RuntimeConstants.SENSE_ERROR_BACKOFF)
+                continue
+            
+            elapsed = loop.time() - started
+            read_seconds.observe(elapsed)
+            if self.supervisor:
+                self.supervisor.heartbeat(source.component)
+            if self.latency_tracker:
+                self.latency_tracker.record(f"read_{source.name}", elapsed)
+
+            if source.should_publish(value):
+                await self._queue.put((source, value))
+
+            # A blocking read already waited for new data; only pace fast returns
+            remaining = source.get_min_interval() - (loop.time() - started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+    async def _follow_stream(self, source: SenseSource) -> None:
+        """
+        <summary>Publish a sense's samples as events as soon as its component publishes them</summary>
+        <param name="source">Sense source description with a stream</param>
+        <returns>None</returns>
+        """
+        read_seconds = metrics.histogram("zolo_sense_read_seconds", "Sense read time including queueing",
+                                         sense=source.name)
+        stream = source.stream()
+        try:
+            async for sample in stream:
+                # Measurement end to delivery on the loop
+                elapsed = time.monotonic() - sample.timestamp
+                read_seconds.observe(elapsed)
+                # Every sample is new data: a stalled component simply stops sending them
+                if self.supervisor:
+                    self.supervisor.heartbeat(source.component)
+                if self.latency_tracker:
+                    self.latency_tracker.record(f"read_{source.name}", elapsed)
+
+                value = source.reader(sample)
+                if source.should_publish(value):
+                    await self._queue.put((source, value))
+        finally:
+            stream.close()
+
+    async def _dispatch(self) -> None:
+        """
+        <summary>Run handlers for published events one at a time, in arrival order</summary>
+        <returns>None</returns>
+        """
+        loop = self.loop
+        while True:
+            source, value = await self._queue.get()
+            try:
+                await loop.run_in_executor(self._executor, self._react, source, value)
+            except Exception as e:
+                self.logger.error(f"Handler for '{source.name}' failed: {e}")
+            self.events_dispatched += 1
+            self._events_total.inc()
+    
+    def _react(self, source: SenseSource, value: Any) -> None:
+        """
+        <summary>Run the reaction to one event on a worker thread, timed as one tick</summary>
+        <param name="source">Sense source that published the event</param>
+        <param name="value">Published value</param>
+        <returns>None</returns>
+        """
+        tracker = self.latency_tracker
+        if tracker is None:
+            with self._reaction_seconds[source.name].time():
+                source.handler(value)
+                if self.after_event:
+                    self.after_event()
+            return
+        
+        tracker.begin_tick()
+        try:
+            with tracker.stage(f"handle_{source.name}"):
+                source.handler(value)
+            if self.after_event:
+                with tracker.stage("update_visual_feedback"):
+                    self.after_event()
+        finally:
+            self._reaction_seconds[source.name].observe(tracker.end_tick(f"event_{source.name}"))
@@ -0,0 +1,166 @@
+"""
+<summary>
+Parallel, time-bounded component initialization with per-component timing report
+</summary>
+<hardware>Generic initializer for all hardware components</hardware>
+<dependencies>concurrent.futures, threading, time</dependencies>
+"""
+
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ..constants.global_constants import ZoloConstants
+from ..utils.logger import ZoloLogger
+from .constants import RuntimeConstants
+
+
+class ComponentInitializer:
+    """
+    <summary>
+    Starts every component's initialize() together, each on its own daemon
+    thread. Callers wait only for the components they need; the rest finish in
+    the background, and one that hangs past the timeout cannot keep the
+    process from exiting.
+    </summary>
+    """
+
+    def __init__(self, timeout: float = ZoloConstants.INITIALIZATION_TIMEOUT) -> None:
+        """
+        <summary>Initialize component initializer</summary>
+        <param name="timeout">Per-component initialization timeout in seconds</param>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("ComponentInitializer")
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        self._started_at: Dict[str, float] = {}
+        self._report: Dict[str, Dict[str, Any]] = {}
+        self._on_complete: Optional[Callable[[str, bool], None]] = None
+
+    def start(self, components: Dict[str, Any], on_complete: Optional[Callable[[str, bool], None]] = None) -> None:
+        """
+        <summary>Start initialize() of all components concurrently</summary>
+        <param name="components">Mapping of component name to component instance</param>
+        <param name="on_complete">Optional callback(name, success) run when a component finishes</param>
+        <returns>None</returns>
+        """
+        self._on_complete = on_complete
+        for name, component in components.items():
+            with self._lock:
+                self._started_at[name] = time.monotonic()
+                self._report[name] = {
+                    'state': RuntimeConstants.INIT_STATE_INITIALIZING,
+                    'duration': None,
+                    'error': None
+                }
+            future: Future = Future()
+            future.add_done_callback(lambda f, n=name: self._complete(n, f))
+            self._futures[name] = future
+            # Daemon: a pool worker stuck in initialize() would be joined at interpreter exit
+            threading.Thread(
+                target=self._run, args=(component, future), name=f"zolo-init-{name}", daemon=True
+            ).start()
+
+    def wait_for(self, names: Iterable[str]) -> bool:
+        """
+        <summary>Block until the given components finish or hit the initialization timeout</summary>
+        <param name="names">Component names to wait for</param>
+        <returns>True if all named components initialized successfully, False otherwise</returns>
+        """
+        success = True
+        for name in names:
+            future = self._futures.get(name)
+            if future is None:
+                continue
+
+            remaining = self.timeout - (time.monotonic() - self._started_at[name])
+            try:
+                result = future.result(timeout=max(0.0, remaining))
+                success = success and bool(result)
+            except FutureTimeoutError:
+                success = False
+                self._mark_timed_out(name)
+            except Exception:
+                success = False
+        return success
+
+    def is_ready(self, name: str) -> bool:
+        """
+        <summary>Check if a component finished initializing successfully</summary>
+        <param name="name">Component name</param>
+        <returns>True if ready, False otherwise</returns>
+        """
+        with self._lock:
+            entry = self._report.get(name)
+            return bool(entry) and entry['state'] == RuntimeConstants.INIT_STATE_READY
+
+    def get_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Get per-component initialization state and duration</summary>
+        <returns>Dictionary mapping component name to state, duration (s) and error</returns>
+        """
+        now = time.monotonic()
+        for name in list(self._futures):
+            if now - self._started_at[name] >= self.timeout:
+                self._mark_timed_out(name)
+
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._report.items()}
+
+    def _run(self, component: Any, future: Future) -> None:
+        """
+        <summary>Worker thread: run one component's initialize() and settle its future</summary>
+        <param name="component">Component instance</param>
+        <param name="future">Future receiving the result</param>
+        <returns>None</returns>
+        """
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(component.initialize())
+        except Exception as e:
+            future.set_exception(e)
+
+    def _mark_timed_out(self, name: str) -> None:
+        """
+        <summary>Flag a still-running component as timed out</summary>
+        <param name="name">Component name</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            entry = self._report[name]
+            if entry['state'] != RuntimeConstants.INIT_STATE_INITIALIZING:
+                return
+            entry['state'] = RuntimeConstants.INIT_STATE_TIMED_OUT
+            entry['duration'] = time.monotonic() - self._started_at[name]
+        self.logger.warning(f"Component '{name}' exceeded {self.timeout:.1f}s initialization timeout")
+
+    def _complete(self, name: str, future: Future) -> None:
+        """
+        <summary>Record the outcome of a component's initialize() call</summary>
+        <param name="name">Component name</param>
+        <param name="future">Finished future</param>
+        <returns>None</returns>
+        """
+        duration = time.monotonic() - self._started_at[name]
+        error = future.exception()
+        success = error is None and bool(future.result())
+
+        with self._lock:
+            entry = self._report[name]
+            late = entry['state'] == RuntimeConstants.INIT_STATE_TIMED_OUT
+            entry['state'] = RuntimeConstants.INIT_STATE_READY if success else RuntimeConstants.INIT_STATE_FAILED
+            entry['duration'] = duration
+            entry['error'] = str(error) if error else None
+
+        if late:
+            self.logger.info(f"Component '{name}' finished after timeout in {duration:.2f}s (success={success})")
+
+        if self._on_complete:
+            try:
+                self._on_complete(name, success)
+            except Exception as e:
+                self.logger.error(f"Initialization callback for '{name}' failed: {e}")
@@ -0,0 +1,144 @@
+"""
+<summary>
+Parallel, deadline-bounded component shutdown in dependency order
+</summary>
+<hardware>Generic shutdown for all hardware components</hardware>
+<dependencies>threading, time</dependencies>
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..constants.global_constants import ZoloConstants
+from ..utils.logger import ZoloLogger
+from .constants import RuntimeConstants
+
+
+class ComponentShutdown:
+    """
+    <summary>
+    Runs every component's cleanup() in dependency stages. Components in a
+    stage are cleaned up concurrently on daemon threads, each against its own
+    deadline; a component that misses it is forced off and left behind so the
+    process can still exit.
+    </summary>
+    """
+
+    def __init__(self, timeout: float = ZoloConstants.SHUTDOWN_TIMEOUT,
+                 component_timeout: float = RuntimeConstants.SHUTDOWN_COMPONENT_TIMEOUT,
+                 order: Optional[List[List[str]]] = None) -> None:
+        """
+        <summary>Initialize component shutdown</summary>
+        <param name="timeout">Overall shutdown budget in seconds</param>
+        <param name="component_timeout">Per-component cleanup deadline in seconds</param>
+        <param name="order">Stages of component names; earlier stages are shut down first</param>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("ComponentShutdown")
+        self.timeout = timeout
+        self.component_timeout = component_timeout
+        self.order = order if order is not None else RuntimeConstants.SHUTDOWN_ORDER
+        self._lock = threading.Lock()
+        self._report: Dict[str, Dict[str, Any]] = {}
+
+    def run(self, components: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Clean up all components and wait at most the overall shutdown budget</summary>
+        <param name="components">Mapping of component name to component instance</param>
+        <returns>Dictionary mapping component name to state, duration (s) and error</returns>
+        """
+        deadline = time.monotonic() + self.timeout
+        for stage in self._stages(components):
+            self._run_stage(stage, components, deadline)
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._report.items()}
+
+    def _stages(self, components: Dict[str, Any]) -> List[List[str]]:
+        """
+        <summary>Group components into shutdown stages; unlisted components go last</summary>
+        <param name="components">Mapping of component name to component instance</param>
+        <returns>List of stages of component names</returns>
+        """
+        listed = {name for stage in self.order for name in stage}
+        stages = [[name for name in stage if name in components] for stage in self.order]
+        stages.append([name for name in components if name not in listed])
+        return [stage for stage in stages if stage]
+
+    def _run_stage(self, names: List[str], components: Dict[str, Any], deadline: float) -> None:
+        """
+        <summary>Clean up one stage concurrently and force off anything that misses its deadline</summary>
+        <param name="names">Component names in this stage</param>
+        <param name="components">Mapping of component name to component instance</param>
+        <param name="deadline">Overall shutdown deadline (monotonic time)</param>
+        <returns>None</returns>
+        """
+        workers = {}
+        for name in names:
+            started = time.monotonic()
+            with self._lock:
+                self._report[name] = {
+                    'state': RuntimeConstants.SHUTDOWN_STATE_RUNNING,
+                    'duration': None,
+                    'error': None
+                }
+            # Daemon threads: a hung driver call must never keep the process alive
+            worker = threading.Thread(
+                target=self._cleanup, args=(name, components[name], started),
+                name=f"zolo-shutdown-{name}", daemon=True
+            )
+            worker.start()
+            workers[name] = (worker, started, min(started + self.component_timeout, deadline))
+
+        for name, (worker, started, component_deadline) in workers.items():
+            worker.join(max(0.0, component_deadline - time.monotonic()))
+            if worker.is_alive():
+                self._force(name, components[name], time.monotonic() - started)
+
+    def _cleanup(self, name: str, component: Any, started: float) -> None:
+        """
+        <summary>Worker: run a component's cleanup() and record the outcome</summary>
+        <param name="name">Component name</param>
+        <param name="component">Component instance</param>
+        <param name="started">Monotonic start time</param>
+        <returns>None</returns>
+        """
+        error = None
+        try:
+            component.cleanup()
+        except Exception as e:
+            error = e
+        duration = time.monotonic() - started
+
+        with self._lock:
+            entry = self._report[name]
+            forced = entry['state'] == RuntimeConstants.SHUTDOWN_STATE_FORCED
+            if not forced:
+                entry['state'] = RuntimeConstants.SHUTDOWN_STATE_DONE if error is None else RuntimeConstants.SHUTDOWN_STATE_FAILED
+                entry['duration'] = duration
+                entry['error'] = str(error) if error else None
+
+        if forced:
+            self.logger.info(f"Component '{name}' finished cleanup after being forced off ({duration:.2f}s)")
+
+    def _force(self, name: str, component: Any, waited: float) -> None:
+        """
+        <summary>Fallback for a component that missed its deadline: mark it unusable and move on</summary>
+        <param name="name">Component name</param>
+        <param name="component">Component instance</param>
+        <param name="waited">Seconds spent waiting for cleanup()</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            entry = self._report[name]
+            if entry['state'] != RuntimeConstants.SHUTDOWN_STATE_RUNNING:
+                return
+            entry['state'] = RuntimeConstants.SHUTDOWN_STATE_FORCED
+            entry['duration'] = waited
+            entry['error'] = "cleanup deadline exceeded"
+
+        self.logger.warning(f"Component '{name}' did not clean up within {waited:.1f}s, forcing shutdown")
+        try:
+            component.is_initialized = False
+        except Exception:
+            pass
@@ -0,0 +1,275 @@
+"""
+<summary>
+Heartbeat-based component supervisor that restarts a stalled controller in place
+</summary>
+<hardware>Generic supervisor for all hardware components</hardware>
+<dependencies>threading, time</dependencies>
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ..constants.global_constants import ZoloConstants
+from ..utils.hardware_utils import HardwareUtils
+from ..utils.logger import ZoloLogger
+from ..utils.metrics import Sample, metrics
+from .constants import RuntimeConstants
+
+
+class _Supervised:
+    """Supervision state of one component"""
+
+    __slots__ = ('name', 'component', 'timeout', 'last_heartbeat', 'state', 'watchdog',
+                 'restarts', 'failed_restarts', 'consecutive_failures', 'down_since',
+                 'downtime', 'last_restart')
+
+    def __init__(self, name: str, component: Any, timeout: float) -> None:
+        self.name = name
+        self.component = component
+        self.timeout = timeout
+        self.last_heartbeat = time.monotonic()
+        self.state = RuntimeConstants.SUPERVISOR_STATE_HEALTHY
+        self.watchdog: Optional[threading.Timer] = None
+        self.restarts = 0
+        self.failed_restarts = 0
+        self.consecutive_failures = 0
+        self.down_since: Optional[float] = None
+        self.downtime = 0.0
+        self.last_restart: Optional[float] = None
+
+
+class ComponentSupervisor:
+    """
+    <summary>
+    Tracks a heartbeat per component. A watchdog per component checks the
+    heartbeat age; a component that stays silent past its timeout is cleaned
+    up and re-initialized on its own, with exponential backoff between attempts.
+    </summary>
+    """
+
+    def __init__(self, on_restart: Optional[Callable[[str], None]] = None,
+                 timeout: float = ZoloConstants.WATCHDOG_TIMEOUT) -> None:
+        """
+        <summary>Initialize component supervisor</summary>
+        <param name="on_restart">Optional callback(name) run after a component restarted successfully</param>
+        <param name="timeout">Default heartbeat timeout in seconds</param>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("ComponentSupervisor")
+        self.on_restart = on_restart
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._components: Dict[str, _Supervised] = {}
+        self._running = False
+        self._metrics_token: Optional[int] = None
+
+    def watch(self, name: str, component: Any, timeout: Optional[float] = None) -> None:
+        """
+        <summary>Start supervising a component (heartbeat clock starts now)</summary>
+        <param name="name">Component name</param>
+        <param name="component">Component with initialize() and cleanup()</param>
+        <param name="timeout">Heartbeat timeout in seconds, defaults to the supervisor timeout</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            previous = self._components.get(name)
+            if previous and previous.watchdog:
+                previous.watchdog.cancel()
+            entry = _Supervised(name, component, timeout or self.timeout)
+            if previous:
+                # Keep history when a component is re-attached
+                entry.restarts = previous.restarts
+                entry.failed_restarts = previous.failed_restarts
+                entry.downtime = previous.downtime
+                entry.last_restart = previous.last_restart
+            self._components[name] = entry
+            if self._running:
+                self._arm(entry, entry.timeout)
+
+    def heartbeat(self, name: Optional[str]) -> None:
+        """
+        <summary>Record that a component just did useful work (cheap, call on every read)</summary>
+        <param name="name">Component name</param>
+        <returns>None</returns>
+        """
+        entry = self._components.get(name)
+        if entry is not None:
+            entry.last_heartbeat = time.monotonic()
+
+    def start(self) -> None:
+        """
+        <summary>Arm the watchdogs of all supervised components</summary>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._running = True
+            for entry in self._components.values():
+                entry.last_heartbeat = time.monotonic()
+                self._arm(entry, entry.timeout)
+            if self._metrics_token is None:
+                self._metrics_token = metrics.register_collector(self._collect_metrics)
+
+    def stop(self) -> None:
+        """
+        <summary>Disarm all watchdogs</summary>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._running = False
+            for entry in self._components.values():
+                if entry.watchdog:
+                    entry.watchdog.cancel()
+                    entry.watchdog = None
+            if self._metrics_token is not None:
+                metrics.unregister_collector(self._metrics_token)
+                self._metrics_token = None
+
+    def get_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Get restart counters and downtime per component</summary>
+        <returns>Dictionary mapping component name to supervision metrics (times in seconds)</returns>
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {
+                    'state': entry.state,
+                    'heartbeat_age': now - entry.last_heartbeat,
+                    'restarts': entry.restarts,
+                    'failed_restarts': entry.failed_restarts,
+                    'downtime': entry.downtime + (now - entry.down_since if entry.down_since else 0.0),
+                    'last_restart': entry.last_restart
+                }
+                for name, entry in self._components.items()
+            }
+
+    def _collect_metrics(self) -> Iterable[Sample]:
+        """Export the supervision report"""
+        for name, entry in self.get_report().items():
+            labels = {'component': name}
+            healthy = entry['state'] == RuntimeConstants.SUPERVISOR_STATE_HEALTHY
+            yield ("zolo_component_healthy", 'gauge', "1 while the component sends heartbeats", labels, int(healthy))
+            yield ("zolo_component_heartbeat_age_seconds", 'gauge', "Time since the last heartbeat",
+                   labels, entry['heartbeat_age'])
+            yield ("zolo_component_restarts_total", 'counter', "Successful in-place restarts",
+                   labels, entry['restarts'])
+            yield ("zolo_component_failed_restarts_total", 'counter', "Failed restart attempts",
+                   labels, entry['failed_restarts'])
+            yield ("zolo_component_downtime_seconds_total", 'counter', "Time spent stalled or restarting",
+                   labels, entry['downtime'])
+
+    def _arm(self, entry: _Supervised, delay: float) -> None:
+        """
+        <summary>(Re)arm a component's watchdog (caller holds the lock)</summary>
+        <param name="entry">Supervision state</param>
+        <param name="delay">Seconds until the watchdog fires</param>
+        <returns>None</returns>
+        """
+        watchdog = HardwareUtils.create_watchdog(delay, lambda: self._check(entry))
+        watchdog.daemon = True
+        watchdog.name = f"zolo-watchdog-{entry.name}"
+        entry.watchdog = watchdog
+        watchdog.start()
+
+    def _check(self, entry: _Supervised) -> None:
+        """
+        <summary>Watchdog: re-arm while heartbeats are fresh, restart the component otherwise</summary>
+        <param name="entry">Supervision state</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            if not self._running or self._components.get(entry.name) is not entry:
+                return
+            if entry.state == RuntimeConstants.SUPERVISOR_STATE_HEALTHY:
+                age = time.monotonic() - entry.last_heartbeat
+                if age < entry.timeout:
+                    # One timer per timeout period, not one per heartbeat
+                    self._arm(entry, entry.timeout - age)
+                    return
+                entry.state = RuntimeConstants.SUPERVISOR_STATE_STALLED
+                entry.down_since = entry.last_heartbeat
+                self.logger.warning(f"Component '{entry.name}' stalled (no heartbeat for {age:.1f}s), restarting")
+
+        self._restart(entry)
+
+    def _restart(self, entry: _Supervised) -> None:
+        """
+        <summary>Clean up and re-initialize one component in place</summary>
+        <param name="entry">Supervision state</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            entry.state = RuntimeConstants.SUPERVISOR_STATE_RESTARTING
+            entry.last_restart = time.time()
+
+        success = self._cleanup(entry) and self._initialize(entry)
+
+        with self._lock:
+            if not self._running or self._components.get(entry.name) is not entry:
+                return
+            now = time.monotonic()
+            if success:
+                entry.restarts += 1
+                entry.consecutive_failures = 0
+                entry.downtime += now - entry.down_since
+                entry.down_since = None
+                entry.last_heartbeat = now
+                entry.state = RuntimeConstants.SUPERVISOR_STATE_HEALTHY
+                self._arm(entry, entry.timeout)
+            else:
+                entry.failed_restarts += 1
+                entry.consecutive_failures += 1
+                entry.state = RuntimeConstants.SUPERVISOR_STATE_STALLED
+                backoff = min(
+                    RuntimeConstants.RESTART_BACKOFF_BASE * 2 ** (entry.consecutive_failures - 1),
+                    RuntimeConstants.RESTART_BACKOFF_MAX
+                )
+                self._arm(entry, backoff)
+
+        if success:
+            self.logger.info(f"Component '{entry.name}' restarted (restart #{entry.restarts})")
+            if self.on_restart:
+                try:
+                    self.on_restart(entry.name)
+                except Exception as e:
+                    self.logger.error(f"Restart callback for '{entry.name}' failed: {e}")
+        else:
+            self.logger.error(f"Restart of '{entry.name}' failed, retrying in {backoff:.1f}s")
+
+    def _cleanup(self, entry: _Supervised) -> bool:
+        """
+        <summary>Release the stalled component, bounded by the component shutdown deadline</summary>
+        <param name="entry">Supervision state</param>
+        <returns>True if the component can be re-initialized, False otherwise</returns>
+        """
+        # cleanup() may block on the same stuck bus; run it on a daemon thread
+        worker = threading.Thread(target=self._call, args=(entry, 'cleanup'),
+                                  name=f"zolo-restart-{entry.name}", daemon=True)
+        worker.start()
+        worker.join(RuntimeConstants.SHUTDOWN_COMPONENT_TIMEOUT)
+        if worker.is_alive():
+            self.logger.warning(f"Cleanup of '{entry.name}' still blocked, re-initializing anyway")
+        entry.component.is_initialized = False
+        return True
+
+    def _initialize(self, entry: _Supervised) -> bool:
+        """
+        <summary>Re-initialize the component</summary>
+        <param name="entry">Supervision state</param>
+        <returns>True if successful, False otherwise</returns>
+        """
+        return bool(self._call(entry, 'initialize'))
+
+    def _call(self, entry: _Supervised, method: str) -> Any:
+        """
+        <summary>Call a component lifecycle method, logging instead of raising</summary>
+        <param name="entry">Supervision state</param>
+        <param name="method">Method name ('cleanup' or 'initialize')</param>
+        <returns>Method result or None on error</returns>
+        """
+        try:
+            return getattr(entry.component, method)()
+        except Exception as e:
+            self.logger.error(f"{method}() of '{entry.name}' failed: {e}")
+            return None
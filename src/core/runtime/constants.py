@@ -0,0 +1,56 @@
+"""Event-driven runtime constants"""
+
+
+class RuntimeConstants:
+    """Asyncio runtime configuration constants"""
+    
+    # Sense names
+    SENSE_DISTANCE: str = "distance"
+    SENSE_LIGHT: str = "light"
+    SENSE_WAKE_WORD: str = "wake_word"
+    
+    # Minimum interval between reads (seconds) for senses without a hardware
+    # timing budget - a sense never reads faster than it can produce new data
+    WAKE_WORD_MIN_INTERVAL: float = 1.0    # Wake word listen window
+    
+    # Component initialization
+    INIT_STATE_INITIALIZING: str = "initializing"
+    INIT_STATE_READY: str = "ready"
+    INIT_STATE_FAILED: str = "failed"
+    INIT_STATE_TIMED_OUT: str = "timed_out"
+    
+    # Components the robot waits for before reporting ready; all others
+    # finish initializing in the background
+    CRITICAL_COMPONENTS: list = ['eyes', 'text_to_speech', 'distance_sensor']
+    
+    # Error handling
+    SENSE_ERROR_BACKOFF: float = 1.0
+    
+    # Emergency stop watcher
+    ESTOP_BOUNCE_MS: int = 50            # Button debounce
+    ESTOP_WAIT_TIMEOUT_MS: int = 500     # Edge wait slice, bounds watcher shutdown time
+    ESTOP_HALT_BOUND: float = 0.05       # Trigger-to-halt latency budget (seconds)
+    ESTOP_THREAD_PRIORITY: int = 80      # SCHED_FIFO priority when permitted
+    ESTOP_THREAD_NICE: int = -10         # Fallback niceness when real-time is not permitted
+    
+    # Component supervision (heartbeat timeout: ZoloConstants.WATCHDOG_TIMEOUT)
+    SUPERVISOR_STATE_HEALTHY: str = "healthy"
+    SUPERVISOR_STATE_STALLED: str = "stalled"
+    SUPERVISOR_STATE_RESTARTING: str = "restarting"
+    RESTART_BACKOFF_BASE: float = 1.0    # First retry delay after a failed restart (seconds)
+    RESTART_BACKOFF_MAX: float = 60.0    # Backoff cap (seconds)
+    
+    # Component shutdown
+    SHUTDOWN_COMPONENT_TIMEOUT: float = 5.0   # Per-component cleanup deadline (seconds)
+    SHUTDOWN_STATE_RUNNING: str = "running"
+    SHUTDOWN_STATE_DONE: str = "done"
+    SHUTDOWN_STATE_FAILED: str = "failed"
+    SHUTDOWN_STATE_FORCED: str = "forced"
+    
+    # Shutdown stages - users of a device go before the device, the shared
+    # I2C bus (owned by the light sensor) and the eyes go last
+    SHUTDOWN_ORDER: list = [
+        ['speech_recognizer', 'text_to_speech', 'camera'],
+        ['microphone', 'speaker', 'distance_sensor'],
+        ['light_sensor', 'eyes'],
+    ]
@@ -0,0 +1,218 @@
+"""
+<summary>
+Edge-triggered emergency stop watcher running on its own high-priority thread.
+Halts LEDs, audio and sensors directly, without waiting for the main loop.
+</summary>
+<hardware>Emergency stop button on GPIO 27 (active low, internal pull-up)</hardware>
+<dependencies>RPi.GPIO, threading, time</dependencies>
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.hardware_pins import HardwarePins
+from ..utils.latency_tracker import LatencyTracker
+from ..utils.lazy_import import lazy_import
+from ..utils.logger import ZoloLogger
+from .constants import RuntimeConstants
+
+GPIO = lazy_import("RPi.GPIO", simulated="src.simulation.gpio")
+
+# Watcher currently armed in this process (used by HardwareUtils.emergency_stop)
+_active_watcher: Optional['EmergencyStopWatcher'] = None
+
+
+def get_active_watcher() -> Optional['EmergencyStopWatcher']:
+    """
+    <summary>Get the emergency stop watcher armed in this process</summary>
+    <returns>Watcher or None if none is running</returns>
+    """
+    return _active_watcher
+
+
+class EmergencyStopWatcher:
+    """
+    <summary>
+    Waits for the emergency stop edge on a dedicated thread and runs the
+    registered halt actions there. Each activation records its trigger-to-halt latency.
+    </summary>
+    """
+
+    def __init__(self, pin: int = HardwarePins.EMERGENCY_STOP,
+                 on_halt: Optional[Callable[[str], None]] = None,
+                 latency_tracker: Optional[LatencyTracker] = None) -> None:
+        """
+        <summary>Initialize emergency stop watcher</summary>
+        <param name="pin">BCM GPIO pin of the emergency stop button</param>
+        <param name="on_halt">Optional callback(source) run after the hardware is halted</param>
+        <param name="latency_tracker">Optional tracker receiving 'emergency_stop' latency samples</param>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("EmergencyStop")
+        self.pin = pin
+        self.on_halt = on_halt
+        self.latency_tracker = latency_tracker
+        self.is_armed = False
+        self.triggered = threading.Event()
+        self._halt_actions: List[Tuple[str, Callable[[], Any]]] = []
+        self._activations: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def add_halt_action(self, name: str, action: Callable[[], Any]) -> None:
+        """
+        <summary>Register a direct hardware halt action (run in registration order)</summary>
+        <param name="name">Action name used in the activation report</param>
+        <param name="action">Callable halting one device; must not block (signal a driver that needs the bus)</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._halt_actions.append((name, action))
+
+    def start(self) -> bool:
+        """
+        <summary>Configure the GPIO input and start the watcher thread</summary>
+        <returns>True if the button is being watched, False if only software triggers work</returns>
+        """
+        global _active_watcher
+        _active_watcher = self
+
+        if not GPIO.is_available():
+            self.logger.warning(f"GPIO unavailable ({GPIO.get_error()}), emergency stop button not watched")
+            return False
+
+        try:
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        except Exception as e:
+            self.logger.error(f"Emergency stop GPIO setup failed: {e}")
+            return False
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="zolo-estop", daemon=True)
+        self._thread.start()
+        self.is_armed = True
+        self.logger.info(f"Emergency stop armed on GPIO {self.pin}")
+        return True
+
+    def stop(self) -> None:
+        """
+        <summary>Stop watching the button</summary>
+        <returns>None</returns>
+        """
+        global _active_watcher
+        self._stop.set()
+        if self._thread:
+            self._thread.join(RuntimeConstants.ESTOP_WAIT_TIMEOUT_MS / 1000.0 * 2)
+            self._thread = None
+        if self.is_armed:
+            try:
+                GPIO.cleanup(self.pin)
+            except Exception as e:
+                self.logger.error(f"Emergency stop GPIO cleanup failed: {e}")
+        self.is_armed = False
+        if _active_watcher is self:
+            _active_watcher = None
+
+    def trigger(self, source: str = "software", triggered_at: Optional[float] = None) -> float:
+        """
+        <summary>Halt all registered devices now, on the calling thread</summary>
+        <param name="source">What triggered the stop (e.g., 'gpio', 'software')</param>
+        <param name="triggered_at">perf_counter() timestamp of the trigger, defaults to now</param>
+        <returns>Trigger-to-halt latency in seconds</returns>
+        """
+        if triggered_at is None:
+            triggered_at = time.perf_counter()
+        self.triggered.set()
+
+        with self._lock:
+            actions = list(self._halt_actions)
+
+        errors = {}
+        durations = {}
+        for name, action in actions:
+            started = time.perf_counter()
+            try:
+                action()
+            except Exception as e:
+                errors[name] = str(e)
+            durations[name] = time.perf_counter() - started
+
+        halted_at = time.perf_counter()
+        latency = halted_at - triggered_at
+        activation = {
+            'source': source,
+            'triggered_at': triggered_at,
+            'halted_at': halted_at,
+            'latency': latency,
+            'actions': durations,
+            'errors': errors
+        }
+        with self._lock:
+            self._activations.append(activation)
+        if self.latency_tracker:
+            self.latency_tracker.record("emergency_stop", latency, latency > RuntimeConstants.ESTOP_HALT_BOUND)
+
+        self.logger.critical(f"EMERGENCY STOP ({source}): hardware halted in {latency * 1000:.2f}ms")
+        for name, error in errors.items():
+            self.logger.error(f"Emergency stop action '{name}' failed: {error}")
+
+        if self.on_halt:
+            try:
+                self.on_halt(source)
+            except Exception as e:
+                self.logger.error(f"Emergency stop callback failed: {e}")
+        return latency
+
+    def get_activations(self) -> List[Dict[str, Any]]:
+        """
+        <summary>Get every activation with its trigger-to-halt latency</summary>
+        <returns>List of activation records (times in seconds)</returns>
+        """
+        with self._lock:
+            return [dict(entry) for entry in self._activations]
+
+    def _watch(self) -> None:
+        """
+        <summary>Watcher thread: block on the falling edge and halt on each press</summary>
+        <returns>None</returns>
+        """
+        self._raise_priority()
+        while not self._stop.is_set():
+            try:
+                channel = GPIO.wait_for_edge(
+                    self.pin, GPIO.FALLING,
+                    bouncetime=RuntimeConstants.ESTOP_BOUNCE_MS,
+                    timeout=RuntimeConstants.ESTOP_WAIT_TIMEOUT_MS
+                )
+            except Exception as e:
+                self.logger.error(f"Emergency stop edge wait failed: {e}")
+                self._stop.wait(RuntimeConstants.SENSE_ERROR_BACKOFF)
+                continue
+
+            if channel is not None and not self._stop.is_set():
+                self.trigger("gpio")
+
+    def _raise_priority(self) -> None:
+        """
+        <summary>Give the watcher thread real-time (or at least raised) scheduling priority</summary>
+        <returns>None</returns>
+        """
+        thread_id = threading.get_native_id()
+        try:
+            os.sched_setscheduler(
+                thread_id, os.SCHED_FIFO, os.sched_param(RuntimeConstants.ESTOP_THREAD_PRIORITY)
+            )
+            return
+        except (AttributeError, OSError):
+            pass
+
+        try:
+            os.setpriority(os.PRIO_PROCESS, thread_id, RuntimeConstants.ESTOP_THREAD_NICE)
+        except (AttributeError, OSError):
+            # Unprivileged: the thread still never waits on the main loop
+            self.logger.debug("Could not raise emergency stop thread priority")
+
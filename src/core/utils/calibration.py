@@ -0,0 +1,224 @@
+"""
+<summary>
+Sensor calibration models: least-squares polynomial or piecewise-linear
+corrections fitted to reference/measured pairs, compiled into a lookup table
+so correcting a reading costs one interpolation
+</summary>
+<hardware>None - applied to VL53L0X and TSL2561 readings</hardware>
+<dependencies>numpy</dependencies>
+"""
+
+import math
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from ..constants.global_constants import ZoloConstants
+from .lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+
+class CalibrationModel:
+    """
+    <summary>
+    Maps a measured value to the corrected value. The fit is done once with
+    numpy; compile() evaluates it on an evenly spaced grid over the sensor
+    range (in log10 units for sensors with multiplicative errors such as lux),
+    and apply() interpolates that table with plain float arithmetic, so the
+    read path needs no numpy call. Values outside the range use the exact model.
+    </summary>
+    """
+
+    def __init__(self, method: str, parameters: Dict[str, list], domain: Tuple[float, float],
+                 log_scale: bool = False, stats: Optional[Dict[str, Any]] = None) -> None:
+        """
+        <summary>Create model from fitted parameters (see fit() and from_dict())</summary>
+        <param name="method">CALIBRATION_LEAST_SQUARES or CALIBRATION_PIECEWISE</param>
+        <param name="parameters">{'coefficients': [...]} or {'measured': [...], 'reference': [...]} knots</param>
+        <param name="domain">Range of measured values covered by the lookup table</param>
+        <param name="log_scale">Fit and tabulate in log10 units</param>
+        <param name="stats">Fit statistics</param>
+        <returns>None</returns>
+        """
+        if method not in (ZoloConstants.CALIBRATION_LEAST_SQUARES, ZoloConstants.CALIBRATION_PIECEWISE):
+            raise ValueError(f"Unknown calibration method: {method}")
+        self.method = method
+        self.parameters = parameters
+        self.domain = (float(domain[0]), float(domain[1]))
+        self.log_scale = log_scale
+        self.stats = stats or {}
+        self._table: Optional[list] = None
+        self._grid: Optional["np.ndarray"] = None
+        self._values: Optional["np.ndarray"] = None
+        self._start = 0.0
+        self._inverse_step = 0.0
+        self._last_index = 0
+
+    @classmethod
+    def fit(cls, pairs: Iterable[Sequence[float]], method: str, domain: Tuple[float, float],
+            degree: int = ZoloConstants.CALIBRATION_DEGREE, log_scale: bool = False) -> 'CalibrationModel':
+        """
+        <summary>Fit a correction to (reference, measured) pairs</summary>
+        <param name="pairs">Reference (true) and measured values</param>
+        <param name="method">CALIBRATION_LEAST_SQUARES or CALIBRATION_PIECEWISE</param>
+        <param name="domain">Range of measured values covered by the lookup table</param>
+        <param name="degree">Polynomial degree for least squares</param>
+        <param name="log_scale">Fit in log10 units (multiplicative errors; drops non-positive pairs)</param>
+        <returns>Compiled model (raises ValueError with too few usable pairs)</returns>
+        """
+        data = np.asarray([(float(reference), float(measured)) for reference, measured in pairs], dtype=np.float64)
+        data = data.reshape(-1, 2)
+        if log_scale:
+            data = data[(data > 0).all(axis=1)]
+        reference, measured = data[:, 0], data[:, 1]
+        x = np.log10(measured) if log_scale else measured
+        y = np.log10(reference) if log_scale else reference
+
+        if method == ZoloConstants.CALIBRATION_LEAST_SQUARES:
+            distinct = len(np.unique(x))
+            if distinct <= degree:
+                raise ValueError(f"Least-squares degree {degree} needs {degree + 1} distinct points, got {distinct}")
+            parameters = {'coefficients': np.polyfit(x, y, degree).tolist()}
+        elif method == ZoloConstants.CALIBRATION_PIECEWISE:
+            # One knot per reference point: its repeated measurements averaged
+            values, inverse = np.unique(y, return_inverse=True)
+            knots = np.bincount(inverse, weights=x) / np.bincount(inverse)
+            order = np.argsort(knots)
+            knots, values = knots[order], values[order]
+            if len(knots) < 2 or np.any(np.diff(knots) <= 0):
+                raise ValueError("Piecewise calibration needs 2 reference points with distinct measurements")
+            parameters = {'measured': knots.tolist(), 'reference': values.tolist()}
+        else:
+            raise ValueError(f"Unknown calibration method: {method}")
+
+        model = cls(method, parameters, domain, log_scale)
+        corrected = model.evaluate(measured)
+        model.stats = {
+            'points': int(len(data)),
+            'rmse_before': float(np.sqrt(np.mean((measured - reference) ** 2))),
+            'rmse_after': float(np.sqrt(np.mean((corrected - reference) ** 2))),
+            'max_error_after': float(np.max(np.abs(corrected - reference))),
+            'fitted_at': time.time()
+        }
+        model.compile()
+        return model
+
+    def evaluate(self, values: "np.ndarray") -> "np.ndarray":
+        """
+        <summary>Exact model (no lookup table)</summary>
+        <param name="values">Measured values</param>
+        <returns>Corrected values</returns>
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = np.log10(np.maximum(values, 1e-12)) if self.log_scale else values
+        if self.method == ZoloConstants.CALIBRATION_LEAST_SQUARES:
+            y = np.polyval(self.parameters['coefficients'], x)
+        else:
+            knots = np.asarray(self.parameters['measured'])
+            knot_values = np.asarray(self.parameters['reference'])
+            y = np.interp(x, knots, knot_values)
+            # Extend the end segments instead of clamping
+            first_slope = (knot_values[1] - knot_values[0]) / (knots[1] - knots[0])
+            last_slope = (knot_values[-1] - knot_values[-2]) / (knots[-1] - knots[-2])
+            y = np.where(x < knots[0], knot_values[0] + (x - knots[0]) * first_slope, y)
+            y = np.where(x > knots[-1], knot_values[-1] + (x - knots[-1]) * last_slope, y)
+        return np.power(10.0, y) if self.log_scale else y
+
+    def compile(self, size: int = ZoloConstants.CALIBRATION_TABLE_SIZE) -> None:
+        """
+        <summary>Tabulate the model over the domain</summary>
+        <param name="size">Table entries</param>
+        <returns>None</returns>
+        """
+        low, high = self.domain
+        if self.log_scale:
+            low, high = math.log10(max(low, 1e-3)), math.log10(high)
+        grid = np.linspace(low, high, size)
+        values = self.evaluate(np.power(10.0, grid) if self.log_scale else grid)
+        self._grid = grid
+        self._values = values
+        # A list indexes faster than an array and yields plain floats
+        self._table = values.tolist()
+        self._start = low
+        self._inverse_step = (size - 1) / (high - low)
+        self._last_index = size - 1
+
+    def apply(self, value: float) -> float:
+        """
+        <summary>Correct one reading (read path: table interpolation)</summary>
+        <param name="value">Measured value</param>
+        <returns>Corrected value</returns>
+        """
+        if self.log_scale:
+            if value <= 0:
+                return value
+            position = (math.log10(value) - self._start) * self._inverse_step
+        else:
+            position = (value - self._start) * self._inverse_step
+        index = int(position)
+        if not 0 <= index < self._last_index or position < 0:
+            return float(self.evaluate(value))
+        table = self._table
+        low = table[index]
+        return low + (position - index) * (table[index + 1] - low)
+
+    def apply_array(self, values: "np.ndarray") -> "np.ndarray":
+        """
+        <summary>Correct many readings at once (e.g. a recorded trace)</summary>
+        <param name="values">Measured values</param>
+        <returns>Corrected values</returns>
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = np.log10(np.maximum(values, 1e-12)) if self.log_scale else values
+        inside = (x >= self._grid[0]) & (x <= self._grid[-1])
+        corrected = np.where(inside, np.interp(x, self._grid, self._values), 0.0)
+        if not inside.all():
+            corrected[~inside] = self.evaluate(values[~inside])
+        if self.log_scale:
+            corrected = np.where(values > 0, corrected, values)
+        return corrected
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        <summary>Convert to a JSON-serializable dictionary</summary>
+        <returns>Dictionary representation</returns>
+        """
+        return {
+            'method': self.method,
+            'parameters': self.parameters,
+            'domain': list(self.domain),
+            'log_scale': self.log_scale,
+            'stats': self.stats
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CalibrationModel':
+        """
+        <summary>Rebuild and compile a model saved with to_dict()</summary>
+        <param name="data">Dictionary representation</param>
+        <returns>Compiled model</returns>
+        """
+        model = cls(data['method'], data['parameters'], tuple(data['domain']),
+                    data.get('log_scale', False), data.get('stats'))
+        model.compile()
+        return model
+
+
+if __name__ == "__main__":
+    import timeit
+
+    # Fit a ranging error (gain, offset and a bend at short range) and time the read path
+    rng = np.random.default_rng(1)
+    reference = np.repeat(np.array([50.0, 100, 200, 300, 500, 800, 1200, 1600]), 5)
+    measured = reference * 1.04 + 18.0 + 25.0 * np.exp(-reference / 80.0) + rng.normal(0, 3, len(reference))
+    pairs = list(zip(reference, measured))
+    check = np.linspace(50.0, 1600.0, 500)
+    check_measured = check * 1.04 + 18.0 + 25.0 * np.exp(-check / 80.0)
+    for method in (ZoloConstants.CALIBRATION_LEAST_SQUARES, ZoloConstants.CALIBRATION_PIECEWISE):
+        model = CalibrationModel.fit(pairs, method, (30.0, 2000.0))
+        error = model.apply_array(check_measured) - check
+        per_call = min(timeit.repeat(lambda: model.apply(523.0), number=100000, repeat=3)) / 100000 * 1e9
+        print(f"{method:14s} rmse before {model.stats['rmse_before']:5.1f} mm, after {model.stats['rmse_after']:4.1f} mm "
+              f"(held-out {np.sqrt(np.mean(error ** 2)):4.1f} mm), apply {per_call:.0f} ns")
+    exact = min(timeit.repeat(lambda: model.evaluate(523.0), number=10000, repeat=3)) / 10000 * 1e9
+    print(f"exact numpy evaluation: {exact:.0f} ns per reading")
@@ -0,0 +1,366 @@
+"""
+<summary>
+Typed configuration loader for CONFIG_FILE_PATH. The YAML file is parsed once
+per change into an immutable snapshot, overlaid onto the registered *Constants
+classes, and changed keys are pushed to subscribers while the process runs.
+</summary>
+<hardware>Generic configuration for all system components</hardware>
+<dependencies>pyyaml, threading</dependencies>
+"""
+
+import threading
+import time
+import typing
+from collections import namedtuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from ..constants.global_constants import ZoloConstants
+from .file_watcher import FileWatcher
+from .lazy_import import lazy_import
+from .logger import ZoloLogger
+from .metrics import metrics
+
+yaml = lazy_import("yaml")
+
+
+class ConfigError(ValueError):
+    """Raised for a configuration file that cannot be parsed or fails validation"""
+
+
+class ConfigSnapshot:
+    """
+    <summary>
+    Immutable view of one configuration version. Each section is a named tuple
+    with one lowercase field per constant: snapshot.distance.close_threshold_cm
+    </summary>
+    """
+
+    __slots__ = ('version', 'source', 'loaded_at', '_sections')
+
+    def __init__(self, version: int, source: Optional[str], sections: Dict[str, tuple]) -> None:
+        """
+        <summary>Create snapshot</summary>
+        <param name="version">Monotonic version, incremented per applied change</param>
+        <param name="source">File the values came from, None for built-in defaults</param>
+        <param name="sections">Section name to named tuple of values</param>
+        <returns>None</returns>
+        """
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'loaded_at', time.time())
+        object.__setattr__(self, '_sections', MappingProxyType(dict(sections)))
+
+    def __getattr__(self, name: str) -> tuple:
+        try:
+            return self._sections[name]
+        except KeyError:
+            raise AttributeError(f"No configuration section '{name}'") from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    def sections(self) -> List[str]:
+        """
+        <summary>Get section names</summary>
+        <returns>List of section names</returns>
+        """
+        return list(self._sections)
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Convert to plain nested dictionaries</summary>
+        <returns>Dictionary of section dictionaries</returns>
+        """
+        return {name: section._asdict() for name, section in self._sections.items()}
+
+
+class _Section:
+    """Registered constants class and its built-in defaults"""
+
+    __slots__ = ('name', 'constants', 'defaults', 'types', 'record')
+
+    def __init__(self, name: str, constants: type) -> None:
+        self.name = name
+        self.constants = constants
+        self.defaults = {
+            key: value for key, value in vars(constants).items()
+            if key.isupper() and not key.startswith('_') and not callable(value)
+        }
+        annotations = getattr(constants, '__annotations__', {})
+        self.types = {
+            key: typing.get_origin(annotations.get(key)) or annotations.get(key) or type(value)
+            for key, value in self.defaults.items()
+        }
+        self.record = namedtuple(f"{constants.__name__}Config", [key.lower() for key in self.defaults])
+
+
+class ConfigLoader:
+    """
+    <summary>
+    Loads the configuration file, validates it against the declared types of
+    the registered constants classes and applies it atomically: either every
+    value of a new file is applied or none is. Values are written back onto the
+    constants classes, so code reading e.g. DistanceConstants.CLOSE_THRESHOLD_CM
+    at run time sees the new value; values captured earlier (default
+    arguments, opened devices) need a subscriber to apply them.
+    </summary>
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        <summary>Initialize loader (nothing is read until load())</summary>
+        <param name="path">Configuration file, defaults to ZoloConstants.CONFIG_FILE_PATH</param>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("ConfigLoader")
+        self.path = Path(path or ZoloConstants.CONFIG_FILE_PATH)
+        self._sections: Dict[str, _Section] = {}
+        self._snapshot = ConfigSnapshot(0, None, {})
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._subscribers: Dict[int, Tuple[str, Callable[[tuple, FrozenSet[str]], None]]] = {}
+        self._subscriber_ids = 0
+        self._lock = threading.RLock()
+        self._watcher: Optional[FileWatcher] = None
+        self._reloads_ok = metrics.counter("zolo_config_reloads_total", "Configuration loads", result="ok")
+        self._reloads_failed = metrics.counter("zolo_config_reloads_total", "Configuration loads", result="error")
+        metrics.gauge("zolo_config_version", "Applied configuration version").set_function(
+            lambda: self._snapshot.version
+        )
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Current configuration snapshot (replaced, never mutated, on reload)"""
+        return self._snapshot
+
+    def register_constants(self, section: str, constants: type) -> None:
+        """
+        <summary>Expose a constants class as a configuration section</summary>
+        <param name="section">Section name in the YAML file (e.g., 'distance')</param>
+        <param name="constants">Constants class whose UPPER_CASE attributes may be overridden</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            existing = self._sections.get(section.lower())
+            if existing is not None and existing.constants is constants:
+                return
+            self._sections[section.lower()] = _Section(section.lower(), constants)
+            self._signature = None  # Re-apply the file to the new section on next load
+
+    def subscribe(self, section: str, callback: Callable[[tuple, FrozenSet[str]], None]) -> int:
+        """
+        <summary>Call callback(section_values, changed_keys) whenever keys of a section change</summary>
+        <param name="section">Section name</param>
+        <param name="callback">Callable receiving the new section tuple and the changed lowercase keys</param>
+        <returns>Token for unsubscribe()</returns>
+        """
+        with self._lock:
+            self._subscriber_ids += 1
+            self._subscribers[self._subscriber_ids] = (section.lower(), callback)
+            return self._subscriber_ids
+
+    def unsubscribe(self, token: int) -> None:
+        """
+        <summary>Remove a subscription</summary>
+        <param name="token">Token returned by subscribe()</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def load(self) -> ConfigSnapshot:
+        """
+        <summary>Read and apply the file if it changed since the last load</summary>
+        <returns>Current snapshot (the previous one if the file is invalid)</returns>
+        """
+        with self._lock:
+            signature = self._file_signature()
+            if signature == self._signature and self._snapshot.version:
+                return self._snapshot
+
+            try:
+                overrides = self._read(signature)
+                values = self._validate(overrides)
+            except ConfigError as e:
+                self._reloads_failed.inc()
+                self.logger.error(f"Configuration {self.path} rejected, keeping version "
+                                  f"{self._snapshot.version}: {e}")
+                # Do not retry the same broken file on every event
+                self._signature = signature
+                return self._snapshot
+
+            previous = self._snapshot
+            changed = self._apply(values)
+            self._snapshot = ConfigSnapshot(
+                previous.version + 1,
+                str(self.path) if signature else None,
+                {name: section.record(**{key.lower(): _freeze(value) for key, value in values[name].items()})
+                 for name, section in self._sections.items()}
+            )
+            self._signature = signature
+            self._reloads_ok.inc()
+            subscribers = list(self._subscribers.values())
+            snapshot = self._snapshot
+
+        if previous.version:
+            summary = ", ".join(f"{name}.{key}" for name, keys in changed.items() for key in sorted(keys))
+            self.logger.info(f"Configuration version {snapshot.version} applied"
+                             + (f", changed: {summary}" if summary else " (no changes)"))
+        else:
+            source = snapshot.source or "built-in defaults"
+            self.logger.info(f"Configuration version {snapshot.version} loaded from {source}")
+
+        for section, callback in subscribers:
+            if section in changed:
+                try:
+                    callback(getattr(snapshot, section), frozenset(changed[section]))
+                except Exception as e:
+                    self.logger.error(f"Configuration subscriber for '{section}' failed: {e}")
+        return snapshot
+
+    def watch(self) -> str:
+        """
+        <summary>Load now and reload whenever the file changes</summary>
+        <returns>Watch backend ('inotify' or 'polling')</returns>
+        """
+        self.load()
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = FileWatcher(str(self.path), self.load)
+            backend = self._watcher.start()
+        self.logger.info(f"Watching {self.path} for changes ({backend})")
+        return backend
+
+    def stop(self) -> None:
+        """
+        <summary>Stop watching the file</summary>
+        <returns>None</returns>
+        """
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher:
+            watcher.stop()
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """File identity and version, None if missing"""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _read(self, signature: Optional[Tuple[int, int, int]]) -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Parse the file into lowercase section and key names</summary>
+        <param name="signature">File signature, None if the file is missing</param>
+        <returns>Overrides per section</returns>
+        """
+        if signature is None:
+            return {}
+        if not yaml.is_available():
+            raise ConfigError(f"pyyaml unavailable ({yaml.get_error()})")
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                document = yaml.safe_load(file)
+        except (OSError, yaml.YAMLError) as e:
+            raise ConfigError(f"cannot parse: {e}") from e
+
+        if document is None:
+            return {}
+        if not isinstance(document, dict):
+            raise ConfigError("top level must be a mapping of sections")
+
+        overrides: Dict[str, Dict[str, Any]] = {}
+        for section, entries in document.items():
+            if not isinstance(entries, dict):
+                raise ConfigError(f"section '{section}' must be a mapping")
+            overrides[str(section).lower()] = {str(key).upper(): value for key, value in entries.items()}
+        return overrides
+
+    def _validate(self, overrides: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Merge overrides with defaults and coerce them to the declared types</summary>
+        <param name="overrides">Overrides per section</param>
+        <returns>Complete values per registered section</returns>
+        """
+        errors: List[str] = []
+        for section in overrides.keys() - self._sections.keys():
+            self.logger.warning(f"Unknown configuration section '{section}' ignored")
+
+        values: Dict[str, Dict[str, Any]] = {}
+        for name, section in self._sections.items():
+            section_values = dict(section.defaults)
+            for key, value in overrides.get(name, {}).items():
+                if key not in section.defaults:
+                    self.logger.warning(f"Unknown configuration key '{name}.{key.lower()}' ignored")
+                    continue
+                try:
+                    section_values[key] = _coerce(value, section.types[key])
+                except (TypeError, ValueError) as e:
+                    errors.append(f"{name}.{key.lower()}: {e}")
+            values[name] = section_values
+
+        if errors:
+            raise ConfigError("; ".join(errors))
+        return values
+
+    def _apply(self, values: Dict[str, Dict[str, Any]]) -> Dict[str, set]:
+        """
+        <summary>Write values onto the constants classes (caller holds the lock)</summary>
+        <param name="values">Complete values per section</param>
+        <returns>Changed lowercase keys per section</returns>
+        """
+        changed: Dict[str, set] = {}
+        for name, section_values in values.items():
+            constants = self._sections[name].constants
+            for key, value in section_values.items():
+                if getattr(constants, key) != value:
+                    setattr(constants, key, value)
+                    changed.setdefault(name, set()).add(key.lower())
+        return changed
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a list or dict for the snapshot"""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    return value
+
+
+def _coerce(value: Any, expected: type) -> Any:
+    """
+    <summary>Convert a YAML value to the declared constant type</summary>
+    <param name="value">Parsed value</param>
+    <param name="expected">Declared type</param>
+    <returns>Converted value</returns>
+    """
+    if expected is bool:
+        if not isinstance(value, bool):
+            raise TypeError(f"expected true/false, got {value!r}")
+        return value
+    if expected is int:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or int(value) != value:
+            raise TypeError(f"expected an integer, got {value!r}")
+        return int(value)
+    if expected is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"expected a number, got {value!r}")
+        return float(value)
+    if expected is str:
+        if not isinstance(value, str):
+            raise TypeError(f"expected a string, got {value!r}")
+        return value
+    if expected in (tuple, list):
+        if not isinstance(value, (list, tuple)):
+            raise TypeError(f"expected a list, got {value!r}")
+        return expected(value)
+    if expected is dict:
+        if not isinstance(value, dict):
+            raise TypeError(f"expected a mapping, got {value!r}")
+        return dict(value)
+    if isinstance(expected, type) and not isinstance(value, expected):
+        raise TypeError(f"expected {expected.__name__}, got {value!r}")
+    return value
@@ -0,0 +1,329 @@
+"""
+<summary>
+Persistent content-addressed cache under CACHE_DIR with a size cap, LRU
+eviction, atomic writes and an optional memory-mapped read path
+</summary>
+<hardware>Generic - stores artifacts on the host filesystem (SD card)</hardware>
+<dependencies>hashlib, mmap, os, threading</dependencies>
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..constants.global_constants import ZoloConstants
+from .logger import ZoloLogger
+from .metrics import metrics
+
+_TEMP_DIR = "tmp"
+_LENGTH = struct.Struct('>Q')
+
+
+class DiskCache:
+    """
+    <summary>
+    Cache of byte strings and files keyed by a hash of the inputs that produced
+    them. Entries are sharded as <dir>/<key[:2]>/<key><suffix>; recency is the
+    file modification time, so the LRU order survives restarts. Every write goes
+    to a temporary file that is renamed into place, so readers never see a
+    partial entry, even after a power cut.
+    </summary>
+    """
+
+    def __init__(self, directory: str = ZoloConstants.CACHE_DIR,
+                 max_bytes: int = ZoloConstants.CACHE_MAX_BYTES) -> None:
+        """
+        <summary>Open the cache, falling back to CACHE_FALLBACK_DIR when directory is not writable</summary>
+        <param name="directory">Cache directory</param>
+        <param name="max_bytes">Size cap; least recently used entries are evicted beyond it</param>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("DiskCache")
+        self.max_bytes = max_bytes
+        self.directory: Optional[Path] = None
+        self._entries: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()  # key -> (path, size), oldest first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._evictions = metrics.counter("zolo_cache_evictions_total", "Entries evicted by the size cap")
+        metrics.gauge("zolo_cache_bytes", "Bytes stored in the disk cache").set_function(lambda: self._total_bytes)
+        metrics.gauge("zolo_cache_entries", "Entries in the disk cache").set_function(lambda: len(self._entries))
+
+        for candidate in (directory, os.path.expanduser(ZoloConstants.CACHE_FALLBACK_DIR)):
+            try:
+                path = Path(candidate)
+                (path / _TEMP_DIR).mkdir(parents=True, exist_ok=True)
+                if os.access(path, os.W_OK):
+                    self.directory = path
+                    break
+            except OSError:
+                continue
+
+        if self.directory is None:
+            self.logger.warning(f"No writable cache directory ({directory}), caching disabled")
+            return
+        self._scan()
+
+    @staticmethod
+    def make_key(namespace: str, *parts: Any) -> str:
+        """
+        <summary>Hash a namespace and the inputs of a computation into a cache key</summary>
+        <param name="namespace">Artifact kind (e.g., 'tts'), keeps equal inputs of different kinds apart</param>
+        <param name="parts">Inputs: bytes-like objects (including arrays), strings or reprs of other values</param>
+        <returns>Hex digest</returns>
+        """
+        digest = hashlib.sha256()
+        for part in (namespace,) + parts:
+            if isinstance(part, str):
+                tag, data = b's', part.encode('utf-8')
+            elif isinstance(part, (bytes, bytearray)):
+                tag, data = b'b', bytes(part)
+            elif hasattr(part, 'tobytes'):
+                # numpy arrays, array.array, memoryview
+                tag, data = b'b', part.tobytes()
+            else:
+                tag, data = b'r', repr(part).encode('utf-8')
+            # Length prefix: ('ab', 'c') and ('a', 'bc') must not collide
+            digest.update(tag + _LENGTH.pack(len(data)) + data)
+        return digest.hexdigest()
+
+    def get(self, key: str, namespace: str = "default") -> Optional[bytes]:
+        """
+        <summary>Read an entry</summary>
+        <param name="key">Cache key</param>
+        <param name="namespace">Metrics label</param>
+        <returns>Stored bytes or None on a miss</returns>
+        """
+        path = self.get_path(key, namespace)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            self._forget(key)
+            return None
+
+    def get_mapped(self, key: str, namespace: str = "default") -> Optional[mmap.mmap]:
+        """
+        <summary>Map an entry read-only instead of copying it (large artifacts); close() when done</summary>
+        <param name="key">Cache key</param>
+        <param name="namespace">Metrics label</param>
+        <returns>Read-only memory map or None on a miss (or for an empty entry)</returns>
+        """
+        path = self.get_path(key, namespace)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as file:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file cannot be mapped
+            return None
+        except OSError:
+            self._forget(key)
+            return None
+
+    def get_path(self, key: str, namespace: str = "default") -> Optional[Path]:
+        """
+        <summary>Look up an entry's file and mark it recently used</summary>
+        <param name="key">Cache key</param>
+        <param name="namespace">Metrics label</param>
+        <returns>Path of the entry or None on a miss</returns>
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            self._count(namespace, hit=False)
+            return None
+
+        path = entry[0]
+        try:
+            # mtime records recency, so the LRU order survives a restart
+            os.utime(path)
+        except OSError:
+            self._forget(key)
+            self._count(namespace, hit=False)
+            return None
+        self._count(namespace, hit=True)
+        return path
+
+    def put(self, key: str, data: bytes, suffix: str = "") -> bool:
+        """
+        <summary>Store an entry atomically</summary>
+        <param name="key">Cache key</param>
+        <param name="data">Bytes to store</param>
+        <param name="suffix">Optional file suffix (e.g., '.wav') for consumers that need a typed file</param>
+        <returns>True if stored, False otherwise</returns>
+        """
+        return self.put_file(key, lambda path: Path(path).write_bytes(data), suffix) is not None
+
+    def put_file(self, key: str, producer: Callable[[str], Any], suffix: str = "") -> Optional[Path]:
+        """
+        <summary>Let producer write an entry to a temporary path, then move it into place</summary>
+        <param name="key">Cache key</param>
+        <param name="producer">Callable writing the artifact to the path it receives</param>
+        <param name="suffix">Optional file suffix</param>
+        <returns>Path of the stored entry or None if caching failed</returns>
+        """
+        if self.directory is None:
+            return None
+
+        descriptor, temp_path = tempfile.mkstemp(suffix=suffix, dir=self.directory / _TEMP_DIR)
+        os.close(descriptor)
+        try:
+            if producer(temp_path) is False:
+                raise OSError("producer reported failure")
+            with open(temp_path, 'rb+') as file:
+                os.fsync(file.fileno())
+            size = os.path.getsize(temp_path)
+            if size == 0 and suffix:
+                raise OSError("producer wrote nothing")
+            if size > self.max_bytes:
+                raise OSError(f"entry of {size} bytes exceeds the cache size cap")
+            path = self.directory / key[:2] / f"{key}{suffix}"
+            path.parent.mkdir(exist_ok=True)
+            os.replace(temp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Cache write of {key[:12]} failed: {e}")
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            return None
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous:
+                self._total_bytes -= previous[1]
+                if previous[0] != path:
+                    self._unlink(previous[0])
+            self._entries[key] = (path, size)
+            self._total_bytes += size
+            self._evict()
+        return path
+
+    def get_or_compute(self, namespace: str, parts: tuple, compute: Callable[[], bytes]) -> bytes:
+        """
+        <summary>Return the cached result for these inputs, computing and storing it on a miss</summary>
+        <param name="namespace">Artifact kind</param>
+        <param name="parts">Inputs that determine the result</param>
+        <param name="compute">Callable producing the bytes</param>
+        <returns>Result bytes</returns>
+        """
+        key = self.make_key(namespace, *parts)
+        data = self.get(key, namespace)
+        if data is None:
+            data = compute()
+            self.put(key, data)
+        return data
+
+    def get_or_compute_file(self, namespace: str, parts: tuple, producer: Callable[[str], Any],
+                            suffix: str = "") -> Optional[Path]:
+        """
+        <summary>Return the cached file for these inputs, letting producer write it on a miss</summary>
+        <param name="namespace">Artifact kind</param>
+        <param name="parts">Inputs that determine the result</param>
+        <param name="producer">Callable writing the artifact to the path it receives</param>
+        <param name="suffix">Optional file suffix (e.g., '.wav')</param>
+        <returns>Path of the cached file or None if it could not be produced</returns>
+        """
+        key = self.make_key(namespace, *parts)
+        return self.get_path(key, namespace) or self.put_file(key, producer, suffix)
+
+    def remove(self, key: str) -> None:
+        """
+        <summary>Delete an entry</summary>
+        <param name="key">Cache key</param>
+        <returns>None</returns>
+        """
+        self._forget(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get directory, size and entry count</summary>
+        <returns>Dictionary of cache state</returns>
+        """
+        with self._lock:
+            return {
+                'directory': str(self.directory) if self.directory else None,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def _scan(self) -> None:
+        """
+        <summary>Rebuild the index from disk, least recently used first; drop abandoned temp files</summary>
+        <returns>None</returns>
+        """
+        found = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir() or shard.name == _TEMP_DIR:
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_file():
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name.split('.', 1)[0], Path(entry.path), stat.st_size))
+        for entry in os.scandir(self.directory / _TEMP_DIR):
+            self._unlink(Path(entry.path))
+
+        with self._lock:
+            for _, key, path, size in sorted(found):
+                self._entries[key] = (path, size)
+                self._total_bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond the size cap (caller holds the lock)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            _, (path, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._unlink(path)
+            self._evictions.inc()
+
+    def _forget(self, key: str) -> None:
+        """Remove an entry from the index and disk"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self._total_bytes -= entry[1]
+        if entry:
+            self._unlink(entry[0])
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _count(namespace: str, hit: bool) -> None:
+        """Record a hit or miss"""
+        name = "zolo_cache_hits_total" if hit else "zolo_cache_misses_total"
+        metrics.counter(name, "Disk cache lookups" + (" served" if hit else " not found"), namespace=namespace).inc()
+
+
+_shared_cache: Optional[DiskCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache() -> DiskCache:
+    """
+    <summary>Get the process-wide cache under ZoloConstants.CACHE_DIR (opened on first use)</summary>
+    <returns>Disk cache</returns>
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = DiskCache()
+    return _shared_cache
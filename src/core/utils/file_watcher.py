@@ -0,0 +1,216 @@
+"""
+<summary>
+File change watcher using Linux inotify through ctypes, with mtime polling
+as a fallback where inotify is unavailable
+</summary>
+<hardware>Generic - watches configuration files on the host filesystem</hardware>
+<dependencies>ctypes, os, select, threading</dependencies>
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from ..constants.global_constants import ZoloConstants
+
+# inotify flags (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# Watch the directory, not the file: editors and config management replace
+# files by renaming a temporary file over them
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_CREATE | _IN_DELETE | _IN_MODIFY
+_DIRECTORY_GONE = _IN_DELETE_SELF | _IN_MOVE_SELF
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+class _Inotify:
+    """Minimal ctypes binding for one inotify instance"""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path: Path, mask: int) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_add_watch failed: {os.strerror(error)}", str(path))
+        return wd
+
+    def read_events(self) -> list:
+        """Read pending events as (mask, name) tuples"""
+        events = []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return events
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+            offset += length
+            events.append((mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    <summary>
+    Calls on_change (on the watcher thread) after a file was written, replaced,
+    created or deleted. Bursts of events are coalesced into one call.
+    </summary>
+    """
+
+    BACKEND_INOTIFY: str = "inotify"
+    BACKEND_POLLING: str = "polling"
+
+    def __init__(self, path: str, on_change: Callable[[], None],
+                 poll_interval: float = ZoloConstants.CONFIG_POLL_INTERVAL,
+                 debounce: float = ZoloConstants.CONFIG_RELOAD_DEBOUNCE) -> None:
+        """
+        <summary>Create file watcher (not started)</summary>
+        <param name="path">File to watch (need not exist yet)</param>
+        <param name="on_change">Callback run after the file changed</param>
+        <param name="poll_interval">Polling period when inotify is unavailable (seconds)</param>
+        <param name="debounce">Quiet time that ends a burst of events (seconds)</param>
+        <returns>None</returns>
+        """
+        self.path = Path(path)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.backend: Optional[str] = None
+        self._inotify: Optional[_Inotify] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        """
+        <summary>Start watching</summary>
+        <returns>Backend in use ('inotify' or 'polling')</returns>
+        """
+        if self._thread and self._thread.is_alive():
+            return self.backend
+        self._stop.clear()
+        try:
+            self._inotify = _Inotify()
+            self._inotify.add_watch(self.path.parent, _WATCH_MASK | _DIRECTORY_GONE)
+            self.backend = self.BACKEND_INOTIFY
+            target = self._watch_inotify
+        except (OSError, AttributeError):
+            # No inotify (non-Linux, exhausted watches) or no directory yet
+            if self._inotify:
+                self._inotify.close()
+                self._inotify = None
+            self.backend = self.BACKEND_POLLING
+            target = self._watch_polling
+
+        self._thread = threading.Thread(target=target, name="zolo-file-watcher", daemon=True)
+        self._thread.start()
+        return self.backend
+
+    def stop(self) -> None:
+        """
+        <summary>Stop watching (the callback is not called afterwards)</summary>
+        <returns>None</returns>
+        """
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(ZoloConstants.CONFIG_POLL_INTERVAL)
+        self._thread = None
+
+    def _watch_inotify(self) -> None:
+        """
+        <summary>inotify loop: block on the descriptor, coalesce events for our file</summary>
+        <returns>None</returns>
+        """
+        inotify = self._inotify
+        try:
+            while not self._stop.is_set():
+                # Wake up periodically so stop() is honored
+                readable, _, _ = select.select([inotify.fd], [], [], ZoloConstants.CONFIG_POLL_INTERVAL)
+                if not readable:
+                    continue
+                changed, directory_gone = self._drain(inotify)
+                if directory_gone:
+                    # Directory removed: fall back to polling until restarted
+                    self.backend = self.BACKEND_POLLING
+                    self._notify()
+                    self._watch_polling()
+                    return
+                if not changed:
+                    continue
+
+                # Debounce: keep draining until the writer has been quiet
+                while select.select([inotify.fd], [], [], self.debounce)[0]:
+                    self._drain(inotify)
+                self._notify()
+        except OSError as e:
+            if e.errno != errno.EBADF:
+                raise
+        finally:
+            inotify.close()
+            self._inotify = None
+
+    def _drain(self, inotify: _Inotify) -> Tuple[bool, bool]:
+        """Read pending events; returns (our file changed, directory gone)"""
+        changed = directory_gone = False
+        for mask, name in inotify.read_events():
+            if mask & _DIRECTORY_GONE:
+                directory_gone = True
+            elif name == self.path.name:
+                changed = True
+        return changed, directory_gone
+
+    def _watch_polling(self) -> None:
+        """
+        <summary>Fallback loop: compare mtime, size and inode every poll interval</summary>
+        <returns>None</returns>
+        """
+        last = self._signature()
+        while not self._stop.wait(self.poll_interval):
+            current = self._signature()
+            if current != last:
+                last = current
+                self._notify()
+
+    def _signature(self) -> Optional[Tuple[int, int, int]]:
+        """File identity and version, None if missing"""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _notify(self) -> None:
+        """Run the callback unless stopping"""
+        if self._stop.is_set():
+            return
+        try:
+            self.on_change()
+        except Exception:
+            pass
@@ -0,0 +1,228 @@
+"""
+<summary>
+Shared, bounded executor for time-limited hardware calls with cooperative cancellation
+</summary>
+<hardware>Generic execution layer for all hardware components</hardware>
+<dependencies>concurrent.futures, queue, threading</dependencies>
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ..constants.global_constants import ZoloConstants
+from .metrics import Sample, metrics
+
+
+class OperationCancelledError(TimeoutError):
+    """Raised inside a hardware call whose caller already gave up on it"""
+
+
+class CancellationToken:
+    """
+    <summary>
+    Cooperative cancellation flag for one hardware call. Drivers check it
+    between bus transactions and stop early once the caller has timed out.
+    </summary>
+    """
+
+    __slots__ = ('_event',)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation"""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True once cancellation was requested"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise OperationCancelledError if cancellation was requested"""
+        if self._event.is_set():
+            raise OperationCancelledError("Hardware operation cancelled after timeout")
+
+    def wait(self, timeout: float) -> bool:
+        """
+        <summary>Sleep that wakes up early on cancellation</summary>
+        <param name="timeout">Seconds to sleep</param>
+        <returns>True if cancelled, False if the full time elapsed</returns>
+        """
+        return self._event.wait(timeout)
+
+
+# Token seen by calls not running under the executor - never cancelled
+_NEVER_CANCELLED = CancellationToken()
+_local = threading.local()
+
+
+def current_token() -> CancellationToken:
+    """
+    <summary>Get the cancellation token of the hardware call running on this thread</summary>
+    <returns>Cancellation token (never cancelled outside executor calls)</returns>
+    """
+    return getattr(_local, 'token', None) or _NEVER_CANCELLED
+
+
+class HardwareExecutor:
+    """
+    <summary>
+    Fixed pool of daemon worker threads for hardware calls. A call that times
+    out keeps its worker until it returns, but no new thread is created for
+    it, so a flaky bus cannot grow the thread count.
+    </summary>
+    """
+
+    def __init__(self, max_workers: int = ZoloConstants.MAX_THREADS) -> None:
+        """
+        <summary>Initialize executor (workers start on first submit)</summary>
+        <param name="max_workers">Number of worker threads</param>
+        <returns>None</returns>
+        """
+        self.max_workers = max_workers
+        self._queue: "queue.Queue" = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'cancelled': 0,
+            'timed_out': 0,
+            'skipped': 0,
+            'late_completions': 0,
+            'running_after_timeout': 0,
+        }
+
+    def call(self, func: Callable, args: tuple = (), kwargs: Optional[Dict[str, Any]] = None,
+             timeout: Optional[float] = None) -> Any:
+        """
+        <summary>Run func on a worker and wait for its result</summary>
+        <param name="func">Callable to run</param>
+        <param name="args">Positional arguments</param>
+        <param name="kwargs">Keyword arguments</param>
+        <param name="timeout">Seconds to wait (including queueing), None waits forever</param>
+        <returns>Result of func</returns>
+        """
+        future: Future = Future()
+        token = CancellationToken()
+        item = [func, args, kwargs or {}, future, token, False]  # last: timed out
+        self._ensure_workers()
+        with self._lock:
+            self._stats['submitted'] += 1
+        self._queue.put(item)
+
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            token.cancel()
+            with self._lock:
+                self._stats['timed_out'] += 1
+                if future.running():
+                    item[5] = True
+                    self._stats['running_after_timeout'] += 1
+            raise TimeoutError(f"Operation timed out after {timeout} seconds")
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        <summary>Get call counters, including timed-out calls that are still running</summary>
+        <returns>Dictionary of counters</returns>
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['workers'] = len(self._workers)
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+    def _ensure_workers(self) -> None:
+        """
+        <summary>Start the worker threads once</summary>
+        <returns>None</returns>
+        """
+        if len(self._workers) >= self.max_workers:
+            return
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work, name=f"zolo-hw-{len(self._workers)}", daemon=True
+                )
+                self._workers.append(worker)
+                worker.start()
+
+    def _work(self) -> None:
+        """
+        <summary>Worker loop</summary>
+        <returns>None</returns>
+        """
+        while True:
+            func, args, kwargs, future, token, _ = item = self._queue.get()
+            # Caller already gave up while the call was queued
+            if token.is_cancelled or not future.set_running_or_notify_cancel():
+                with self._lock:
+                    self._stats['skipped'] += 1
+                continue
+
+            _local.token = token
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                outcome = 'cancelled' if isinstance(e, OperationCancelledError) else 'failed'
+            else:
+                future.set_result(result)
+                outcome = 'completed'
+            finally:
+                _local.token = None
+
+            with self._lock:
+                self._stats[outcome] += 1
+                if item[5]:
+                    self._stats['late_completions'] += 1
+                    self._stats['running_after_timeout'] -= 1
+
+
+# Process-wide executor shared by HardwareUtils.timeout_handler
+shared_executor = HardwareExecutor()
+
+_EXECUTOR_GAUGES = ('running_after_timeout', 'workers', 'queued')
+
+
+def _collect_executor_metrics() -> Iterable[Sample]:
+    """Export shared executor counters"""
+    for key, value in shared_executor.get_stats().items():
+        if key in _EXECUTOR_GAUGES:
+            yield (f"zolo_hw_executor_{key}", 'gauge', "Shared hardware executor state", {}, value)
+        else:
+            yield ("zolo_hw_executor_calls_total", 'counter', "Hardware executor calls by outcome",
+                   {'outcome': key}, value)
+
+
+metrics.register_collector(_collect_executor_metrics)
+
+
+if __name__ == "__main__":
+    # Flaky-bus simulation: thread count must stay bounded
+    def flaky_read(duration: float) -> float:
+        token = current_token()
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            token.raise_if_cancelled()
+            time.sleep(0.005)
+        return duration
+
+    def stuck_read() -> None:
+        time.sleep(1.0)  # Ignores the token, like a blocked ioctl
+
+    baseline = threading.active_count()
+    for i in range(200):
+        try:
+            shared_executor.call(stuck_read if i % 10 == 0 else flaky_read, (0.05,) if i % 10 else (), timeout=0.02)
+        except TimeoutError:
+            pass
+    print(f"threads: {baseline} -> {threading.active_count()} (max workers {shared_executor.max_workers})")
+    print(shared_executor.get_stats())
@@ -3,15 +3,19 @@
 Hardware utility functions for Zolo robot system
 </summary>
 <hardware>Generic hardware utilities for all components</hardware>
-<dependencies>time, threading</dependencies>
+<dependencies>threading</dependencies>
 """
 
-import time
 import threading
-from typing import Callable, Optional, Any
+from typing import Callable, Dict, Optional, Any
 from functools import wraps
 
 from ..constants.global_constants import ZoloConstants
+from .hardware_executor import CancellationToken, OperationCancelledError, current_token, shared_executor
+from .retry_policy import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+_UNBOUND_TOKEN = current_token()
 
 
 class HardwareUtils:
@@ -22,27 +26,64 @@ class HardwareUtils:
     """
     
     @staticmethod
-    def retry_on_failure(max_retries: int = ZoloConstants.MAX_SENSOR_RETRIES, delay: float = 0.1) -> Callable:
+    def retry_on_failure(max_retries: int = ZoloConstants.MAX_SENSOR_RETRIES,
+                         delay: float = ZoloConstants.RETRY_BASE_DELAY,
+                         device: Optional[str] = None, probe: Optional[str] = None,
+                         max_delay: float = ZoloConstants.RETRY_MAX_DELAY) -> Callable:
         """
-        <summary>Decorator to retry hardware operations on failure</summary>
+        <summary>Decorator to retry hardware operations on failure with exponential backoff and jitter</summary>
         <param name="max_retries">Maximum number of retry attempts</param>
-        <param name="delay">Delay between retries in seconds</param>
+        <param name="delay">Backoff bound before the first retry in seconds (doubles per retry)</param>
+        <param name="device">Optional device name; enables that device's circuit breaker</param>
+        <param name="probe">Method name on the instance that checks the device without side effects;
+        run while the breaker is open (required with device)</param>
+        <param name="max_delay">Backoff cap in seconds</param>
         <returns>Decorator function</returns>
         """
+        if device and not probe:
+            # Replaying the failed call would repeat its side effects with stale arguments
+            raise ValueError(f"Device '{device}' needs an explicit probe method")
+        policy = RetryPolicy(max_retries, delay, max_delay)
+        
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs) -> Any:
+                breaker = CircuitBreaker.get(device) if device else None
+                if breaker and not breaker.allow():
+                    raise CircuitOpenError(f"Device '{device}' is unavailable")
+                
                 for attempt in range(max_retries + 1):
                     try:
-                        return func(*args, **kwargs)
-                    except Exception as e:
+                        result = func(*args, **kwargs)
+                    except Exception:
                         if attempt == max_retries:
-                            raise e
-                        time.sleep(delay)
+                            if breaker:
+                                breaker.record_failure(getattr(args[0], probe))
+                            raise
+                        if breaker:
+                            breaker.record_retry()
+                        # Wakes up early if a timeout_handler caller gave up
+                        if HardwareUtils.cancellation_token().wait(policy.delay(attempt)):
+                            if breaker:
+                                # Settles a half-open trial too - it must not stay in flight
+                                breaker.record_failure(getattr(args[0], probe))
+                            raise OperationCancelledError("Hardware operation cancelled during retry backoff")
+                    else:
+                        if breaker:
+                            breaker.record_success()
+                        return result
                 return None
             return wrapper
         return decorator
     
+    @staticmethod
+    def get_retry_metrics() -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Get retry, failure and circuit breaker metrics per device</summary>
+        <returns>Dictionary mapping device name to metrics</returns>
+        """
+        return CircuitBreaker.get_all_metrics()
+    
     @staticmethod
     def timeout_handler(timeout_seconds: float) -> Callable:
         """
@@ -53,30 +94,30 @@ class HardwareUtils:
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs) -> Any:
-                result = [None]
-                exception = [None]
-                
-                def target():
-                    try:
-                        result[0] = func(*args, **kwargs)
-                    except Exception as e:
-                        exception[0] = e
-                
-                thread = threading.Thread(target=target)
-                thread.daemon = True
-                thread.start()
-                thread.join(timeout_seconds)
-                
-                if thread.is_alive():
-                    raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-                
-                if exception[0]:
-                    raise exception[0]
-                
-                return result[0]
+                # Already on a hardware worker (nested timeouts): run inline,
+                # the outer call's deadline and token apply
+                if HardwareUtils.cancellation_token() is not _UNBOUND_TOKEN:
+                    return func(*args, **kwargs)
+                return shared_executor.call(func, args, kwargs, timeout=timeout_seconds)
             return wrapper
         return decorator
     
+    @staticmethod
+    def cancellation_token() -> CancellationToken:
+        """
+        <summary>Get the cancellation token of the current timeout_handler call</summary>
+        <returns>Token to check between bus transactions (never cancelled outside timed calls)</returns>
+        """
+        return current_token()
+    
+    @staticmethod
+    def get_timeout_stats() -> Dict[str, int]:
+        """
+        <summary>Get shared hardware executor counters (timed out, still running after timeout, ...)</summary>
+        <returns>Dictionary of counters</returns>
+        """
+        return shared_executor.get_stats()
+    
     @staticmethod
     def validate_range(value: float, min_val: float, max_val: float) -> bool:
         """
@@ -123,11 +164,17 @@ class HardwareUtils:
         return threading.Timer(timeout, callback)
     
     @staticmethod
-    def emergency_stop() -> None:
+    def emergency_stop(source: str = "software") -> None:
         """
         <summary>Emergency stop function for all hardware operations</summary>
+        <param name="source">What triggered the stop</param>
         <returns>None</returns>
         """
-        # Skeleton implementation
-        print("EMERGENCY STOP ACTIVATED")
-        pass
\ No newline at end of file
+        # Imported here - the runtime package depends on these utilities
+        from ..runtime.emergency_stop import get_active_watcher
+        
+        watcher = get_active_watcher()
+        if watcher is None:
+            print("EMERGENCY STOP ACTIVATED (no watcher armed)")
+            return
+        watcher.trigger(source)
\ No newline at end of file
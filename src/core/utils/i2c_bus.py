@@ -0,0 +1,266 @@
+"""
+<summary>
+Shared I2C bus manager: owns the bus handle and grants the bus to one
+transaction at a time, highest priority first, with utilization and
+per-transaction latency metrics
+</summary>
+<hardware>I2C bus 1 (GPIO 2/3) shared by VL53L0X and TSL2561</hardware>
+<dependencies>busio, board, threading</dependencies>
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from ..constants.global_constants import ZoloConstants
+from .hardware_executor import current_token
+from .lazy_import import lazy_import
+from .metrics import Sample, metrics
+
+# Imported when the first driver asks for the bus handle
+board = lazy_import("board", simulated="src.simulation.board")
+busio = lazy_import("busio", simulated="src.simulation.busio")
+
+
+class BusTimeoutError(TimeoutError):
+    """Raised when a transaction could not get the bus in time"""
+
+
+class I2CBus:
+    """
+    <summary>
+    Arbiter for one physical I2C bus. Transactions run on the caller's thread
+    while holding the bus; waiting transactions are queued by priority (lower
+    value first, FIFO within a priority) and the bus is handed directly to the
+    next one on release, so back-to-back transactions run as a batch without
+    an idle gap. A transaction should cover one logical operation (e.g. a
+    ranging result read or a group of register writes), not a wait for the
+    sensor.
+    </summary>
+    """
+
+    def __init__(self, name: str = "i2c-1") -> None:
+        """
+        <summary>Initialize bus manager (the handle is opened on first use)</summary>
+        <param name="name">Bus name (metrics label)</param>
+        <returns>None</returns>
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._busy = False
+        self._waiters: List[tuple] = []  # heap of (priority, seq, event, device)
+        self._sequence = itertools.count()
+        self._handle = None
+        self._handle_users = 0
+        self._histograms: Dict[str, tuple] = {}  # device -> (wait, transaction)
+
+        # Utilization: busy fraction of the last completed window
+        self._busy_total = 0.0
+        self._window_start = time.monotonic()
+        self._window_busy = 0.0
+        self._utilization = 0.0
+        self._stats = {'transactions': 0, 'contended': 0, 'timeouts': 0, 'batched': 0}
+
+    def acquire_handle(self) -> Any:
+        """
+        <summary>Get the shared busio.I2C handle, opening it for the first user</summary>
+        <returns>I2C handle (raises if board/busio are unavailable)</returns>
+        """
+        with self._lock:
+            if self._handle is None:
+                if not (board.is_available() and busio.is_available()):
+                    raise RuntimeError(f"I2C unavailable ({busio.get_error() or board.get_error()})")
+                self._handle = busio.I2C(board.SCL, board.SDA)
+            self._handle_users += 1
+            return self._handle
+
+    def release_handle(self) -> None:
+        """
+        <summary>Drop one user of the handle; the last user closes it</summary>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._handle_users = max(0, self._handle_users - 1)
+            if self._handle_users or self._handle is None:
+                return
+            handle, self._handle = self._handle, None
+        handle.deinit()
+
+    @contextmanager
+    def transaction(self, device: str, priority: int = ZoloConstants.I2C_PRIORITY_DEFAULT,
+                    timeout: float = ZoloConstants.I2C_BUS_TIMEOUT) -> Iterator[None]:
+        """
+        <summary>Hold the bus for the body of the with block</summary>
+        <param name="device">Device name (metrics label)</param>
+        <param name="priority">Queueing priority, lower runs first (e.g. I2C_PRIORITY_RANGING)</param>
+        <param name="timeout">Max seconds to wait for the bus</param>
+        <returns>Context manager</returns>
+        """
+        requested = time.monotonic()
+        self._acquire(device, priority, timeout)
+        started = time.monotonic()
+        try:
+            # Caller of a timeout_handler call may have given up while we queued
+            current_token().raise_if_cancelled()
+            yield
+        finally:
+            ended = time.monotonic()
+            self._release(ended - started)
+            wait_seconds, transaction_seconds = self._device_histograms(device)
+            wait_seconds.observe(started - requested)
+            transaction_seconds.observe(ended - started)
+
+    def call(self, func: Callable, *args: Any, device: str,
+             priority: int = ZoloConstants.I2C_PRIORITY_DEFAULT, **kwargs: Any) -> Any:
+        """
+        <summary>Run func as one transaction</summary>
+        <param name="func">Callable performing the bus access</param>
+        <param name="device">Device name (metrics label)</param>
+        <param name="priority">Queueing priority, lower runs first</param>
+        <returns>Result of func</returns>
+        """
+        with self.transaction(device, priority):
+            return func(*args, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get transaction counters, queue depth and utilization</summary>
+        <returns>Dictionary of bus statistics</returns>
+        """
+        with self._lock:
+            self._roll_window(time.monotonic())
+            stats = dict(self._stats)
+            stats['waiting'] = len(self._waiters)
+            stats['busy_seconds'] = self._busy_total
+            stats['utilization'] = self._utilization
+            stats['handle_users'] = self._handle_users
+        return stats
+
+    def _acquire(self, device: str, priority: int, timeout: float) -> None:
+        """
+        <summary>Take the bus or queue for it</summary>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._stats['transactions'] += 1
+            if not self._busy:
+                self._busy = True
+                return
+            self._stats['contended'] += 1
+            event = threading.Event()
+            entry = (priority, next(self._sequence), event, device)
+            heapq.heappush(self._waiters, entry)
+
+        if event.wait(timeout):
+            return
+        with self._lock:
+            # Granted between the timeout and taking the lock
+            if event.is_set():
+                return
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            self._stats['timeouts'] += 1
+        raise BusTimeoutError(f"{device}: I2C bus {self.name} busy for {timeout} seconds")
+
+    def _release(self, held: float) -> None:
+        """
+        <summary>Hand the bus to the highest priority waiter or mark it idle</summary>
+        <param name="held">Seconds the bus was held</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._busy_total += held
+            self._window_busy += held
+            self._roll_window(time.monotonic())
+            if self._waiters:
+                # Bus stays busy: ownership passes straight to the next transaction
+                self._stats['batched'] += 1
+                heapq.heappop(self._waiters)[2].set()
+            else:
+                self._busy = False
+
+    def _roll_window(self, now: float) -> None:
+        """Close the utilization window once it is complete (caller holds the lock)"""
+        elapsed = now - self._window_start
+        if elapsed >= ZoloConstants.I2C_UTILIZATION_WINDOW:
+            self._utilization = min(1.0, self._window_busy / elapsed)
+            self._window_start = now
+            self._window_busy = 0.0
+
+    def _device_histograms(self, device: str) -> tuple:
+        """Latency histograms of one device (looked up once)"""
+        histograms = self._histograms.get(device)
+        if histograms is None:
+            histograms = self._histograms[device] = (
+                metrics.histogram("zolo_i2c_wait_seconds", "Time a transaction waited for the I2C bus",
+                                  bus=self.name, device=device),
+                metrics.histogram("zolo_i2c_transaction_seconds", "Time a transaction held the I2C bus",
+                                  bus=self.name, device=device),
+            )
+        return histograms
+
+
+# One manager per physical bus; both sensors are on bus 1
+_buses: Dict[int, I2CBus] = {}
+_buses_lock = threading.Lock()
+
+
+def get_i2c_bus(bus_number: int = 1) -> I2CBus:
+    """
+    <summary>Get the process-wide manager for an I2C bus</summary>
+    <param name="bus_number">Linux I2C bus number</param>
+    <returns>Bus manager</returns>
+    """
+    with _buses_lock:
+        if bus_number not in _buses:
+            _buses[bus_number] = I2CBus(f"i2c-{bus_number}")
+        return _buses[bus_number]
+
+
+def _collect_bus_metrics() -> Iterable[Sample]:
+    """Export bus counters and utilization"""
+    for bus in list(_buses.values()):
+        stats = bus.get_stats()
+        labels = {'bus': bus.name}
+        yield ("zolo_i2c_utilization", 'gauge', "Busy fraction of the I2C bus over the last window",
+               labels, stats['utilization'])
+        yield ("zolo_i2c_busy_seconds_total", 'counter', "Time the I2C bus was held", labels, stats['busy_seconds'])
+        yield ("zolo_i2c_waiting", 'gauge', "Transactions queued for the I2C bus", labels, stats['waiting'])
+        for key in ('transactions', 'contended', 'timeouts', 'batched'):
+            yield (f"zolo_i2c_{key}_total", 'counter', "I2C bus transactions", labels, stats[key])
+
+
+metrics.register_collector(_collect_bus_metrics)
+
+
+if __name__ == "__main__":
+    # Contention demo: a slow low-priority reader must not starve ranging
+    bus = get_i2c_bus()
+
+    def reader(device: str, priority: int, hold: float, count: int, latencies: list) -> None:
+        for _ in range(count):
+            requested = time.perf_counter()
+            with bus.transaction(device, priority):
+                latencies.append(time.perf_counter() - requested)
+                time.sleep(hold)
+
+    ranging, lux = [], []
+    threads = [
+        threading.Thread(target=reader, args=("distance_sensor", ZoloConstants.I2C_PRIORITY_RANGING, 0.001, 200, ranging)),
+        threading.Thread(target=reader, args=("light_sensor", ZoloConstants.I2C_PRIORITY_LUX, 0.002, 100, lux)),
+        threading.Thread(target=reader, args=("light_sensor", ZoloConstants.I2C_PRIORITY_LUX, 0.002, 100, lux)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, values in (("ranging", ranging), ("lux", lux)):
+        values.sort()
+        print(f"{name:8s} wait p50={values[len(values) // 2] * 1000:.2f}ms max={values[-1] * 1000:.2f}ms")
+    stats = bus.get_stats()
+    print(f"busy {stats['busy_seconds']:.3f}s, {stats['contended']}/{stats['transactions']} transactions queued, "
+          f"{stats['batched']} handed over without an idle gap")
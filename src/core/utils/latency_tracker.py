@@ -0,0 +1,212 @@
+"""
+<summary>
+Low-overhead per-stage latency tracking for the robot main loop
+</summary>
+<hardware>Generic timing instrumentation for all system components</hardware>
+<dependencies>array, threading, time</dependencies>
+"""
+
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+from ..constants.global_constants import ZoloConstants
+
+
+class LatencyWindow:
+    """
+    <summary>
+    Fixed-size ring buffer of durations with percentile summaries
+    </summary>
+    """
+
+    __slots__ = ('_samples', '_capacity', '_index', '_filled', '_lock', 'count', 'total', 'max', 'overruns')
+
+    def __init__(self, capacity: int = ZoloConstants.LATENCY_WINDOW_SIZE) -> None:
+        """
+        <summary>Preallocate ring buffer</summary>
+        <param name="capacity">Number of most recent samples kept</param>
+        <returns>None</returns>
+        """
+        self._samples = array('d', bytes(8 * capacity))
+        self._capacity = capacity
+        self._index = 0
+        self._filled = 0
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.overruns = 0
+
+    def record(self, seconds: float, overrun: bool = False) -> None:
+        """
+        <summary>Add a duration sample</summary>
+        <param name="seconds">Duration in seconds</param>
+        <param name="overrun">True if the sample exceeded its budget</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            if overrun:
+                self.overruns += 1
+            self._samples[self._index] = seconds
+            self._index = (self._index + 1) % self._capacity
+            if self._filled < self._capacity:
+                self._filled += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def summary(self) -> Dict[str, float]:
+        """
+        <summary>Get percentile summary over the samples currently in the window</summary>
+        <returns>Dictionary with count, mean, p50, p95, p99 and max (seconds)</returns>
+        """
+        with self._lock:
+            window = sorted(self._samples[:self._filled])
+            count, total, maximum, overruns = self.count, self.total, self.max, self.overruns
+
+        def percentile(p: float) -> float:
+            if not window:
+                return 0.0
+            return window[min(len(window) - 1, int(p * len(window)))]
+
+        return {
+            'count': count,
+            'mean': total / count if count else 0.0,
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'p99': percentile(0.99),
+            'max': maximum,
+            'window_max': window[-1] if window else 0.0,
+            'overruns': overruns
+        }
+
+
+class _StageTimer:
+    """Context manager timing one stage"""
+
+    __slots__ = ('_tracker', '_name', '_started')
+
+    def __init__(self, tracker: 'LatencyTracker', name: str) -> None:
+        self._tracker = tracker
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> '_StageTimer':
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracker.record(self._name, time.perf_counter() - self._started)
+
+
+class LatencyTracker:
+    """
+    <summary>
+    Always-on timing surface. Keeps a latency window per stage and per tick,
+    and flags ticks that exceed the configured tick budget.
+    </summary>
+    """
+
+    TICK_STAGE: str = "tick"
+
+    def __init__(self, tick_budget: float = ZoloConstants.TICK_BUDGET,
+                 capacity: int = ZoloConstants.LATENCY_WINDOW_SIZE,
+                 on_overrun: Optional[Callable[[str, float], None]] = None) -> None:
+        """
+        <summary>Initialize latency tracker</summary>
+        <param name="tick_budget">Tick duration budget in seconds</param>
+        <param name="capacity">Samples kept per stage</param>
+        <param name="on_overrun">Optional callback(tick_name, seconds) for ticks over budget</param>
+        <returns>None</returns>
+        """
+        self.tick_budget = tick_budget
+        self.capacity = capacity
+        self.on_overrun = on_overrun
+        self._windows: Dict[str, LatencyWindow] = {}
+        self._windows_lock = threading.Lock()
+        self._local = threading.local()
+
+    def stage(self, name: str) -> _StageTimer:
+        """
+        <summary>Time a stage with a 'with' block</summary>
+        <param name="name">Stage name (e.g., 'check_sensors')</param>
+        <returns>Context manager recording the stage duration</returns>
+        """
+        return _StageTimer(self, name)
+
+    def record(self, name: str, seconds: float, overrun: bool = False) -> None:
+        """
+        <summary>Record a stage duration</summary>
+        <param name="name">Stage name</param>
+        <param name="seconds">Duration in seconds</param>
+        <param name="overrun">True if the sample exceeded its budget</param>
+        <returns>None</returns>
+        """
+        window = self._windows.get(name)
+        if window is None:
+            with self._windows_lock:
+                window = self._windows.setdefault(name, LatencyWindow(self.capacity))
+        window.record(seconds, overrun)
+
+    def begin_tick(self) -> None:
+        """
+        <summary>Mark the start of a tick on the calling thread</summary>
+        <returns>None</returns>
+        """
+        self._local.tick_started = time.perf_counter()
+
+    def end_tick(self, name: str = TICK_STAGE) -> float:
+        """
+        <summary>Mark the end of a tick and check it against the tick budget</summary>
+        <param name="name">Tick name (e.g., 'tick' or 'event_distance')</param>
+        <returns>Tick duration in seconds</returns>
+        """
+        started = getattr(self._local, 'tick_started', None)
+        if started is None:
+            return 0.0
+        self._local.tick_started = None
+
+        elapsed = time.perf_counter() - started
+        overrun = elapsed > self.tick_budget
+        self.record(name, elapsed, overrun)
+        if overrun and self.on_overrun:
+            self.on_overrun(name, elapsed)
+        return elapsed
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        <summary>Get latency summary for every stage</summary>
+        <returns>Dictionary with tick budget and per-stage summaries (seconds)</returns>
+        """
+        with self._windows_lock:
+            windows = list(self._windows.items())
+        return {
+            'tick_budget': self.tick_budget,
+            'stages': {name: window.summary() for name, window in windows}
+        }
+
+    def format_snapshot(self) -> str:
+        """
+        <summary>Format snapshot as a log-friendly table (milliseconds)</summary>
+        <returns>Multi-line summary</returns>
+        """
+        snapshot = self.get_snapshot()
+        lines: List[str] = [f"Latency (budget {snapshot['tick_budget'] * 1000:.0f}ms):"]
+        for name, stats in sorted(snapshot['stages'].items()):
+            lines.append(
+                f"  {name:<24} n={stats['count']:<6} p50={stats['p50'] * 1000:7.2f} "
+                f"p95={stats['p95'] * 1000:7.2f} p99={stats['p99'] * 1000:7.2f} "
+                f"max={stats['max'] * 1000:8.2f} overruns={stats['overruns']}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        <summary>Discard all recorded samples</summary>
+        <returns>None</returns>
+        """
+        with self._windows_lock:
+            self._windows.clear()
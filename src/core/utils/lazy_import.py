@@ -0,0 +1,218 @@
+"""
+<summary>
+Deferred loading of heavy hardware and ML dependencies with a startup import trace.
+Also selects between real device libraries and simulated backends.
+</summary>
+<hardware>Generic import layer for all hardware components</hardware>
+<dependencies>importlib, threading, time</dependencies>
+"""
+
+import importlib
+import os
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+from ..constants.global_constants import ZoloConstants
+
+# Reference point for startup milestones (first import of this module)
+_PROCESS_START = time.perf_counter()
+
+_backend = os.environ.get(ZoloConstants.BACKEND_ENV_VAR, ZoloConstants.DEFAULT_BACKEND).lower()
+
+
+def set_backend(backend: str) -> None:
+    """
+    <summary>Select hardware, simulated or auto backend for modules not loaded yet</summary>
+    <param name="backend">One of ZoloConstants.BACKEND_HARDWARE/BACKEND_SIMULATED/BACKEND_AUTO</param>
+    <returns>None</returns>
+    """
+    global _backend
+    if backend not in (ZoloConstants.BACKEND_HARDWARE, ZoloConstants.BACKEND_SIMULATED, ZoloConstants.BACKEND_AUTO):
+        raise ValueError(f"Unknown backend: {backend}")
+    _backend = backend
+
+
+def get_backend() -> str:
+    """
+    <summary>Get the selected backend</summary>
+    <returns>Backend name</returns>
+    """
+    return _backend
+
+
+class ImportTrace:
+    """
+    <summary>
+    Process-wide record of deferred imports and startup milestones
+    </summary>
+    """
+
+    _lock = threading.Lock()
+    _imports: List[Dict[str, Any]] = []
+    _milestones: Dict[str, float] = {}
+
+    @classmethod
+    def record_import(cls, module_name: str, duration: float, error: Optional[BaseException]) -> None:
+        """
+        <summary>Record the outcome of a deferred import</summary>
+        <param name="module_name">Imported module name</param>
+        <param name="duration">Import duration in seconds</param>
+        <param name="error">Import error or None if successful</param>
+        <returns>None</returns>
+        """
+        with cls._lock:
+            cls._imports.append({
+                'module': module_name,
+                'duration': duration,
+                'available': error is None,
+                'error': str(error) if error else None,
+                'at': time.perf_counter() - _PROCESS_START
+            })
+
+    @classmethod
+    def mark(cls, milestone: str) -> float:
+        """
+        <summary>Record a startup milestone (e.g., 'first_greeting')</summary>
+        <param name="milestone">Milestone name</param>
+        <returns>Seconds since process start</returns>
+        """
+        elapsed = time.perf_counter() - _PROCESS_START
+        with cls._lock:
+            cls._milestones.setdefault(milestone, elapsed)
+        return elapsed
+
+    @classmethod
+    def get_trace(cls) -> Dict[str, Any]:
+        """
+        <summary>Get startup trace with per-import timing and milestones</summary>
+        <returns>Dictionary containing imports, milestones and total import time</returns>
+        """
+        with cls._lock:
+            imports = [dict(entry) for entry in cls._imports]
+            milestones = dict(cls._milestones)
+        return {
+            'imports': imports,
+            'milestones': milestones,
+            'total_import_time': sum(entry['duration'] for entry in imports)
+        }
+
+    @classmethod
+    def format_trace(cls) -> str:
+        """
+        <summary>Format startup trace as human-readable text, slowest imports first</summary>
+        <returns>Multi-line trace summary</returns>
+        """
+        trace = cls.get_trace()
+        lines = [f"Deferred imports: {trace['total_import_time'] * 1000:.1f}ms total"]
+        for entry in sorted(trace['imports'], key=lambda e: e['duration'], reverse=True):
+            status = "ok" if entry['available'] else f"missing ({entry['error']})"
+            lines.append(f"  {entry['module']:<24} {entry['duration'] * 1000:8.1f}ms  {status}")
+        for name, elapsed in sorted(trace['milestones'].items(), key=lambda item: item[1]):
+            lines.append(f"  [{name}] at {elapsed * 1000:.1f}ms")
+        return "\n".join(lines)
+
+
+class LazyImport:
+    """
+    <summary>
+    Module proxy that imports the real module on first use. A missing
+    dependency is reported through is_available() instead of crashing at import time.
+    </summary>
+    """
+
+    def __init__(self, module_name: str, simulated: Optional[str] = None) -> None:
+        """
+        <summary>Create lazy module proxy</summary>
+        <param name="module_name">Fully qualified module name</param>
+        <param name="simulated">Optional module implementing the same API on simulated hardware</param>
+        <returns>None</returns>
+        """
+        self._module_name = module_name
+        self._simulated = simulated
+        self.is_simulated = False
+        self._module: Optional[ModuleType] = None
+        self._error: Optional[BaseException] = None
+        self._attempted = False
+        self._load_lock = threading.Lock()
+
+    def load(self) -> Optional[ModuleType]:
+        """
+        <summary>Import the module if not done yet</summary>
+        <returns>Module object or None if the dependency is missing</returns>
+        """
+        if not self._attempted:
+            with self._load_lock:
+                if not self._attempted:
+                    started = time.perf_counter()
+                    backend = get_backend()
+                    if self._simulated and backend == ZoloConstants.BACKEND_SIMULATED:
+                        self._import(self._simulated)
+                    else:
+                        self._import(self._module_name)
+                        if self._module is None and self._simulated and backend == ZoloConstants.BACKEND_AUTO:
+                            self._import(self._simulated)
+                    name = f"{self._module_name} (simulated)" if self.is_simulated else self._module_name
+                    ImportTrace.record_import(name, time.perf_counter() - started, self._error)
+                    self._attempted = True
+        return self._module
+
+    def _import(self, module_name: str) -> None:
+        """
+        <summary>Import a module, keeping the error instead of raising</summary>
+        <param name="module_name">Module to import</param>
+        <returns>None</returns>
+        """
+        try:
+            self._module = importlib.import_module(module_name)
+            self._error = None
+            self.is_simulated = module_name == self._simulated
+        except Exception as e:
+            # Native libraries (PortAudio, libcamera) fail with OSError/RuntimeError too
+            self._error = e
+
+    def is_available(self) -> bool:
+        """
+        <summary>Check if the module can be imported (imports it on first call)</summary>
+        <returns>True if available, False otherwise</returns>
+        """
+        return self.load() is not None
+
+    def get_error(self) -> Optional[BaseException]:
+        """
+        <summary>Get the error raised by the import attempt</summary>
+        <returns>Import error or None</returns>
+        """
+        return self._error
+
+    def __getattr__(self, name: str) -> Any:
+        module = self.load()
+        if module is None:
+            raise ImportError(f"Optional dependency '{self._module_name}' is not available: {self._error}")
+        return getattr(module, name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module else ("missing" if self._attempted else "deferred")
+        return f"<LazyImport {self._module_name} ({state})>"
+
+
+_registry: Dict[str, LazyImport] = {}
+_registry_lock = threading.Lock()
+
+
+def lazy_import(module_name: str, simulated: Optional[str] = None) -> LazyImport:
+    """
+    <summary>Get the shared lazy proxy for a module</summary>
+    <param name="module_name">Fully qualified module name</param>
+    <param name="simulated">Optional simulated replacement module (see src.simulation)</param>
+    <returns>Lazy module proxy</returns>
+    """
+    with _registry_lock:
+        proxy = _registry.get(module_name)
+        if proxy is None:
+            proxy = LazyImport(module_name, simulated)
+            _registry[module_name] = proxy
+        elif simulated and proxy._simulated is None:
+            proxy._simulated = simulated
+        return proxy
@@ -0,0 +1,259 @@
+"""
+<summary>
+Bounded in-memory ring buffer of recent structured log records with
+server-side filtered queries and subscriptions
+</summary>
+<hardware>Generic logging for all system components</hardware>
+<dependencies>asyncio, logging, threading</dependencies>
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..constants.global_constants import ZoloConstants
+
+
+class LogEntry:
+    """
+    <summary>
+    One structured log record
+    </summary>
+    """
+
+    __slots__ = ('seq', 'timestamp', 'level', 'levelno', 'component', 'message', 'exc_text')
+
+    def __init__(self, seq: int, record: logging.LogRecord) -> None:
+        """
+        <summary>Create entry from a log record (message already rendered)</summary>
+        <param name="seq">Monotonic sequence number</param>
+        <param name="record">Log record</param>
+        <returns>None</returns>
+        """
+        self.seq = seq
+        self.timestamp = record.created
+        self.level = record.levelname
+        self.levelno = record.levelno
+        self.component = record.name
+        self.message = record.getMessage()
+        self.exc_text = record.exc_text
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        <summary>Convert to a JSON-serializable dictionary</summary>
+        <returns>Dictionary representation</returns>
+        """
+        return {
+            'seq': self.seq,
+            'timestamp': self.timestamp,
+            'level': self.level,
+            'component': self.component,
+            'message': self.message,
+            'exc_text': self.exc_text
+        }
+
+
+class LogFilter:
+    """
+    <summary>
+    Server-side record filter: minimum level, component names and time range
+    </summary>
+    """
+
+    __slots__ = ('min_level', 'components', 'since', 'until', 'after_seq')
+
+    def __init__(self, level: Optional[str] = None, components: Optional[Iterable[str]] = None,
+                 since: Optional[float] = None, until: Optional[float] = None,
+                 after_seq: Optional[int] = None) -> None:
+        """
+        <summary>Create filter (all criteria optional)</summary>
+        <param name="level">Minimum level name (e.g., 'ERROR')</param>
+        <param name="components">Component (logger) names to include</param>
+        <param name="since">Earliest timestamp (epoch seconds, inclusive)</param>
+        <param name="until">Latest timestamp (epoch seconds, inclusive)</param>
+        <param name="after_seq">Only records with a larger sequence number (polling cursor)</param>
+        <returns>None</returns>
+        """
+        self.min_level = logging.getLevelName(level.upper()) if level else logging.NOTSET
+        if not isinstance(self.min_level, int):
+            raise ValueError(f"Unknown log level: {level}")
+        self.components = frozenset(components) if components else None
+        self.since = since
+        self.until = until
+        self.after_seq = after_seq
+
+    def matches(self, entry: LogEntry) -> bool:
+        """
+        <summary>Check a record against the filter (cheapest tests first)</summary>
+        <param name="entry">Log entry</param>
+        <returns>True if the entry passes</returns>
+        """
+        if entry.levelno < self.min_level:
+            return False
+        if self.components is not None and entry.component not in self.components:
+            return False
+        if self.after_seq is not None and entry.seq <= self.after_seq:
+            return False
+        if self.since is not None and entry.timestamp < self.since:
+            return False
+        if self.until is not None and entry.timestamp > self.until:
+            return False
+        return True
+
+
+class LogSubscription:
+    """
+    <summary>
+    Async iterator over live log entries matching a filter (for WebSocket streaming).
+    A slow consumer loses its oldest pending entries instead of slowing logging.
+    </summary>
+    """
+
+    def __init__(self, buffer: 'LogBuffer', log_filter: LogFilter,
+                 capacity: int = ZoloConstants.LOG_SUBSCRIBER_QUEUE_SIZE) -> None:
+        """
+        <summary>Create subscription bound to the running event loop</summary>
+        <param name="buffer">Log buffer to subscribe to</param>
+        <param name="log_filter">Filter applied before entries are queued</param>
+        <param name="capacity">Pending entries kept for a slow consumer</param>
+        <returns>None</returns>
+        """
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=capacity)
+        self.dropped = 0
+        self._buffer = buffer
+        self._token = buffer.subscribe(self._deliver, log_filter)
+
+    def _deliver(self, entry: LogEntry) -> None:
+        """Called on the log writer thread"""
+        try:
+            self.loop.call_soon_threadsafe(self._enqueue, entry)
+        except RuntimeError:
+            # Event loop closed
+            self.close()
+
+    def _enqueue(self, entry: LogEntry) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(entry)
+
+    def close(self) -> None:
+        """Stop receiving entries"""
+        self._buffer.unsubscribe(self._token)
+
+    def __aiter__(self) -> 'LogSubscription':
+        return self
+
+    async def __anext__(self) -> LogEntry:
+        return await self.queue.get()
+
+
+class LogBuffer:
+    """
+    <summary>
+    Ring buffer of the most recent log entries. Appends happen on the log
+    writer thread; queries copy matching entries under a short lock, and
+    subscribers are only called for entries that pass their filter.
+    </summary>
+    """
+
+    def __init__(self, capacity: int = ZoloConstants.LOG_BUFFER_SIZE) -> None:
+        """
+        <summary>Initialize empty ring buffer</summary>
+        <param name="capacity">Number of most recent entries kept</param>
+        <returns>None</returns>
+        """
+        self.capacity = capacity
+        self._entries: List[Optional[LogEntry]] = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, tuple] = {}
+        self._subscriber_ids = itertools.count(1)
+        # Lowest level any subscriber wants; entries below skip fan-out entirely
+        self._subscriber_min_level = logging.CRITICAL + 1
+
+    def extend(self, records: Iterable[logging.LogRecord]) -> None:
+        """
+        <summary>Append a batch of records and notify matching subscribers</summary>
+        <param name="records">Log records (messages already rendered)</param>
+        <returns>None</returns>
+        """
+        added = []
+        with self._lock:
+            for record in records:
+                entry = LogEntry(next(self._seq), record)
+                self._entries[self._next] = entry
+                self._next = (self._next + 1) % self.capacity
+                self._count = min(self._count + 1, self.capacity)
+                if entry.levelno >= self._subscriber_min_level:
+                    added.append(entry)
+            subscribers = list(self._subscribers.values()) if added else []
+
+        for callback, log_filter in subscribers:
+            for entry in added:
+                if log_filter.matches(entry):
+                    try:
+                        callback(entry)
+                    except Exception:
+                        pass
+
+    def query(self, log_filter: Optional[LogFilter] = None, limit: Optional[int] = None) -> List[LogEntry]:
+        """
+        <summary>Get buffered entries matching a filter, oldest first</summary>
+        <param name="log_filter">Optional filter</param>
+        <param name="limit">Optional maximum number of (most recent) entries</param>
+        <returns>List of log entries</returns>
+        """
+        with self._lock:
+            start = (self._next - self._count) % self.capacity
+            entries = [self._entries[(start + i) % self.capacity] for i in range(self._count)]
+
+        if log_filter is not None:
+            entries = [entry for entry in entries if log_filter.matches(entry)]
+        if limit is not None:
+            entries = entries[-limit:] if limit > 0 else []
+        return entries
+
+    def subscribe(self, callback: Callable[[LogEntry], None], log_filter: Optional[LogFilter] = None) -> int:
+        """
+        <summary>Call callback (on the log writer thread) for each new matching entry</summary>
+        <param name="callback">Callable receiving a LogEntry; must not block</param>
+        <param name="log_filter">Optional filter</param>
+        <returns>Subscription token for unsubscribe()</returns>
+        """
+        log_filter = log_filter or LogFilter()
+        with self._lock:
+            token = next(self._subscriber_ids)
+            self._subscribers[token] = (callback, log_filter)
+            self._update_min_level()
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """
+        <summary>Remove a subscription</summary>
+        <param name="token">Token returned by subscribe()</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._subscribers.pop(token, None)
+            self._update_min_level()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        <summary>Get buffer fill and subscriber count</summary>
+        <returns>Dictionary of counters</returns>
+        """
+        with self._lock:
+            return {'capacity': self.capacity, 'buffered': self._count, 'subscribers': len(self._subscribers)}
+
+    def _update_min_level(self) -> None:
+        """Recompute the fan-out level threshold (caller holds the lock)"""
+        self._subscriber_min_level = min(
+            (log_filter.min_level for _, log_filter in self._subscribers.values()),
+            default=logging.CRITICAL + 1
+        )
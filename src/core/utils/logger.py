@@ -1,16 +1,249 @@
 """
 <summary>
-Logging utility for Zolo robot system
+Logging utility for Zolo robot system. Log calls only enqueue the record; one
+process-wide background writer formats, batches, flushes and rotates, and
+keeps recent records in an in-memory ring buffer for queries and streaming.
 </summary>
 <hardware>Generic logging for all system components</hardware>
-<dependencies>logging</dependencies>
+<dependencies>logging, queue, threading</dependencies>
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
 from pathlib import Path
 
+from ..constants.global_constants import ZoloConstants
+from .log_buffer import LogBuffer, LogEntry, LogFilter, LogSubscription
+from .metrics import Sample, metrics
+
+
+class _DroppingQueueHandler(logging.Handler):
+    """
+    <summary>
+    Hands records to the writer queue without ever blocking. As the queue
+    fills, records are dropped by level: DEBUG/INFO first, then WARNING;
+    ERROR and CRITICAL keep the remaining headroom.
+    </summary>
+    """
+
+    def __init__(self, records: "queue.Queue", capacity: int) -> None:
+        super().__init__()
+        self.records = records
+        self.info_limit = int(capacity * ZoloConstants.LOG_DROP_THRESHOLD_INFO)
+        self.warning_limit = int(capacity * ZoloConstants.LOG_DROP_THRESHOLD_WARNING)
+        self.dropped: Dict[str, int] = {}
+        self._dropped_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno < logging.ERROR:
+                limit = self.info_limit if record.levelno < logging.WARNING else self.warning_limit
+                if self.records.qsize() >= limit:
+                    self._drop(record)
+                    return
+
+            # Render message and traceback now; args and frames may change or
+            # be released once the caller returns
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+
+            self.records.put_nowait(record)
+        except queue.Full:
+            self._drop(record)
+        except Exception:
+            self.handleError(record)
+
+    def _drop(self, record: logging.LogRecord) -> None:
+        with self._dropped_lock:
+            self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+    def take_dropped(self) -> Dict[str, int]:
+        """Return and reset drop counters"""
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, {}
+        return dropped
+
+
+class _LogWriter:
+    """
+    <summary>
+    Process-wide background writer: drains the queue in batches, writes each
+    batch to stdout and the log file with one flush, rotates by size
+    </summary>
+    """
+
+    _STOP = object()
+
+    def __init__(self) -> None:
+        self.records: "queue.Queue" = queue.Queue(maxsize=ZoloConstants.LOG_QUEUE_SIZE)
+        self.handler = _DroppingQueueHandler(self.records, ZoloConstants.LOG_QUEUE_SIZE)
+        self.formatter = logging.Formatter(ZoloConstants.LOG_FORMAT)
+        self.console: TextIO = sys.stdout
+        self.log_path: Optional[Path] = None
+        self.file: Optional[TextIO] = None
+        self.file_size = 0
+        self.stats = {'written': 0, 'batches': 0, 'rotations': 0, 'dropped': 0}
+        self.buffer = LogBuffer()
+        self._open_file()
+
+        self.thread = threading.Thread(target=self._run, name="zolo-log-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def _open_file(self) -> None:
+        """Open the log file, falling back to the working directory"""
+        for path in (Path(ZoloConstants.LOG_FILE_PATH), Path(ZoloConstants.LOG_FALLBACK_FILE_PATH)):
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self.file = open(path, 'a', encoding='utf-8')
+                self.log_path = path
+                self.file_size = self.file.tell()
+                return
+            except OSError:
+                continue
+
+    def _run(self) -> None:
+        """Writer loop"""
+        while True:
+            try:
+                first = self.records.get(timeout=ZoloConstants.LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                self._report_dropped()
+                continue
+
+            batch = [first]
+            while len(batch) < ZoloConstants.LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.records.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Control items: _STOP ends the writer, an Event marks a flush point
+            self._write([item for item in batch if isinstance(item, logging.LogRecord)])
+            self._report_dropped()
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if any(item is self._STOP for item in batch):
+                return
+
+    def _report_dropped(self) -> None:
+        """Write one line summarizing records dropped since the last report"""
+        dropped = self.handler.take_dropped()
+        if not dropped:
+            return
+        self.stats['dropped'] += sum(dropped.values())
+        record = logging.LogRecord(
+            "ZoloLogger", logging.WARNING, __file__, 0,
+            f"Log queue full, dropped records: {dropped}", None, None
+        )
+        self._write([record])
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        """Format and write one batch with a single flush per destination"""
+        if not batch:
+            return
+        self.buffer.extend(batch)
+        text = "".join(self.formatter.format(record) + "\n" for record in batch)
+        try:
+            self.console.write(text)
+            self.console.flush()
+        except Exception:
+            pass
+
+        if self.file:
+            try:
+                self.file.write(text)
+                self.file.flush()
+                self.file_size += len(text.encode('utf-8'))
+                if self.file_size >= ZoloConstants.LOG_MAX_BYTES:
+                    self._rotate()
+            except OSError:
+                pass
+        self.stats['written'] += len(batch)
+        self.stats['batches'] += 1
+
+    def _rotate(self) -> None:
+        """Size-based rotation: zolo.log -> zolo.log.1 -> ... -> zolo.log.N"""
+        self.file.close()
+        for index in range(ZoloConstants.LOG_BACKUP_COUNT - 1, 0, -1):
+            source = self.log_path.with_name(f"{self.log_path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.log_path.with_name(f"{self.log_path.name}.{index + 1}"))
+        if ZoloConstants.LOG_BACKUP_COUNT > 0:
+            os.replace(self.log_path, self.log_path.with_name(f"{self.log_path.name}.1"))
+        else:
+            self.log_path.unlink()
+        self.file = open(self.log_path, 'a', encoding='utf-8')
+        self.file_size = 0
+        self.stats['rotations'] += 1
+
+    def flush(self, timeout: float = ZoloConstants.LOG_FLUSH_TIMEOUT) -> bool:
+        """
+        <summary>Wait until everything enqueued so far is written</summary>
+        <param name="timeout">Maximum wait in seconds</param>
+        <returns>True if flushed, False on timeout</returns>
+        """
+        if not self.thread.is_alive():
+            return False
+        marker = threading.Event()
+        try:
+            self.records.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def close(self) -> None:
+        """Drain the queue and stop the writer (registered with atexit)"""
+        if not self.thread.is_alive():
+            return
+        try:
+            self.records.put(self._STOP, timeout=ZoloConstants.LOG_FLUSH_TIMEOUT)
+        except queue.Full:
+            return
+        self.thread.join(ZoloConstants.LOG_FLUSH_TIMEOUT)
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+_writer: Optional[_LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _LogWriter:
+    """Get the process-wide log writer, starting it on first use"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _LogWriter()
+                metrics.register_collector(_collect_log_metrics)
+    return _writer
+
+
+def _collect_log_metrics() -> Iterable[Sample]:
+    """Export log writer counters"""
+    writer = _get_writer()
+    yield ("zolo_log_records_written_total", 'counter', "Records written by the log writer", {},
+           writer.stats['written'])
+    yield ("zolo_log_records_dropped_total", 'counter', "Records dropped because the log queue was full", {},
+           writer.stats['dropped'])
+    yield ("zolo_log_batches_total", 'counter', "Batches written by the log writer", {}, writer.stats['batches'])
+    yield ("zolo_log_rotations_total", 'counter', "Log file rotations", {}, writer.stats['rotations'])
+    yield ("zolo_log_queued", 'gauge', "Records waiting for the log writer", {}, writer.records.qsize())
+    yield ("zolo_log_buffered", 'gauge', "Records held in the in-memory log buffer", {},
+           writer.buffer.get_stats()['buffered'])
+
 
 class ZoloLogger:
     """
@@ -18,7 +251,7 @@ class ZoloLogger:
     Centralized logging system for Zolo robot components
     </summary>
     """
-    
+
     def __init__(self, name: str, log_level: str = "INFO") -> None:
         """
         <summary>Initialize logger with specified name and level</summary>
@@ -28,50 +261,146 @@ class ZoloLogger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File handler (if possible)
-        try:
-            log_file = Path("/var/log/zolo/zolo.log")
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-        except PermissionError:
-            # Fallback to local file
-            file_handler = logging.FileHandler("zolo.log")
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-    
+
+        # One shared queue handler per logger, however often it is constructed
+        handler = _get_writer().handler
+        if handler not in self.logger.handlers:
+            self.logger.addHandler(handler)
+        self.logger.propagate = False
+
+    @staticmethod
+    def flush(timeout: float = ZoloConstants.LOG_FLUSH_TIMEOUT) -> bool:
+        """
+        <summary>Block until queued records are written (e.g., before exiting)</summary>
+        <param name="timeout">Maximum wait in seconds</param>
+        <returns>True if flushed, False on timeout</returns>
+        """
+        return _get_writer().flush(timeout)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """
+        <summary>Get writer counters (written, batches, rotations, dropped, queued)</summary>
+        <returns>Dictionary of counters</returns>
+        """
+        writer = _get_writer()
+        stats = dict(writer.stats)
+        stats['queued'] = writer.records.qsize()
+        stats['log_file'] = str(writer.log_path) if writer.log_path else None
+        stats['buffer'] = writer.buffer.get_stats()
+        return stats
+
+    @staticmethod
+    def query_logs(level: Optional[str] = None, components: Optional[Iterable[str]] = None,
+                   since: Optional[float] = None, until: Optional[float] = None,
+                   after_seq: Optional[int] = None, limit: Optional[int] = None) -> List[LogEntry]:
+        """
+        <summary>Get recent records from the in-memory buffer (serves HEALTH_LOGS)</summary>
+        <param name="level">Minimum level name</param>
+        <param name="components">Component (logger) names to include</param>
+        <param name="since">Earliest timestamp (epoch seconds)</param>
+        <param name="until">Latest timestamp (epoch seconds)</param>
+        <param name="after_seq">Only records newer than this sequence number</param>
+        <param name="limit">Maximum number of most recent records</param>
+        <returns>Matching log entries, oldest first</returns>
+        """
+        log_filter = LogFilter(level, components, since, until, after_seq)
+        return _get_writer().buffer.query(log_filter, limit)
+
+    @staticmethod
+    def subscribe_logs(callback: Callable[[LogEntry], None], level: Optional[str] = None,
+                       components: Optional[Iterable[str]] = None) -> int:
+        """
+        <summary>Call callback on the writer thread for each new matching record</summary>
+        <param name="callback">Callable receiving a LogEntry; must not block or log</param>
+        <param name="level">Minimum level name</param>
+        <param name="components">Component (logger) names to include</param>
+        <returns>Subscription token for unsubscribe_logs()</returns>
+        """
+        return _get_writer().buffer.subscribe(callback, LogFilter(level, components))
+
+    @staticmethod
+    def unsubscribe_logs(token: int) -> None:
+        """
+        <summary>Remove a log subscription</summary>
+        <param name="token">Token returned by subscribe_logs()</param>
+        <returns>None</returns>
+        """
+        _get_writer().buffer.unsubscribe(token)
+
+    @staticmethod
+    def stream_logs(level: Optional[str] = None, components: Optional[Iterable[str]] = None) -> LogSubscription:
+        """
+        <summary>Async iterator of new matching records (serves WS_SYSTEM_LOGS); call from a running event loop</summary>
+        <param name="level">Minimum level name</param>
+        <param name="components">Component (logger) names to include</param>
+        <returns>Log subscription; close() it when the client disconnects</returns>
+        """
+        return LogSubscription(_get_writer().buffer, LogFilter(level, components))
+
     def debug(self, message: str) -> None:
         """Log debug message"""
         self.logger.debug(message)
-    
+
     def info(self, message: str) -> None:
         """Log info message"""
         self.logger.info(message)
-    
+
     def warning(self, message: str) -> None:
         """Log warning message"""
         self.logger.warning(message)
-    
+
     def error(self, message: str) -> None:
         """Log error message"""
         self.logger.error(message)
-    
+
     def critical(self, message: str) -> None:
         """Log critical message"""
         self.logger.critical(message)
-    
+
     def exception(self, message: str) -> None:
         """Log exception with traceback"""
-        self.logger.exception(message)
\ No newline at end of file
+        self.logger.exception(message)
+
+
+if __name__ == "__main__":
+    # Hot-path cost of one log call: queue handler vs. the previous
+    # synchronous stdout + file handlers (console output discarded)
+    import tempfile
+
+    def measure(logger: logging.Logger, count: int) -> List[float]:
+        samples = []
+        for i in range(count):
+            started = time.perf_counter()
+            logger.info(f"distance reading {i}: {i * 0.1:.1f}cm")
+            samples.append(time.perf_counter() - started)
+        samples.sort()
+        return samples
+
+    def describe(label: str, samples: List[float]) -> None:
+        print(f"  {label:<12} p50={samples[len(samples) // 2] * 1e6:6.1f}us "
+              f"p99={samples[int(len(samples) * 0.99)] * 1e6:7.1f}us "
+              f"max={samples[-1] * 1e6:8.1f}us")
+
+    count = 5000
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, 'w') as devnull:
+        sync_logger = logging.getLogger("bench.sync")
+        sync_logger.propagate = False
+        formatter = logging.Formatter(ZoloConstants.LOG_FORMAT)
+        for handler in (logging.StreamHandler(devnull), logging.FileHandler(Path(directory) / "sync.log")):
+            handler.setFormatter(formatter)
+            sync_logger.addHandler(handler)
+        sync_logger.setLevel(logging.INFO)
+        sync_samples = measure(sync_logger, count)
+
+        ZoloConstants.LOG_FILE_PATH = str(Path(directory) / "zolo.log")
+        queued = ZoloLogger("bench.queued")
+        _get_writer().console = devnull
+        queued_samples = measure(queued.logger, count)
+        flushed = ZoloLogger.flush()
+
+        print(f"Log call cost on the calling thread ({count} calls)")
+        describe("synchronous", sync_samples)
+        describe("queued", queued_samples)
+        print(f"  writer: {ZoloLogger.get_stats()} (flushed={flushed})")
+        _get_writer().close()
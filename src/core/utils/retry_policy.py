@@ -0,0 +1,279 @@
+"""
+<summary>
+Retry policy with exponential backoff and jitter, and per-device circuit breakers
+that fail fast while a device is down and probe it in the background
+</summary>
+<hardware>Generic fault handling for all hardware components</hardware>
+<dependencies>random, threading, time</dependencies>
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ..constants.global_constants import ZoloConstants
+from .metrics import Sample, metrics
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a device whose circuit breaker is open"""
+
+
+class RetryPolicy:
+    """
+    <summary>
+    Exponential backoff with full jitter: attempt n waits a random time in
+    [0, min(max_delay, base_delay * 2^n)]
+    </summary>
+    """
+
+    __slots__ = ('max_retries', 'base_delay', 'max_delay', '_random')
+
+    def __init__(self, max_retries: int = ZoloConstants.MAX_SENSOR_RETRIES,
+                 base_delay: float = ZoloConstants.RETRY_BASE_DELAY,
+                 max_delay: float = ZoloConstants.RETRY_MAX_DELAY) -> None:
+        """
+        <summary>Create retry policy</summary>
+        <param name="max_retries">Retries after the first attempt</param>
+        <param name="base_delay">Backoff before the first retry (upper bound, seconds)</param>
+        <param name="max_delay">Backoff cap in seconds</param>
+        <returns>None</returns>
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._random = random.Random()
+
+    def delay(self, attempt: int) -> float:
+        """
+        <summary>Backoff before retry number attempt (0-based)</summary>
+        <param name="attempt">Retry index</param>
+        <returns>Delay in seconds</returns>
+        """
+        return self._random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    <summary>
+    Per-device breaker. After failure_threshold consecutive failed calls it
+    opens and calls fail fast; a background probe (or, without a probe, a
+    single trial call after reset_timeout) decides when the device is back.
+    </summary>
+    """
+
+    _registry: Dict[str, 'CircuitBreaker'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, name: str, failure_threshold: int = ZoloConstants.CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = ZoloConstants.CIRCUIT_RESET_TIMEOUT) -> None:
+        """
+        <summary>Create circuit breaker (use CircuitBreaker.get for the shared per-device instance)</summary>
+        <param name="name">Device name</param>
+        <param name="failure_threshold">Consecutive failed calls before opening</param>
+        <param name="reset_timeout">Seconds before the first probe after opening</param>
+        <returns>None</returns>
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = ZoloConstants.CIRCUIT_CLOSED
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_at = 0.0
+        self._probe: Optional[Callable[[], Any]] = None
+        self._probe_timer: Optional[threading.Timer] = None
+        self._probe_attempts = 0
+        self._trial_in_flight = False
+        self.metrics = {
+            'calls': 0,
+            'retries': 0,
+            'failures': 0,
+            'fast_failures': 0,
+            'opened': 0,
+            'probes': 0,
+            'downtime': 0.0,
+        }
+
+    @classmethod
+    def get(cls, name: str) -> 'CircuitBreaker':
+        """
+        <summary>Get the shared breaker for a device</summary>
+        <param name="name">Device name</param>
+        <returns>Circuit breaker</returns>
+        """
+        with cls._registry_lock:
+            breaker = cls._registry.get(name)
+            if breaker is None:
+                breaker = cls._registry[name] = cls(name)
+            return breaker
+
+    @classmethod
+    def get_all_metrics(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        <summary>Get retry and failure metrics of every device breaker</summary>
+        <returns>Dictionary mapping device name to metrics</returns>
+        """
+        with cls._registry_lock:
+            breakers = list(cls._registry.values())
+        return {breaker.name: breaker.get_metrics() for breaker in breakers}
+
+    def allow(self) -> bool:
+        """
+        <summary>Check whether a call may reach the device (counts fast failures)</summary>
+        <returns>True if the call may proceed, False to fail fast</returns>
+        """
+        with self._lock:
+            self.metrics['calls'] += 1
+            if self.state == ZoloConstants.CIRCUIT_OPEN:
+                if self._probe is None and time.monotonic() >= self._trial_at:
+                    # No background probe - let this call through as the trial
+                    self.state = ZoloConstants.CIRCUIT_HALF_OPEN
+                    self._trial_in_flight = True
+                    return True
+                self.metrics['fast_failures'] += 1
+                return False
+            if self.state == ZoloConstants.CIRCUIT_HALF_OPEN and self._trial_in_flight:
+                # One trial at a time - the rest fail fast until it reports back
+                self.metrics['fast_failures'] += 1
+                return False
+            return True
+
+    def record_retry(self) -> None:
+        """Count one retry attempt"""
+        with self._lock:
+            self.metrics['retries'] += 1
+
+    def record_success(self) -> None:
+        """
+        <summary>Record a successful call and close the breaker</summary>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self._consecutive_failures = 0
+            if self.state != ZoloConstants.CIRCUIT_CLOSED:
+                self._close()
+
+    def record_failure(self, probe: Optional[Callable[[], Any]] = None) -> None:
+        """
+        <summary>Record a failed call (after retries) and open the breaker at the threshold</summary>
+        <param name="probe">Optional callable checking the device; run in the background while open</param>
+        <returns>None</returns>
+        """
+        with self._lock:
+            self.metrics['failures'] += 1
+            self._consecutive_failures += 1
+            if self.state == ZoloConstants.CIRCUIT_HALF_OPEN or (
+                    self.state == ZoloConstants.CIRCUIT_CLOSED
+                    and self._consecutive_failures >= self.failure_threshold):
+                self._open(probe)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        <summary>Get breaker state and counters</summary>
+        <returns>Dictionary of metrics (downtime in seconds)</returns>
+        """
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics['state'] = self.state
+            if self._opened_at is not None:
+                metrics['downtime'] += time.monotonic() - self._opened_at
+        return metrics
+
+    def _open(self, probe: Optional[Callable[[], Any]]) -> None:
+        """Open the breaker (caller holds the lock)"""
+        if self._opened_at is None:
+            self._opened_at = time.monotonic()
+            self.metrics['opened'] += 1
+        self.state = ZoloConstants.CIRCUIT_OPEN
+        self._trial_in_flight = False
+        # A failed trial restarts the wait
+        self._trial_at = time.monotonic() + self.reset_timeout
+        self._probe = probe
+        self._probe_attempts = 0
+        if probe is not None:
+            self._schedule_probe(self.reset_timeout)
+
+    def _close(self) -> None:
+        """Close the breaker (caller holds the lock)"""
+        if self._opened_at is not None:
+            self.metrics['downtime'] += time.monotonic() - self._opened_at
+        self._opened_at = None
+        self.state = ZoloConstants.CIRCUIT_CLOSED
+        self._trial_in_flight = False
+        self._probe = None
+        if self._probe_timer:
+            self._probe_timer.cancel()
+            self._probe_timer = None
+
+    def _schedule_probe(self, delay: float) -> None:
+        """Arm the background probe timer (caller holds the lock)"""
+        self._probe_timer = threading.Timer(delay, self._run_probe)
+        self._probe_timer.daemon = True
+        self._probe_timer.name = f"zolo-probe-{self.name}"
+        self._probe_timer.start()
+
+    def _run_probe(self) -> None:
+        """
+        <summary>Background probe: close on success, back off and re-arm on failure</summary>
+        <returns>None</returns>
+        """
+        with self._lock:
+            probe = self._probe
+            if self.state != ZoloConstants.CIRCUIT_OPEN or probe is None:
+                return
+            self.metrics['probes'] += 1
+
+        try:
+            healthy = probe() is not False
+        except Exception:
+            healthy = False
+
+        with self._lock:
+            if self.state != ZoloConstants.CIRCUIT_OPEN or self._probe is not probe:
+                return
+            if healthy:
+                self._consecutive_failures = 0
+                self._close()
+            else:
+                self._probe_attempts += 1
+                self._schedule_probe(min(
+                    ZoloConstants.CIRCUIT_PROBE_MAX_INTERVAL,
+                    self.reset_timeout * (2 ** self._probe_attempts)
+                ))
+
+
+_BREAKER_METRIC_HELP = {
+    'calls': "Calls made to the device",
+    'retries': "Retry attempts",
+    'failures': "Calls that failed after all retries",
+    'fast_failures': "Calls rejected while the circuit was open",
+    'opened': "Times the circuit opened",
+    'probes': "Background health probes",
+}
+
+_CIRCUIT_STATE_VALUES = {
+    ZoloConstants.CIRCUIT_CLOSED: 0,
+    ZoloConstants.CIRCUIT_HALF_OPEN: 1,
+    ZoloConstants.CIRCUIT_OPEN: 2,
+}
+
+
+def _collect_breaker_metrics() -> Iterable[Sample]:
+    """Export per-device retry and circuit breaker counters"""
+    for device, device_metrics in CircuitBreaker.get_all_metrics().items():
+        labels = {'device': device}
+        for key, value in device_metrics.items():
+            if key == 'state':
+                yield ("zolo_device_circuit_state", 'gauge', "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+                       labels, _CIRCUIT_STATE_VALUES[value])
+            elif key == 'downtime':
+                yield ("zolo_device_downtime_seconds_total", 'counter', "Time spent with the circuit open",
+                       labels, value)
+            else:
+                yield (f"zolo_device_{key}_total", 'counter', _BREAKER_METRIC_HELP.get(key, ""), labels, value)
+
+
+metrics.register_collector(_collect_breaker_metrics)
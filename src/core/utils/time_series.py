@@ -0,0 +1,366 @@
+"""
+<summary>
+Fixed-memory sensor history: preallocated numpy ring buffers per channel with
+raw samples plus 1 s and 1 min aggregates, and range queries for charts
+</summary>
+<hardware>Generic - stores readings of any sensor implementing SensorInterface</hardware>
+<dependencies>numpy, threading</dependencies>
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..constants.global_constants import ZoloConstants
+from ..interfaces.sensor_interface import SensorInterface, SensorSample
+from .lazy_import import lazy_import
+from .logger import ZoloLogger
+from .metrics import metrics
+
+np = lazy_import("numpy")
+
+# Record layouts: 12 bytes per raw sample, 24 bytes per aggregate
+_RAW_FIELDS = [('t', 'f8'), ('v', 'f4')]
+_AGGREGATE_FIELDS = [('t', 'f8'), ('min', 'f4'), ('max', 'f4'), ('mean', 'f4'), ('count', 'u4')]
+
+
+class RingBuffer:
+    """
+    <summary>
+    Preallocated ring of structured records appended in time order. The
+    stored records form at most two time-sorted segments, so a range query
+    is two binary searches and a slice copy.
+    </summary>
+    """
+
+    def __init__(self, capacity: int, fields: list) -> None:
+        """
+        <summary>Allocate the ring</summary>
+        <param name="capacity">Records kept (oldest are overwritten)</param>
+        <param name="fields">numpy structured dtype fields, the first one named 't'</param>
+        <returns>None</returns>
+        """
+        self.capacity = max(1, int(capacity))
+        self.data = np.zeros(self.capacity, dtype=fields)
+        self.head = 0  # next write position
+        self.size = 0
+
+    def append(self, record: tuple) -> None:
+        """
+        <summary>Store one record, overwriting the oldest when full</summary>
+        <param name="record">Field values in dtype order</param>
+        <returns>None</returns>
+        """
+        self.data[self.head] = record
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def oldest_time(self) -> Optional[float]:
+        """Timestamp of the oldest record, None if empty"""
+        if not self.size:
+            return None
+        return float(self.data['t'][self.head if self.size == self.capacity else 0])
+
+    def covers(self, start: float) -> bool:
+        """True if no record at or after start was overwritten yet"""
+        return self.size < self.capacity or self.oldest_time() <= start
+
+    def range(self, start: float, end: float) -> "np.ndarray":
+        """
+        <summary>Copy the records with start <= t <= end</summary>
+        <param name="start">Range start (epoch seconds)</param>
+        <param name="end">Range end (epoch seconds)</param>
+        <returns>Structured array in time order</returns>
+        """
+        if self.size < self.capacity:
+            segments = (self.data[:self.size],)
+        else:
+            segments = (self.data[self.head:], self.data[:self.head])
+
+        parts = []
+        for segment in segments:
+            times = segment['t']
+            low = np.searchsorted(times, start, 'left')
+            high = np.searchsorted(times, end, 'right')
+            if high > low:
+                parts.append(segment[low:high])
+        if not parts:
+            return np.empty(0, dtype=self.data.dtype)
+        return np.concatenate(parts) if len(parts) > 1 else parts[0].copy()
+
+
+class _Channel:
+    """History of one channel: raw ring plus second and minute aggregate rings"""
+
+    def __init__(self, rate_hz: float) -> None:
+        self.rate_hz = rate_hz
+        self.raw = RingBuffer(rate_hz * ZoloConstants.SENSOR_HISTORY_RAW_SECONDS, _RAW_FIELDS)
+        self.seconds = RingBuffer(ZoloConstants.SENSOR_HISTORY_SECONDS_KEPT, _AGGREGATE_FIELDS)
+        self.minutes = RingBuffer(ZoloConstants.SENSOR_HISTORY_MINUTES_KEPT, _AGGREGATE_FIELDS)
+        # Open buckets: [start, min, max, sum, count]
+        self.second: Optional[list] = None
+        self.minute: Optional[list] = None
+        self.last_time = -math.inf
+        self.last_value: Optional[float] = None
+        self.out_of_order = 0
+        self.lock = threading.Lock()
+
+    def append(self, timestamp: float, value: float) -> None:
+        with self.lock:
+            if timestamp < self.last_time:
+                # Rings must stay time-sorted for binary search
+                self.out_of_order += 1
+                return
+            self.last_time = timestamp
+            self.last_value = value
+            self.raw.append((timestamp, value))
+
+            second = self.second
+            start = math.floor(timestamp)
+            if second is not None and second[0] == start:
+                if value < second[1]:
+                    second[1] = value
+                if value > second[2]:
+                    second[2] = value
+                second[3] += value
+                second[4] += 1
+                return
+            if second is not None:
+                self._close_second(second)
+            self.second = [start, value, value, value, 1]
+
+    def _close_second(self, second: list) -> None:
+        """Store a finished second and fold it into the open minute"""
+        start, low, high, total, count = second
+        self.seconds.append((start, low, high, total / count, count))
+
+        minute = self.minute
+        minute_start = start - start % 60
+        if minute is not None and minute[0] == minute_start:
+            minute[1] = min(minute[1], low)
+            minute[2] = max(minute[2], high)
+            minute[3] += total
+            minute[4] += count
+            return
+        if minute is not None:
+            self.minutes.append((minute[0], minute[1], minute[2], minute[3] / minute[4], minute[4]))
+        self.minute = [minute_start, low, high, total, count]
+
+    def open_bucket(self, bucket: Optional[list], start: float, end: float) -> Optional[tuple]:
+        """Partial aggregate still being filled, if inside the range"""
+        if bucket is None or not start <= bucket[0] <= end:
+            return None
+        return (bucket[0], bucket[1], bucket[2], bucket[3] / bucket[4], bucket[4])
+
+    def nbytes(self) -> int:
+        return self.raw.data.nbytes + self.seconds.data.nbytes + self.minutes.data.nbytes
+
+
+class TimeSeriesStore:
+    """
+    <summary>
+    Sensor history for the dashboard (SENSOR_ALL / WS_SENSOR_DATA). Memory is
+    fixed when a channel is added; with the default retention a 30 Hz channel
+    keeps 10 minutes of raw samples, a day of 1 s aggregates and a week of
+    1 min aggregates in about 2.6 MB.
+    </summary>
+    """
+
+    RESOLUTION_RAW: str = "raw"
+    RESOLUTION_SECOND: str = "1s"
+    RESOLUTION_MINUTE: str = "1m"
+
+    def __init__(self) -> None:
+        """
+        <summary>Create an empty store (disabled without numpy)</summary>
+        <returns>None</returns>
+        """
+        self.logger = ZoloLogger("TimeSeriesStore")
+        self.enabled = np.is_available()
+        if not self.enabled:
+            self.logger.warning(f"Sensor history disabled: numpy unavailable ({np.get_error()})")
+        self._channels: Dict[str, _Channel] = {}
+        self._subscriptions: List[tuple] = []
+        # SensorSample timestamps are monotonic; history is kept in epoch seconds
+        self._clock_offset = time.time() - time.monotonic()
+        metrics.gauge("zolo_sensor_history_bytes", "Memory preallocated for sensor history").set_function(
+            lambda: sum(channel.nbytes() for channel in list(self._channels.values()))
+        )
+
+    def add_channel(self, name: str, rate_hz: float) -> bool:
+        """
+        <summary>Allocate a channel (no-op if it exists)</summary>
+        <param name="name">Channel name (e.g., 'distance')</param>
+        <param name="rate_hz">Expected sample rate; sizes the raw ring</param>
+        <returns>True if the channel is available, False if history is disabled</returns>
+        """
+        if not self.enabled:
+            return False
+        if name not in self._channels:
+            self._channels[name] = _Channel(rate_hz)
+        return True
+
+    def attach(self, name: str, sensor: SensorInterface, rate_hz: float) -> bool:
+        """
+        <summary>Record every valid sample the sensor publishes into a channel</summary>
+        <param name="name">Channel name</param>
+        <param name="sensor">Sensor to subscribe to</param>
+        <param name="rate_hz">Expected sample rate</param>
+        <returns>True if attached, False if history is disabled</returns>
+        """
+        if not self.add_channel(name, rate_hz):
+            return False
+        channel = self._channels[name]
+        offset = self._clock_offset
+
+        def record(sample: SensorSample) -> None:
+            if sample.value is not None:
+                channel.append(sample.timestamp + offset, sample.value)
+
+        self._subscriptions.append((sensor, sensor.subscribe(record)))
+        return True
+
+    def append(self, name: str, timestamp: float, value: float) -> None:
+        """
+        <summary>Add one sample to an existing channel</summary>
+        <param name="name">Channel name</param>
+        <param name="timestamp">Epoch seconds (non-decreasing per channel)</param>
+        <param name="value">Sample value</param>
+        <returns>None</returns>
+        """
+        channel = self._channels.get(name)
+        if channel is not None:
+            channel.append(timestamp, value)
+
+    def query(self, name: str, start: Optional[float] = None, end: Optional[float] = None,
+              resolution: Optional[str] = None,
+              max_points: int = ZoloConstants.SENSOR_HISTORY_MAX_POINTS) -> Optional[Dict[str, Any]]:
+        """
+        <summary>Get a channel's history over a time range</summary>
+        <param name="name">Channel name</param>
+        <param name="start">Range start in epoch seconds (default: SENSOR_HISTORY_DEFAULT_WINDOW before end)</param>
+        <param name="end">Range end in epoch seconds (default: now)</param>
+        <param name="resolution">'raw', '1s' or '1m'; default picks the finest one that covers the range
+        within max_points</param>
+        <param name="max_points">Upper bound on returned points (evenly thinned beyond it)</param>
+        <returns>Dictionary with 'resolution' and a structured 'data' array, None for an unknown channel</returns>
+        """
+        channel = self._channels.get(name)
+        if channel is None:
+            return None
+        end = time.time() if end is None else end
+        start = end - ZoloConstants.SENSOR_HISTORY_DEFAULT_WINDOW if start is None else start
+
+        with channel.lock:
+            if resolution is None:
+                resolution = self._pick_resolution(channel, start, end, max_points)
+            if resolution == self.RESOLUTION_RAW:
+                data = channel.raw.range(start, end)
+            else:
+                ring, bucket = ((channel.seconds, channel.second) if resolution == self.RESOLUTION_SECOND
+                                else (channel.minutes, channel.minute))
+                data = ring.range(start, end)
+                partial = channel.open_bucket(bucket, start, end)
+                if partial is not None:
+                    data = np.append(data, np.array([partial], dtype=data.dtype))
+
+        if max_points and len(data) > max_points:
+            data = data[::math.ceil(len(data) / max_points)]
+        return {'resolution': resolution, 'data': data}
+
+    def latest(self, name: str) -> Optional[Dict[str, float]]:
+        """
+        <summary>Get a channel's most recent sample</summary>
+        <param name="name">Channel name</param>
+        <returns>Dictionary with 't' and 'value', None if empty or unknown</returns>
+        """
+        channel = self._channels.get(name)
+        if channel is None or channel.last_value is None:
+            return None
+        return {'t': channel.last_time, 'value': channel.last_value}
+
+    def snapshot(self, window: float = ZoloConstants.SENSOR_HISTORY_DEFAULT_WINDOW,
+                 max_points: int = ZoloConstants.SENSOR_HISTORY_MAX_POINTS) -> Dict[str, Any]:
+        """
+        <summary>JSON-serializable recent history of every channel (SENSOR_ALL payload)</summary>
+        <param name="window">Seconds of history per channel</param>
+        <param name="max_points">Upper bound on points per channel</param>
+        <returns>Dictionary keyed by channel name</returns>
+        """
+        end = time.time()
+        payload = {}
+        for name in list(self._channels):
+            result = self.query(name, end - window, end, max_points=max_points)
+            data = result['data']
+            series = {'resolution': result['resolution'], 'latest': self.latest(name), 't': data['t'].tolist()}
+            if result['resolution'] == self.RESOLUTION_RAW:
+                series['value'] = data['v'].tolist()
+            else:
+                series['value'] = data['mean'].tolist()
+                series['min'] = data['min'].tolist()
+                series['max'] = data['max'].tolist()
+            payload[name] = series
+        return payload
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get per-channel fill levels and memory use</summary>
+        <returns>Dictionary of statistics</returns>
+        """
+        channels = {}
+        for name, channel in list(self._channels.items()):
+            channels[name] = {
+                'rate_hz': channel.rate_hz,
+                'raw': channel.raw.size,
+                'seconds': channel.seconds.size,
+                'minutes': channel.minutes.size,
+                'out_of_order': channel.out_of_order,
+                'bytes': channel.nbytes()
+            }
+        return {'enabled': self.enabled, 'channels': channels}
+
+    def close(self) -> None:
+        """
+        <summary>Stop recording (history stays queryable)</summary>
+        <returns>None</returns>
+        """
+        for sensor, token in self._subscriptions:
+            sensor.unsubscribe(token)
+        self._subscriptions = []
+
+    @classmethod
+    def _pick_resolution(cls, channel: _Channel, start: float, end: float, max_points: int) -> str:
+        """Finest resolution whose ring still covers start and whose point count fits"""
+        span = max(0.0, end - start)
+        # Upper bounds on the points each ring can return for the range
+        if channel.raw.covers(start) and (not max_points or min(span * channel.rate_hz, channel.raw.size) <= max_points):
+            return cls.RESOLUTION_RAW
+        if channel.seconds.covers(start) and (not max_points or min(span, channel.seconds.size + 1) <= max_points):
+            return cls.RESOLUTION_SECOND
+        return cls.RESOLUTION_MINUTE
+
+
+if __name__ == "__main__":
+    # A day of 30 Hz distance data, then typical chart queries
+    store = TimeSeriesStore()
+    store.add_channel("distance", 30.0)
+    now = time.time()
+    timestamps = now - 86400 + np.arange(86400 * 30) / 30.0
+    values = (800 + 400 * np.sin(timestamps / 60.0)).astype(np.float32).tolist()
+
+    started = time.perf_counter()
+    for timestamp, value in zip(timestamps.tolist(), values):
+        store.append("distance", timestamp, value)
+    elapsed = time.perf_counter() - started
+    print(f"append: {len(values)} samples in {elapsed:.1f}s ({elapsed / len(values) * 1e6:.2f} us/sample)")
+    print(f"memory: {store.get_stats()['channels']['distance']['bytes'] / 1e6:.2f} MB")
+
+    for label, window in (("5 min", 300), ("1 hour", 3600), ("1 day", 86400)):
+        runs = 200
+        started = time.perf_counter()
+        for _ in range(runs):
+            result = store.query("distance", now - window, now)
+        per_query = (time.perf_counter() - started) / runs
+        print(f"query {label:7s}: {per_query * 1e3:.3f} ms, {len(result['data'])} points at {result['resolution']}")
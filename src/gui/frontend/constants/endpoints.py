@@ -10,8 +10,15 @@ class APIEndpoints:
     ROBOT_STATUS = f"{BASE_API}/robot/status"
     ROBOT_EMERGENCY_STOP = f"{BASE_API}/robot/emergency"
     
+    # System Health
+    HEALTH_LOGS = f"{BASE_API}/health/logs"
+    HEALTH_METRICS = f"{BASE_API}/health/metrics"
+    WS_SYSTEM_LOGS = f"{BASE_WS}/system/logs"
+    
     # Sensors
     SENSOR_DATA = f"{BASE_API}/sensors/data"
+    SENSOR_ALL = f"{BASE_API}/sensors/all"
+    WS_SENSOR_DATA = f"{BASE_WS}/sensors/live"
     SENSOR_CALIBRATE = f"{BASE_API}/sensors/calibrate"
     CAMERA_CAPTURE = f"{BASE_API}/camera/capture"
     CAMERA_STREAM = f"{BASE_WS}/camera/stream"
@@ -8,13 +8,12 @@ Controls the 12-LED NeoPixel ring for visual feedback and status indication
 
 from typing import Tuple, List, Optional
 import time
-try:
-    import board
-    import neopixel
-except ImportError:
-    # Fallback for development environment
-    board = None
-    neopixel = None
+
+from src.core.utils.lazy_import import lazy_import
+
+# Imported on first initialize(); unavailable in development environment
+board = lazy_import("board", simulated="src.simulation.board")
+neopixel = lazy_import("neopixel", simulated="src.simulation.neopixel")
 
 from .constants import NeoPixelConstants
 
@@ -47,7 +46,7 @@ class NeoPixelController:
         <returns>True if successful, False otherwise</returns>
         """
         try:
-            if board and neopixel:
+            if board.is_available() and neopixel.is_available():
                 pin = getattr(board, f'D{self.pin_number}', None)
                 if pin:
                     self.pixels = neopixel.NeoPixel(pin, self.led_count, brightness=self.brightness)
@@ -67,7 +66,7 @@ class NeoPixelController:
         if not self.is_initialized:
             return False
         
-        # Skeleton implementation
+        self.pixels.fill(color)
         return True
     
     def set_pixel(self, index: int, color: Tuple[int, int, int]) -> bool:
@@ -80,7 +79,7 @@ class NeoPixelController:
         if not self.is_initialized or index >= self.led_count:
             return False
         
-        # Skeleton implementation
+        self.pixels[index] = color
         return True
     
     def clear(self) -> bool:
@@ -91,7 +90,7 @@ class NeoPixelController:
         if not self.is_initialized:
             return False
         
-        # Skeleton implementation
+        self.pixels.fill(NeoPixelConstants.COLOR_OFF)
         return True
     
     def set_brightness(self, brightness: float) -> bool:
@@ -104,6 +103,7 @@ class NeoPixelController:
             return False
         
         self.brightness = brightness
+        self.pixels.brightness = brightness
         return True
     
     def rainbow_cycle(self, speed: float = NeoPixelConstants.DEFAULT_ANIMATION_SPEED) -> bool:
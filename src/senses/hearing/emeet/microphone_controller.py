@@ -6,10 +6,19 @@ Controls the EMEET M0 Plus microphone for audio input and recording
 <dependencies>pyaudio, sounddevice</dependencies>
 """
 
+from __future__ import annotations
+
 from typing import Optional, List
-import pyaudio
-import sounddevice as sd
-import numpy as np
+
+from src.core.utils.hardware_utils import HardwareUtils
+from src.core.utils.lazy_import import lazy_import
+from src.core.utils.retry_policy import CircuitOpenError
+from .constants import MicrophoneConstants
+
+# Audio backends are imported on first initialize()
+pyaudio = lazy_import("pyaudio", simulated="src.simulation.pyaudio")
+sd = lazy_import("sounddevice")
+np = lazy_import("numpy")
 
 
 class MicrophoneController:
@@ -29,6 +38,7 @@ class MicrophoneController:
         self.sample_rate = sample_rate
         self.channels = channels
         self.audio = None
+        self.stream = None
         self.is_initialized = False
         self.is_recording = False
     
@@ -37,6 +47,10 @@ class MicrophoneController:
         <summary>Initialize microphone hardware and audio interface</summary>
         <returns>True if successful, False otherwise</returns>
         """
+        if not pyaudio.is_available():
+            print(f"Microphone initialization failed: pyaudio unavailable ({pyaudio.get_error()})")
+            return False
+        
         try:
             self.audio = pyaudio.PyAudio()
             self.is_initialized = True
@@ -54,9 +68,23 @@ class MicrophoneController:
         if not self.is_initialized:
             return None
         
-        # Skeleton implementation
+        chunk = MicrophoneConstants.DEFAULT_CHUNK_SIZE
+        duration = min(duration, MicrophoneConstants.MAX_RECORDING_DURATION)
         self.is_recording = True
-        return None
+        try:
+            stream = self._open_stream()
+            frames = []
+            for _ in range(int(self.sample_rate / chunk * duration)):
+                if not self.is_recording:
+                    break
+                frames.append(stream.read(chunk, exception_on_overflow=False))
+            stream.close()
+            return np.frombuffer(b"".join(frames), dtype=np.int16)
+        except Exception as e:
+            print(f"Recording failed: {e}")
+            return None
+        finally:
+            self.is_recording = False
     
     def stop_recording(self) -> bool:
         """
@@ -71,8 +99,54 @@ class MicrophoneController:
         <summary>Get current audio input level</summary>
         <returns>Audio level (0.0-1.0)</returns>
         """
-        # Skeleton implementation
-        return 0.0
+        if not self.is_initialized:
+            return 0.0
+        
+        try:
+            data = self._read_chunk()
+            samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+            return float(min(1.0, np.sqrt(np.mean(samples * samples))))
+        except CircuitOpenError:
+            return 0.0
+        except Exception as e:
+            print(f"Audio level read failed: {e}")
+            return 0.0
+    
+    @HardwareUtils.retry_on_failure(device=MicrophoneConstants.DEVICE_NAME, probe='_probe_input')
+    def _read_chunk(self) -> bytes:
+        """
+        <summary>Read one chunk from the monitoring stream, reopening it after a failure</summary>
+        <returns>Raw 16-bit PCM bytes</returns>
+        """
+        if self.stream is None:
+            self.stream = self._open_stream()
+        try:
+            return self.stream.read(MicrophoneConstants.DEFAULT_CHUNK_SIZE, exception_on_overflow=False)
+        except Exception:
+            self.stream.close()
+            self.stream = None
+            raise
+    
+    def _probe_input(self) -> bool:
+        """
+        <summary>Check that an input device is present (breaker probe - never opens a stream)</summary>
+        <returns>True if available</returns>
+        """
+        self.audio.get_default_input_device_info()
+        return True
+    
+    def _open_stream(self):
+        """
+        <summary>Open a 16-bit input stream on the default device</summary>
+        <returns>PyAudio input stream</returns>
+        """
+        return self.audio.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            frames_per_buffer=MicrophoneConstants.DEFAULT_CHUNK_SIZE
+        )
     
     def set_gain(self, gain: float) -> bool:
         """
@@ -97,6 +171,9 @@ class MicrophoneController:
         <summary>Clean up microphone resources</summary>
         <returns>None</returns>
         """
+        if self.stream:
+            self.stream.close()
+            self.stream = None
         if self.audio:
             self.audio.terminate()
             self.audio = None
@@ -1,6 +1,7 @@
 """Speech recognition for Zolo robot hearing system"""
 
 from .speech_recognizer import SpeechRecognizer
+from .intent_matcher import IntentMatcher
 from .constants import RecognitionConstants
 
-__all__ = ['SpeechRecognizer', 'RecognitionConstants']
\ No newline at end of file
+__all__ = ['SpeechRecognizer', 'IntentMatcher', 'RecognitionConstants']
\ No newline at end of file
@@ -23,6 +23,7 @@ class RecognitionConstants:
     DYNAMIC_ENERGY_THRESHOLD: bool = True
     DYNAMIC_ENERGY_ADJUSTMENT_DAMPING: float = 0.15
     DYNAMIC_ENERGY_RATIO: float = 1.5
+    AMBIENT_PROFILE_MAX_AGE: float = 6 * 3600.0  # Reuse a cached ambient noise calibration this long (seconds)
     
     # Wake word detection
     DEFAULT_WAKE_WORD: str = "zolo"
@@ -47,4 +48,28 @@ class RecognitionConstants:
         "play music", "stop music", "volume up", "volume down",
         "what time is it", "weather", "status",
         "shutdown", "restart", "sleep"
-    ]
\ No newline at end of file
+    ]
+    
+    # Command intents
+    INTENT_GREETING: str = "greeting"
+    INTENT_LIGHTS_ON: str = "lights_on"
+    INTENT_LIGHTS_OFF: str = "lights_off"
+    INTENT_RAINBOW: str = "rainbow"
+    INTENT_TAKE_PHOTO: str = "take_photo"
+    INTENT_DISTANCE: str = "distance"
+    INTENT_LIGHT_LEVEL: str = "light_level"
+    INTENT_SHUTDOWN: str = "shutdown"
+    
+    # Declarative command registry: intent -> trigger phrases (whole words).
+    # Order is priority - when several intents match, the first one wins.
+    # COMMON_COMMANDS not listed here are added as their own intents.
+    COMMAND_REGISTRY: dict = {
+        INTENT_GREETING: ["hello", "hi", "hey"],
+        INTENT_LIGHTS_ON: ["lights on"],
+        INTENT_LIGHTS_OFF: ["lights off"],
+        INTENT_RAINBOW: ["rainbow"],
+        INTENT_TAKE_PHOTO: ["take photo", "take a photo", "capture"],
+        INTENT_DISTANCE: ["distance"],
+        INTENT_LIGHT_LEVEL: ["brightness", "light level"],
+        INTENT_SHUTDOWN: ["shutdown", "goodbye"],
+    }
\ No newline at end of file
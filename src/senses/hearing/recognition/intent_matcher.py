@@ -0,0 +1,216 @@
+"""
+<summary>
+Compiled whole-word intent matcher for voice commands
+</summary>
+<hardware>Works with text output from the speech recognizer</hardware>
+<dependencies>re</dependencies>
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from .constants import RecognitionConstants
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+# Priority value used for "no intent"
+_NO_MATCH = 1 << 30
+
+
+class IntentMatcher:
+    """
+    <summary>
+    Matches command text against many trigger phrases in a single pass.
+    Phrases are compiled into a token-level Aho-Corasick automaton, so matching
+    is on whole words and its cost depends on the command length, not on the
+    number of registered intents.
+    </summary>
+    """
+
+    def __init__(self) -> None:
+        """
+        <summary>Create an empty matcher</summary>
+        <returns>None</returns>
+        """
+        self._intents: List[str] = []
+        self._phrases: List[tuple] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[int] = [_NO_MATCH]
+        self._compiled = True
+
+    @classmethod
+    def from_registry(cls, registry: Optional[Dict[str, List[str]]] = None,
+                      seed_commands: Optional[Iterable[str]] = None) -> 'IntentMatcher':
+        """
+        <summary>Build a compiled matcher from a declarative command registry</summary>
+        <param name="registry">Mapping of intent name to trigger phrases, in priority order</param>
+        <param name="seed_commands">Extra phrases registered as their own intents (lowest priority)</param>
+        <returns>Compiled intent matcher</returns>
+        """
+        if registry is None:
+            registry = RecognitionConstants.COMMAND_REGISTRY
+        if seed_commands is None:
+            seed_commands = RecognitionConstants.COMMON_COMMANDS
+
+        matcher = cls()
+        for intent, phrases in registry.items():
+            matcher.add_intent(intent, phrases)
+
+        known = {cls.tokenize(phrase) for phrases in registry.values() for phrase in phrases}
+        for phrase in seed_commands:
+            tokens = cls.tokenize(phrase)
+            if tokens and tokens not in known:
+                matcher.add_intent("_".join(tokens), [phrase])
+                known.add(tokens)
+
+        matcher.compile()
+        return matcher
+
+    @staticmethod
+    def tokenize(text: str) -> tuple:
+        """
+        <summary>Split text into lowercase word tokens</summary>
+        <param name="text">Input text</param>
+        <returns>Tuple of tokens</returns>
+        """
+        return tuple(_TOKEN_PATTERN.findall(text.lower()))
+
+    def add_intent(self, intent: str, phrases: Iterable[str]) -> None:
+        """
+        <summary>Register trigger phrases for an intent (lower priority than earlier intents)</summary>
+        <param name="intent">Intent name</param>
+        <param name="phrases">Trigger phrases</param>
+        <returns>None</returns>
+        """
+        if intent in self._intents:
+            priority = self._intents.index(intent)
+        else:
+            priority = len(self._intents)
+            self._intents.append(intent)
+
+        for phrase in phrases:
+            tokens = self.tokenize(phrase)
+            if not tokens:
+                continue
+            self._phrases.append((tokens, priority))
+
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(_NO_MATCH)
+                    self._goto[state][token] = next_state
+                state = next_state
+            self._output[state] = min(self._output[state], priority)
+        self._compiled = False
+
+    def compile(self) -> None:
+        """
+        <summary>Compute failure links (breadth-first) so matching needs a single pass</summary>
+        <returns>None</returns>
+        """
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(token, 0)
+                self._fail[child] = link if link != child else 0
+                # A state also matches everything its failure link matches
+                self._output[child] = min(self._output[child], self._output[self._fail[child]])
+        self._compiled = True
+
+    def match(self, text: str) -> Optional[str]:
+        """
+        <summary>Find the highest-priority intent whose phrase appears as whole words in text</summary>
+        <param name="text">Command text</param>
+        <returns>Intent name or None if nothing matched</returns>
+        """
+        if not self._compiled:
+            self.compile()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        best = _NO_MATCH
+        state = 0
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state] < best:
+                best = output[state]
+                if best == 0:
+                    break
+        return self._intents[best] if best != _NO_MATCH else None
+
+    def match_all(self, text: str) -> Set[str]:
+        """
+        <summary>Find every intent with a phrase in text</summary>
+        <param name="text">Command text</param>
+        <returns>Set of intent names</returns>
+        """
+        tokens = self.tokenize(text)
+        matched = set()
+        for phrase, priority in self._phrases:
+            width = len(phrase)
+            if any(tokens[i:i + width] == phrase for i in range(len(tokens) - width + 1)):
+                matched.add(self._intents[priority])
+        return matched
+
+    def get_intents(self) -> List[str]:
+        """
+        <summary>Get registered intents in priority order</summary>
+        <returns>List of intent names</returns>
+        """
+        return list(self._intents)
+
+
+if __name__ == "__main__":
+    # Micro-benchmark: compiled matcher vs. a linear substring scan as the
+    # number of registered intents grows
+    import random
+    import time
+
+    random.seed(7)
+    vocabulary = [f"word{i}" for i in range(2000)]
+    commands = [
+        " ".join(random.choice(vocabulary) for _ in range(random.randint(3, 12)))
+        for _ in range(5000)
+    ] + ["hello zolo", "turn the lights on please", "what is the distance", "this is shipping"]
+
+    print("Intent matcher benchmark (5004 commands)")
+    for extra_intents in (0, 100, 500, 1000):
+        registry = dict(RecognitionConstants.COMMAND_REGISTRY)
+        for i in range(extra_intents):
+            registry[f"custom_{i}"] = [" ".join(random.sample(vocabulary, 2))]
+
+        matcher = IntentMatcher.from_registry(registry)
+        started = time.perf_counter()
+        for command in commands:
+            matcher.match(command)
+        compiled = time.perf_counter() - started
+
+        flat = [(intent, phrase) for intent, phrases in registry.items() for phrase in phrases]
+        started = time.perf_counter()
+        for command in commands:
+            lowered = command.lower()
+            next((intent for intent, phrase in flat if phrase in lowered), None)
+        linear = time.perf_counter() - started
+
+        print(f"  {len(registry):5d} intents: compiled {compiled / len(commands) * 1e6:6.2f}us/cmd, "
+              f"linear scan {linear / len(commands) * 1e6:7.2f}us/cmd")
+
+    matcher = IntentMatcher.from_registry()
+    for sample in ("this is shipping", "hi there", "lights on", "take a photo"):
+        print(f"  {sample!r:24} -> {matcher.match(sample)}")
@@ -6,9 +6,19 @@ Speech recognition using Google Speech Recognition API and offline alternatives
 <dependencies>speech_recognition, pyaudio</dependencies>
 """
 
+from __future__ import annotations
+
+import json
+import time
 from typing import Optional, List
-import speech_recognition as sr
-import numpy as np
+
+from src.core.utils.disk_cache import get_shared_cache
+from src.core.utils.lazy_import import lazy_import
+from .constants import RecognitionConstants
+
+# Recognition engine is imported on first initialize()
+sr = lazy_import("speech_recognition", simulated="src.simulation.speech_recognition")
+np = lazy_import("numpy")
 
 
 class SpeechRecognizer:
@@ -25,8 +35,8 @@ class SpeechRecognizer:
         <returns>None</returns>
         """
         self.language = language
-        self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        self.recognizer = None
+        self.microphone = None
         self.is_initialized = False
     
     def initialize(self) -> bool:
@@ -34,15 +44,52 @@ class SpeechRecognizer:
         <summary>Initialize speech recognition engine</summary>
         <returns>True if successful, False otherwise</returns>
         """
+        if not sr.is_available():
+            print(f"Speech recognizer initialization failed: speech_recognition unavailable ({sr.get_error()})")
+            return False
+        
         try:
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source)
+            self.recognizer = sr.Recognizer()
+            self.microphone = sr.Microphone()
+            if not self._load_ambient_profile():
+                with self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(source)
+                self._save_ambient_profile()
             self.is_initialized = True
             return True
         except Exception as e:
             print(f"Speech recognizer initialization failed: {e}")
             return False
     
+    def _load_ambient_profile(self) -> bool:
+        """
+        <summary>Apply the ambient noise calibration cached by a previous start, if recent enough</summary>
+        <returns>True if a cached profile was applied, False otherwise</returns>
+        """
+        data = get_shared_cache().get(self._ambient_profile_key(), "ambient_profile")
+        if data is None:
+            return False
+        try:
+            profile = json.loads(data)
+            if time.time() - profile['measured_at'] > RecognitionConstants.AMBIENT_PROFILE_MAX_AGE:
+                return False
+            self.recognizer.energy_threshold = float(profile['energy_threshold'])
+            return True
+        except (ValueError, KeyError, TypeError):
+            return False
+    
+    def _save_ambient_profile(self) -> None:
+        """
+        <summary>Cache the ambient noise calibration for the next start</summary>
+        <returns>None</returns>
+        """
+        profile = {'energy_threshold': self.recognizer.energy_threshold, 'measured_at': time.time()}
+        get_shared_cache().put(self._ambient_profile_key(), json.dumps(profile).encode('utf-8'))
+    
+    def _ambient_profile_key(self) -> str:
+        """Cache key of the calibration for the current microphone"""
+        return get_shared_cache().make_key("ambient_profile", getattr(self.microphone, 'device_index', None))
+    
     def recognize_speech(self, audio_data: np.ndarray) -> Optional[str]:
         """
         <summary>Convert audio data to text using speech recognition</summary>
@@ -0,0 +1,193 @@
+"""
+<summary>
+Automatic gain and integration-time ranging for the TSL2561: picks the
+shortest window that still gives enough channel counts, so bright light is
+read in 13 ms and only darkness costs a 402 ms window
+</summary>
+<hardware>TSL2561 Luminosity Sensor (I2C)</hardware>
+<dependencies>None</dependencies>
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from .constants import LightConstants
+
+
+def compute_lux(broadband: int, infrared: int, gain: int, integration_time: int) -> Optional[float]:
+    """
+    <summary>
+    Lux from raw channel counts at the given range (datasheet piecewise
+    approximation, as in the Adafruit driver, whose lux property only knows the
+    range currently in the registers)
+    </summary>
+    <param name="broadband">Channel 0 (visible + infrared) counts</param>
+    <param name="infrared">Channel 1 (infrared) counts</param>
+    <param name="gain">Gain the counts were taken at (1 or 16)</param>
+    <param name="integration_time">Integration time the counts were taken at (13, 101 or 402 ms)</param>
+    <returns>Lux, or None if either channel is saturated</returns>
+    """
+    clip = LightConstants.CLIP_THRESHOLD[integration_time]
+    if broadband > clip or infrared > clip:
+        return None
+    if broadband == 0:
+        return 0.0
+    ratio = infrared / broadband
+    if ratio <= 0.50:
+        lux = 0.0304 * broadband - 0.062 * broadband * ratio ** 1.4
+    elif ratio <= 0.61:
+        lux = 0.0224 * broadband - 0.031 * infrared
+    elif ratio <= 0.80:
+        lux = 0.0128 * broadband - 0.0153 * infrared
+    elif ratio <= 1.30:
+        lux = 0.00146 * broadband - 0.00112 * infrared
+    else:
+        lux = 0.0
+    # Coefficients are for 16x gain and a 402 ms window
+    lux *= LightConstants.GAIN_HIGH / gain
+    lux *= LightConstants.INTEGRATION_WINDOW_MS[LightConstants.INTEGRATION_TIME_SLOW] / \
+        LightConstants.INTEGRATION_WINDOW_MS[integration_time]
+    return max(0.0, lux)
+
+
+class LightAutoRanger:
+    """
+    <summary>
+    Chooses the range for the next reading from the counts of the last one
+    (not thread-safe; one instance per sensor). Counts scale linearly with gain
+    and window, so the counts every range on AUTO_RANGE_LADDER would have given
+    are predicted from one reading and the least sensitive range - the shortest
+    window - reaching AUTO_RANGE_MIN_COUNTS is picked. A saturated reading
+    drops straight to the least sensitive range; moving to a less sensitive
+    range otherwise needs AUTO_RANGE_HYSTERESIS times the counts, so a reading
+    near a boundary does not flip the range back and forth.
+    </summary>
+    """
+
+    def __init__(self, index: int = 0) -> None:
+        """
+        <summary>Create ranger</summary>
+        <param name="index">Position on AUTO_RANGE_LADDER to start at (0 = least sensitive)</param>
+        <returns>None</returns>
+        """
+        self.index = index
+        self.saturated = False
+        self.changes = 0
+        self.saturated_reads = 0
+        self._reads = [0] * len(LightConstants.AUTO_RANGE_LADDER)
+
+    @property
+    def range(self) -> Tuple[int, int]:
+        """(gain, integration ms) to read at"""
+        return LightConstants.AUTO_RANGE_LADDER[self.index]
+
+    def update(self, broadband: int, infrared: int) -> Tuple[int, int]:
+        """
+        <summary>Account one reading taken at the current range and choose the next range</summary>
+        <param name="broadband">Channel 0 counts</param>
+        <param name="infrared">Channel 1 counts</param>
+        <returns>(gain, integration ms) for the next reading</returns>
+        """
+        self._reads[self.index] += 1
+        gain, integration_time = self.range
+        clip = LightConstants.CLIP_THRESHOLD[integration_time]
+        self.saturated = broadband > clip or infrared > clip
+        if self.saturated:
+            self.saturated_reads += 1
+            target = 0
+        else:
+            current = self._sensitivity(self.index)
+            target = len(LightConstants.AUTO_RANGE_LADDER) - 1
+            for candidate in range(target):
+                predicted = broadband * self._sensitivity(candidate) / current
+                needed = LightConstants.AUTO_RANGE_MIN_COUNTS
+                if candidate < self.index:
+                    needed *= LightConstants.AUTO_RANGE_HYSTERESIS
+                if predicted >= needed:
+                    target = candidate
+                    break
+        if target != self.index:
+            self.index = target
+            self.changes += 1
+        return self.range
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get the current range and how often each range was read</summary>
+        <returns>Dictionary of ranger statistics</returns>
+        """
+        gain, integration_time = self.range
+        return {
+            'gain': gain,
+            'integration_time': integration_time,
+            'changes': self.changes,
+            'saturated_reads': self.saturated_reads,
+            'reads': {f"{g}x/{t}ms": reads for (g, t), reads in zip(LightConstants.AUTO_RANGE_LADDER, self._reads)}
+        }
+
+    @staticmethod
+    def _sensitivity(index: int) -> float:
+        """Counts per lux of a ladder range relative to 1x gain and 402 ms"""
+        gain, integration_time = LightConstants.AUTO_RANGE_LADDER[index]
+        return gain * LightConstants.INTEGRATION_WINDOW_MS[integration_time] / \
+            LightConstants.INTEGRATION_WINDOW_MS[LightConstants.INTEGRATION_TIME_SLOW]
+
+
+if __name__ == "__main__":
+    # Fixed 1x/101 ms against auto-ranging, read through LightSensor at the
+    # runtime's pace (one read per current window) in real time. Each level is
+    # a step from the previous one. settle: step to the first reading within
+    # 10% of the true lux; call: time a get_luminosity() call blocks; error:
+    # mean relative error once settled.
+    #   python -m src.senses.light.tsl2561.auto_range
+    import math
+    import statistics
+    import time
+
+    from src.core.utils.lazy_import import set_backend
+
+    set_backend("simulated")
+    from src.simulation.settings import settings
+    from .light_sensor import LightSensor
+
+    settings.configure(time_scale=1.0)
+    settings.seed(5)
+    levels = (("night", 0.5), ("dim room", 20.0), ("indoor", 300.0),
+              ("overcast", 3000.0), ("sunlight", 30000.0), ("indoor", 300.0))
+    level_seconds = 2.0
+
+    def run(auto: bool) -> None:
+        sensor = LightSensor()
+        sensor.set_auto_range(auto)
+        if not auto:
+            sensor.set_gain(LightConstants.GAIN_LOW)
+            sensor.set_integration_time(LightConstants.INTEGRATION_TIME_MEDIUM)
+        assert sensor.initialize()
+        for name, lux in levels:
+            settings.lux_override = lux
+            changed = time.monotonic()
+            first = sensor.get_sample().sequence if sensor.get_sample() else 0
+            calls, errors, settled = [], [], None
+            while time.monotonic() - changed < level_seconds:
+                started = time.monotonic()
+                value = sensor.get_luminosity()
+                calls.append(time.monotonic() - started)
+                close = value is not None and abs(value - lux) <= lux * 0.1
+                if settled is None and close:
+                    settled = time.monotonic() - changed
+                if settled is not None:
+                    errors.append(abs(value - lux) / lux * 100 if value is not None else math.nan)
+                window = LightConstants.INTEGRATION_WINDOW_MS[sensor.integration_time] / 1000
+                time.sleep(max(0.0, window - (time.monotonic() - started)))
+            samples = sensor.get_sample().sequence - first
+            settle = settled * 1000 if settled is not None else math.nan
+            error = statistics.mean(errors) if errors else math.nan
+            print(f"  {name:9s} {lux:8.1f} lux  settle {settle:6.1f} ms  call {statistics.mean(calls) * 1000:5.2f} "
+                  f"/ {max(calls) * 1000:6.1f} ms  {samples / level_seconds:5.1f} reads/s  error {error:5.1f}%")
+        if auto:
+            print(f"  {sensor.auto_ranger.get_stats()}")
+        sensor.cleanup()
+
+    for auto in (False, True):
+        print("auto-ranging" if auto else "fixed 1x / 101 ms")
+        run(auto)
+    settings.lux_override = None
@@ -4,6 +4,9 @@
 class LightConstants:
     """Light sensor configuration constants"""
     
+    # Device name (circuit breaker / metrics)
+    DEVICE_NAME: str = "light_sensor"
+    
     # I2C settings
     DEFAULT_I2C_ADDRESS: int = 0x39
     ALTERNATIVE_I2C_ADDRESS: int = 0x49
@@ -14,11 +17,42 @@ class LightConstants:
     GAIN_HIGH: int = 16
     DEFAULT_GAIN: int = GAIN_LOW
     
+    # Driver register values (adafruit_tsl2561: gain 0/1, integration_time 0/1/2)
+    GAIN_REGISTER: dict = {GAIN_LOW: 0, GAIN_HIGH: 1}
+    
     # Integration time settings (milliseconds)
     INTEGRATION_TIME_FAST: int = 13
     INTEGRATION_TIME_MEDIUM: int = 101
     INTEGRATION_TIME_SLOW: int = 402
     DEFAULT_INTEGRATION_TIME: int = INTEGRATION_TIME_MEDIUM
+    INTEGRATION_TIME_REGISTER: dict = {
+        INTEGRATION_TIME_FAST: 0,
+        INTEGRATION_TIME_MEDIUM: 1,
+        INTEGRATION_TIME_SLOW: 2,
+    }
+    INTEGRATION_WINDOW_MS: dict = {         # Actual integration window (lux scaling)
+        INTEGRATION_TIME_FAST: 13.7,
+        INTEGRATION_TIME_MEDIUM: 101.0,
+        INTEGRATION_TIME_SLOW: 402.0,
+    }
+    CLIP_THRESHOLD: dict = {                # Channel counts above which a reading is saturated
+        INTEGRATION_TIME_FAST: 4900,
+        INTEGRATION_TIME_MEDIUM: 37000,
+        INTEGRATION_TIME_SLOW: 65000,
+    }
+    
+    # Auto-ranging - shortest window that still gives enough counts
+    AUTO_RANGE: bool = True
+    AUTO_RANGE_LADDER: tuple = (            # (gain, integration ms), least to most sensitive
+        (GAIN_LOW, INTEGRATION_TIME_FAST),      # bright daylight up to ~40000 lux
+        (GAIN_HIGH, INTEGRATION_TIME_FAST),     # indoor light
+        (GAIN_HIGH, INTEGRATION_TIME_MEDIUM),   # dim
+        (GAIN_HIGH, INTEGRATION_TIME_SLOW),     # dark
+    )
+    AUTO_RANGE_MIN_COUNTS: int = 200        # Broadband counts wanted per reading (0.5% quantization)
+    AUTO_RANGE_HYSTERESIS: float = 1.25     # Counts margin required before moving to a shorter window
+    AUTO_RANGE_VALID_COUNTS: int = 20       # Fewer counts are re-read after a range change (5% quantization)
+    READ_EARLY_TOLERANCE: float = 0.1       # Fraction of a window a read may come early and still use the bus
     
     # Light level thresholds (lux)
     THRESHOLD_DARK: float = 1.0
@@ -6,25 +6,33 @@ Controls the TSL2561 luminosity sensor for ambient light detection
 <dependencies>Adafruit_CircuitPython_TSL2561</dependencies>
 """
 
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+import threading
 import time
-try:
-    import adafruit_tsl2561
-    import board
-    import busio
-except ImportError:
-    # Fallback for development environment
-    adafruit_tsl2561 = None
-    board = None
-    busio = None
 
+from src.core.constants.global_constants import ZoloConstants
+from src.core.interfaces.sensor_interface import SensorInterface
+from src.core.utils.calibration import CalibrationModel
+from src.core.utils.hardware_utils import HardwareUtils
+from src.core.utils.i2c_bus import get_i2c_bus
+from src.core.utils.lazy_import import lazy_import
+from src.core.utils.metrics import metrics
+from src.core.utils.retry_policy import CircuitOpenError
+
+# Imported on first initialize(); unavailable in development environment
+adafruit_tsl2561 = lazy_import("adafruit_tsl2561", simulated="src.simulation.adafruit_tsl2561")
+
+from .auto_range import LightAutoRanger, compute_lux
 from .constants import LightConstants
 
 
-class LightSensor:
+class LightSensor(SensorInterface):
     """
     <summary>
-    Manages TSL2561 light sensor operations including luminosity measurement and calibration
+    Manages TSL2561 light sensor operations including luminosity measurement and calibration.
+    Every luminosity measurement is published as a sample in lux. With
+    auto-ranging the gain and integration time follow the light level, so a
+    reading takes a 13 ms window in daylight and 402 ms only in the dark.
     </summary>
     """
     
@@ -34,12 +42,33 @@ class LightSensor:
         <param name="i2c_address">I2C address of the TSL2561 sensor</param>
         <returns>None</returns>
         """
+        super().__init__()
         self.i2c_address = i2c_address
         self.sensor = None
         self.i2c = None
+        self.bus = get_i2c_bus(LightConstants.I2C_BUS)
         self.is_initialized = False
         self.gain = LightConstants.DEFAULT_GAIN
         self.integration_time = LightConstants.DEFAULT_INTEGRATION_TIME
+        self.calibration: Optional[CalibrationModel] = None
+        self.auto_ranger: Optional[LightAutoRanger] = None
+        if LightConstants.AUTO_RANGE:
+            self.auto_ranger = LightAutoRanger()
+            self.gain, self.integration_time = self.auto_ranger.range
+        self._fresh_at = 0.0  # monotonic time the first window at the current range completes
+        self._next_counts_at = 0.0  # monotonic time the channels next hold new counts (a window after a read)
+        self.read_seconds = metrics.histogram(
+            "zolo_sensor_read_seconds", "Sensor read latency", device=LightConstants.DEVICE_NAME
+        )
+        self.read_errors = metrics.counter(
+            "zolo_sensor_read_errors_total", "Failed sensor reads", device=LightConstants.DEVICE_NAME
+        )
+        self.range_changes = metrics.counter(
+            "zolo_sensor_range_changes_total", "Gain/integration range changes", device=LightConstants.DEVICE_NAME
+        )
+        self.saturated_reads = metrics.counter(
+            "zolo_sensor_saturated_reads_total", "Readings with a saturated channel", device=LightConstants.DEVICE_NAME
+        )
     
     def initialize(self) -> bool:
         """
@@ -47,9 +76,13 @@ class LightSensor:
         <returns>True if successful, False otherwise</returns>
         """
         try:
-            if board and busio and adafruit_tsl2561:
-                self.i2c = busio.I2C(board.SCL, board.SDA)
-                self.sensor = adafruit_tsl2561.TSL2561(self.i2c, address=self.i2c_address)
+            if adafruit_tsl2561.is_available():
+                # Bus handle shared with the distance sensor
+                if self.i2c is None:
+                    self.i2c = self.bus.acquire_handle()
+                with self.bus.transaction(LightConstants.DEVICE_NAME):
+                    self.sensor = adafruit_tsl2561.TSL2561(self.i2c, address=self.i2c_address)
+                self._apply_range(self.gain, self.integration_time)
                 self.is_initialized = True
                 return True
             return False
@@ -65,28 +98,149 @@ class LightSensor:
         if not self.is_initialized:
             return None
         
+        sample = self.get_sample()
+        early = LightConstants.INTEGRATION_WINDOW_MS[self.integration_time] / 1000 * LightConstants.READ_EARLY_TOLERANCE
+        if sample is not None and time.monotonic() < self._next_counts_at - early:
+            # No integration window has completed since that reading; skip the bus
+            return sample.value
+        
+        started = time.perf_counter()
         try:
-            # Skeleton implementation
-            return 0.0
+            # None when still saturated at the least sensitive range
+            lux = self._measure()
+            self.read_seconds.observe(time.perf_counter() - started)
+            calibration = self.calibration
+            if calibration is not None and lux is not None:
+                lux = calibration.apply(lux)
+            self.publish(lux, LightConstants.STATUS_OK if lux is not None else LightConstants.STATUS_SATURATED)
+            return lux
+        except CircuitOpenError:
+            self.read_errors.inc()
+            self.publish(None, LightConstants.STATUS_ERROR)
+            return None
         except Exception as e:
+            self.read_errors.inc()
+            self.publish(None, LightConstants.STATUS_ERROR)
             print(f"Luminosity measurement failed: {e}")
             return None
     
+    def read_raw_lux(self) -> Optional[float]:
+        """
+        <summary>Read lux from a new integration window, without calibration or publishing (for calibration runs)</summary>
+        <returns>Lux or None if failed or saturated</returns>
+        """
+        if not self.is_initialized:
+            return None
+        try:
+            return self._measure(new_window=True)
+        except Exception as e:
+            print(f"Luminosity measurement failed: {e}")
+            return None
+    
+    def set_calibration(self, calibration: Optional[CalibrationModel]) -> None:
+        """
+        <summary>Correct every lux reading with a fitted model (see config/sensor_calibration.py)</summary>
+        <param name="calibration">Compiled calibration model, None to use the driver's lux</param>
+        <returns>None</returns>
+        """
+        self.calibration = calibration
+    
     def get_raw_values(self) -> Optional[Tuple[int, int]]:
         """
-        <summary>Get raw broadband and infrared values</summary>
+        <summary>Get raw broadband and infrared values from a new integration window</summary>
         <returns>Tuple of (broadband, infrared) or None if failed</returns>
         """
         if not self.is_initialized:
             return None
         
+        started = time.perf_counter()
         try:
-            # Skeleton implementation
-            return (0, 0)
+            broadband, infrared = self._read_channels(new_window=True)
+            self.read_seconds.observe(time.perf_counter() - started)
+            return (broadband, infrared)
+        except CircuitOpenError:
+            self.read_errors.inc()
+            return None
         except Exception as e:
+            self.read_errors.inc()
             print(f"Raw values measurement failed: {e}")
             return None
     
+    def _measure(self, new_window: bool = False) -> Optional[float]:
+        """
+        <summary>
+        Read lux from the channel counts of the last completed window. With
+        auto-ranging the counts choose the range of the next reading, and a
+        saturated or nearly empty reading is repeated at once at the new range.
+        </summary>
+        <param name="new_window">Wait for a window that completed after the last read</param>
+        <returns>Lux or None if saturated</returns>
+        """
+        for _ in LightConstants.AUTO_RANGE_LADDER:
+            broadband, infrared = self._read_channels(new_window)
+            lux = compute_lux(broadband, infrared, self.gain, self.integration_time)
+            if lux is None:
+                self.saturated_reads.inc()
+            ranger = self.auto_ranger
+            if ranger is None:
+                return lux
+            gain, integration_time = ranger.update(broadband, infrared)
+            if (gain, integration_time) == (self.gain, self.integration_time):
+                return lux
+            self.range_changes.inc()
+            self._apply_range(gain, integration_time)
+            if lux is not None and broadband >= LightConstants.AUTO_RANGE_VALID_COUNTS:
+                return lux
+        return lux
+    
+    def _apply_range(self, gain: int, integration_time: int) -> None:
+        """
+        <summary>Write gain and integration time and restart integration, in one bus transaction</summary>
+        <param name="gain">Gain (1 or 16)</param>
+        <param name="integration_time">Integration time (13, 101 or 402 ms)</param>
+        <returns>None</returns>
+        """
+        self.gain = gain
+        self.integration_time = integration_time
+        if self.sensor:
+            with self.bus.transaction(LightConstants.DEVICE_NAME):
+                self.sensor.gain = LightConstants.GAIN_REGISTER[gain]
+                self.sensor.integration_time = LightConstants.INTEGRATION_TIME_REGISTER[integration_time]
+                # A new range only applies from the next window; a power cycle starts that window now
+                self.sensor.enabled = False
+                self.sensor.enabled = True
+        # The channels hold the previous range's counts until a full window has run
+        self._fresh_at = time.monotonic() + LightConstants.INTEGRATION_WINDOW_MS[integration_time] / 1000
+        self._next_counts_at = self._fresh_at
+    
+    @HardwareUtils.retry_on_failure(device=LightConstants.DEVICE_NAME, probe='_probe_sensor')
+    def _read_channels(self, new_window: bool = False) -> Tuple[int, int]:
+        """
+        <summary>Read raw channel counts from the sensor (the last completed window)</summary>
+        <param name="new_window">Wait for a window that completed after the last read</param>
+        <returns>Tuple of (broadband, infrared)</returns>
+        """
+        # Wait off the bus for the first window after a range change
+        ready_at = max(self._fresh_at, self._next_counts_at) if new_window else self._fresh_at
+        delay = ready_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        with self.bus.transaction(LightConstants.DEVICE_NAME, ZoloConstants.I2C_PRIORITY_LUX):
+            read_at = time.monotonic()
+            counts = self.sensor.luminosity
+        # The channels hold these counts until the next window completes
+        self._next_counts_at = read_at + LightConstants.INTEGRATION_WINDOW_MS[self.integration_time] / 1000
+        return counts
+    
+    def _probe_sensor(self) -> bool:
+        """
+        <summary>Check that the sensor answers on the bus (breaker probe - reads the control register, leaves the window running)</summary>
+        <returns>True if available</returns>
+        """
+        with self.bus.transaction(LightConstants.DEVICE_NAME):
+            self.sensor.enabled
+        return True
+    
     def get_light_level(self) -> str:
         """
         <summary>Get qualitative light level description</summary>
@@ -118,30 +272,41 @@ class LightSensor:
     
     def set_gain(self, gain: int) -> bool:
         """
-        <summary>Set sensor gain (1 or 16)</summary>
+        <summary>Set sensor gain (1 or 16); stops auto-ranging</summary>
         <param name="gain">Gain value (1 for low gain, 16 for high gain)</param>
         <returns>True if successful, False otherwise</returns>
         """
         if gain in [LightConstants.GAIN_LOW, LightConstants.GAIN_HIGH]:
-            self.gain = gain
-            if self.sensor:
-                self.sensor.gain = gain
+            self.auto_ranger = None
+            self._apply_range(gain, self.integration_time)
             return True
         return False
     
     def set_integration_time(self, time_ms: int) -> bool:
         """
-        <summary>Set integration time in milliseconds</summary>
+        <summary>Set integration time in milliseconds; stops auto-ranging</summary>
         <param name="time_ms">Integration time (13, 101, or 402 ms)</param>
         <returns>True if successful, False otherwise</returns>
         """
         if time_ms in [LightConstants.INTEGRATION_TIME_FAST, LightConstants.INTEGRATION_TIME_MEDIUM, LightConstants.INTEGRATION_TIME_SLOW]:
-            self.integration_time = time_ms
-            if self.sensor:
-                self.sensor.integration_time = time_ms
+            self.auto_ranger = None
+            self._apply_range(self.gain, time_ms)
             return True
         return False
     
+    def set_auto_range(self, enabled: bool) -> None:
+        """
+        <summary>Let gain and integration time follow the light level (see auto_range.py)</summary>
+        <param name="enabled">True to auto-range, False to keep the current range</param>
+        <returns>None</returns>
+        """
+        if not enabled:
+            self.auto_ranger = None
+        elif self.auto_ranger is None:
+            # Start from the shortest window; the first reading picks the range
+            self.auto_ranger = LightAutoRanger()
+            self._apply_range(*self.auto_ranger.range)
+    
     def calibrate(self, reference_lux: float) -> bool:
         """
         <summary>Calibrate sensor with known reference light level</summary>
@@ -170,13 +335,59 @@ class LightSensor:
             "status": "ready"
         }
     
+    def is_ready(self) -> bool:
+        """
+        <summary>Check if the sensor is integrating</summary>
+        <returns>True if ready, False otherwise</returns>
+        """
+        return self.is_initialized
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        <summary>Get sensor status including the latest sample</summary>
+        <returns>Dictionary containing status information</returns>
+        """
+        status = {
+            "initialized": self.is_initialized,
+            "address": self.i2c_address,
+            "gain": self.gain,
+            "integration_time": self.integration_time,
+            "auto_range": self.auto_ranger.get_stats() if self.auto_ranger else None,
+            "calibration": self.calibration.stats if self.calibration else None
+        }
+        status.update(self.get_stream_stats())
+        return status
+    
+    def disable(self) -> bool:
+        """
+        <summary>Power down the sensor (stops integrating)</summary>
+        <returns>True if successful, False otherwise</returns>
+        """
+        if not self.is_initialized or not self.sensor:
+            return False
+        
+        with self.bus.transaction(LightConstants.DEVICE_NAME):
+            self.sensor.enabled = False
+        self.is_initialized = False
+        return True
+    
+    def halt(self) -> None:
+        """
+        <summary>Emergency stop: power the sensor down on a background thread (never blocks the caller)</summary>
+        <returns>None</returns>
+        """
+        if not self.is_initialized:
+            return
+        # disable() waits for the bus, which an integration read may hold
+        threading.Thread(target=self.disable, name="zolo-light-halt", daemon=True).start()
+    
     def cleanup(self) -> None:
         """
         <summary>Clean up light sensor resources</summary>
         <returns>None</returns>
         """
         if self.i2c:
-            self.i2c.deinit()
+            self.bus.release_handle()
             self.i2c = None
         self.sensor = None
         self.is_initialized = False
\ No newline at end of file
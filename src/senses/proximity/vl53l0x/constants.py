@@ -4,17 +4,37 @@
 class DistanceConstants:
     """Distance sensor configuration constants"""
     
+    # Device name (circuit breaker / metrics)
+    DEVICE_NAME: str = "distance_sensor"
+    
     # I2C settings
     DEFAULT_I2C_ADDRESS: int = 0x29
     I2C_BUS: int = 1
     
     # Measurement settings
-    MIN_DISTANCE_MM: float = 30.0
+    MIN_DISTANCE_MM: float = 30.0           # Rated range; shorter returns are a very close object
     MAX_DISTANCE_MM: float = 2000.0
+    NO_TARGET_MM: int = 8190                # Reading without a target (8191 too); <= 0 is an error code
+    ACCURACY_HIGH_SPEED: str = "high_speed"
+    ACCURACY_GOOD: str = "good"
     ACCURACY_HIGH: str = "high"
     ACCURACY_BETTER: str = "better"
     ACCURACY_LONG_RANGE: str = "long_range"
     DEFAULT_ACCURACY: str = ACCURACY_BETTER
+    ACCURACY_MODE_NAMES: dict = {           # VL53L0X-python Vl53l0xAccuracyMode member per accuracy
+        ACCURACY_HIGH_SPEED: "HIGH_SPEED",
+        ACCURACY_GOOD: "GOOD",
+        ACCURACY_BETTER: "BETTER",
+        ACCURACY_HIGH: "BEST",
+        ACCURACY_LONG_RANGE: "LONG_RANGE",
+    }
+    ACCURACY_BUDGETS_US: dict = {           # Timing budget the sensor runs at in each accuracy mode
+        ACCURACY_HIGH_SPEED: 20000,
+        ACCURACY_GOOD: 33000,
+        ACCURACY_BETTER: 66000,
+        ACCURACY_HIGH: 200000,
+        ACCURACY_LONG_RANGE: 33000,
+    }
     
     # Timing budget settings (microseconds)
     TIMING_BUDGET_MIN: int = 20000
@@ -32,6 +52,45 @@ class DistanceConstants:
     MODE_SINGLE: str = "single"
     MODE_CONTINUOUS: str = "continuous"
     DEFAULT_MODE: str = MODE_SINGLE
+    CONTINUOUS_MAX_AGE_BUDGETS: float = 3.0   # Continuous reading older than this many timing budgets is stale
+    CONTINUOUS_RATE_SMOOTHING: float = 0.1    # EWMA weight of the newest interval in the reported rate
+    
+    # Data-ready interrupt - GPIO1 pulled low when a result is ready, released when it is read
+    READY_INTERRUPT: str = "interrupt"   # Woken by the GPIO1 edge, result fetched in one transaction
+    READY_POLLING: str = "polling"       # Blocking library read polling the status over I2C
+    INTERRUPT_TIMEOUT_BUDGETS: float = 2.0   # No edge within this many timing budgets: poll for the result
+    
+    # Filtering - out-of-range and spike rejection in every mode, then smoothing:
+    #   none:   raw readings, no lag, full sensor noise
+    #   median: median of the window, removes leftover spikes, lags ~N/2 readings
+    #   ema:    exponential average, cheapest, lags ~(1 - alpha) / alpha readings
+    #   kalman: random-walk Kalman, least noise on a still scene, gain adapts to the noise ratio
+    FILTER_NONE: str = "none"
+    FILTER_MEDIAN: str = "median"
+    FILTER_EMA: str = "ema"
+    FILTER_KALMAN: str = "kalman"
+    FILTER_MODES: tuple = (FILTER_NONE, FILTER_MEDIAN, FILTER_EMA, FILTER_KALMAN)
+    DEFAULT_FILTER: str = FILTER_KALMAN
+    FILTER_WINDOW_SIZE: int = 5
+    FILTER_EMA_ALPHA: float = 0.4
+    FILTER_KALMAN_PROCESS_NOISE: float = 10.0     # mm^2 per reading - expected motion between readings
+    FILTER_KALMAN_MEASUREMENT_NOISE: float = 25.0  # mm^2 - reading noise at the default timing budget
+    FILTER_GATE_SIGMAS: float = 4.0      # Spike: further than this many robust sigmas from the window median
+    FILTER_GATE_MIN_MM: float = 40.0     # ... and further than this
+    FILTER_GATE_MIN_SAMPLES: int = 3     # Accepted readings needed before gating starts
+    FILTER_MAX_REJECTS: int = 3          # Consecutive rejects before a jump / empty range is believed
+    
+    # Adaptive timing budget - fast ranging while something approaches, precise ranging on a still scene
+    ADAPTIVE_TIMING: bool = True
+    ADAPTIVE_FAST: str = ACCURACY_HIGH_SPEED      # TIMING_BUDGET_FAST
+    ADAPTIVE_BALANCED: str = ACCURACY_BETTER      # Moving away, or nothing in range
+    ADAPTIVE_PRECISE: str = ACCURACY_HIGH         # TIMING_BUDGET_ACCURATE
+    ADAPTIVE_SPEED_WINDOW: float = 0.4            # Seconds of readings in the speed estimate (3 readings at least)
+    ADAPTIVE_APPROACH_SPEED_MM_S: float = 150.0   # Approaching faster than this: fast ranging
+    ADAPTIVE_STATIC_SPEED_MM_S: float = 40.0      # Slower than this either way counts as still
+    ADAPTIVE_FAST_HOLD: float = 1.0               # Fast ranging kept this long after the last approach (seconds)
+    ADAPTIVE_STATIC_HOLD: float = 2.0             # Still this long before precise ranging (seconds)
+    ADAPTIVE_NOISE_SMOOTHING: float = 0.05        # EWMA weight of the newest reading in the noise estimate
     
     # Calibration settings
     CALIBRATION_SAMPLES: int = 10
@@ -53,4 +112,5 @@ class DistanceConstants:
     STATUS_OK: int = 0
     STATUS_ERROR: int = 1
     STATUS_TIMEOUT: int = 2
-    STATUS_NOT_INITIALIZED: int = 3
\ No newline at end of file
+    STATUS_NOT_INITIALIZED: int = 3
+    STATUS_OUT_OF_RANGE: int = 4
\ No newline at end of file
@@ -0,0 +1,245 @@
+"""
+<summary>
+Outlier rejection and smoothing for VL53L0X distance readings: median-of-N,
+exponential and 1-D Kalman filters over a preallocated numpy window
+</summary>
+<hardware>VL53L0X Time-of-Flight Distance Sensor (I2C)</hardware>
+<dependencies>numpy</dependencies>
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Optional
+
+from src.core.utils.lazy_import import lazy_import
+from .constants import DistanceConstants
+
+np = lazy_import("numpy")
+
+
+def clamp_reading(distance_mm: Optional[float]) -> Optional[float]:
+    """
+    <summary>Map a raw reading onto the rated range (a return below MIN_DISTANCE_MM is a very close object, not a miss)</summary>
+    <param name="distance_mm">Raw reading in mm</param>
+    <returns>Reading clamped to MIN_DISTANCE_MM..MAX_DISTANCE_MM, or None for no target (8190/8191) and error codes (<= 0)</returns>
+    """
+    if distance_mm is None or not 0 < distance_mm < DistanceConstants.NO_TARGET_MM:
+        return None
+    return float(min(max(distance_mm, DistanceConstants.MIN_DISTANCE_MM), DistanceConstants.MAX_DISTANCE_MM))
+
+
+class DistanceFilter:
+    """
+    <summary>
+    Filters one stream of distance readings (not thread-safe; one instance per
+    sensor). Every mode drops readings without a target, clamps the rest to
+    the sensor range (see clamp_reading) and rejects spikes far from the
+    median of the recent accepted readings; a jump that persists
+    for FILTER_MAX_REJECTS readings is accepted as a real change. Modes trade
+    lag for noise (see DistanceConstants.FILTER_*).
+    </summary>
+    """
+
+    def __init__(self, mode: str = DistanceConstants.DEFAULT_FILTER,
+                 window_size: int = DistanceConstants.FILTER_WINDOW_SIZE) -> None:
+        """
+        <summary>Create filter with an empty window</summary>
+        <param name="mode">Filter mode (FILTER_NONE, FILTER_MEDIAN, FILTER_EMA or FILTER_KALMAN)</param>
+        <param name="window_size">Accepted readings kept for gating and the median</param>
+        <returns>None</returns>
+        """
+        if mode not in DistanceConstants.FILTER_MODES:
+            raise ValueError(f"Unknown distance filter mode: {mode}")
+        self.mode = mode
+        self._window = np.empty(window_size, dtype=np.float64)
+        self._scratch = np.empty(window_size, dtype=np.float64)  # sorted copies for medians
+        self._stats = {'accepted': 0, 'spikes': 0, 'out_of_range': 0}
+        self._process_noise = DistanceConstants.FILTER_KALMAN_PROCESS_NOISE
+        self._measurement_noise = DistanceConstants.FILTER_KALMAN_MEASUREMENT_NOISE
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        <summary>Forget all history (keeps counters)</summary>
+        <returns>None</returns>
+        """
+        self._count = 0
+        self._next = 0
+        self._estimate: Optional[float] = None
+        self._variance = self._measurement_noise
+        self._rejected_run = 0
+        self._missing_run = 0
+
+    def set_timing_budget(self, budget_us: int) -> None:
+        """
+        <summary>Rescale the Kalman noise model: longer budgets give less noisy readings that are further apart</summary>
+        <param name="budget_us">Timing budget the sensor now runs at (microseconds)</param>
+        <returns>None</returns>
+        """
+        scale = budget_us / DistanceConstants.TIMING_BUDGET_DEFAULT
+        self._process_noise = DistanceConstants.FILTER_KALMAN_PROCESS_NOISE * scale
+        self._measurement_noise = DistanceConstants.FILTER_KALMAN_MEASUREMENT_NOISE / scale
+
+    def update(self, distance_mm: Optional[float]) -> Optional[float]:
+        """
+        <summary>Feed one reading</summary>
+        <param name="distance_mm">Raw reading in mm (None, <= 0 or 8190 when the sensor had no valid return)</param>
+        <returns>Filtered distance in mm, or None while nothing is in range</returns>
+        """
+        distance_mm = clamp_reading(distance_mm)
+        if distance_mm is None:
+            self._stats['out_of_range'] += 1
+            self._missing_run += 1
+            if self._missing_run >= DistanceConstants.FILTER_MAX_REJECTS:
+                # Consistently nothing in range: stop reporting the old object
+                self.reset()
+            return self._estimate
+        self._missing_run = 0
+
+        if self._is_spike(distance_mm):
+            self._stats['spikes'] += 1
+            self._rejected_run += 1
+            if self._rejected_run < DistanceConstants.FILTER_MAX_REJECTS:
+                return self._estimate
+            # The jump persisted: it is the new scene, restart from it
+            self.reset()
+        self._rejected_run = 0
+
+        self._stats['accepted'] += 1
+        self._window[self._next] = distance_mm
+        self._next = (self._next + 1) % len(self._window)
+        self._count = min(self._count + 1, len(self._window))
+        self._estimate = self._smooth(distance_mm)
+        return self._estimate
+
+    def filter_trace(self, readings: Iterable[Optional[float]]) -> "np.ndarray":
+        """
+        <summary>Run a recorded trace through a fresh copy of this filter</summary>
+        <param name="readings">Raw readings in mm (None for failed reads)</param>
+        <returns>Filtered values (NaN where the filter reports nothing in range)</returns>
+        """
+        replay = DistanceFilter(self.mode, len(self._window))
+        replay._process_noise = self._process_noise
+        replay._measurement_noise = self._measurement_noise
+        replay.reset()
+        output = [replay.update(reading) for reading in readings]
+        return np.array([math.nan if value is None else value for value in output], dtype=np.float64)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        <summary>Get accepted and rejected reading counters</summary>
+        <returns>Dictionary of counters</returns>
+        """
+        return dict(self._stats)
+
+    def _is_spike(self, distance_mm: float) -> bool:
+        """Robust gate: distance from the window median in MAD-derived sigmas"""
+        if self._count < DistanceConstants.FILTER_GATE_MIN_SAMPLES:
+            return False
+        window = self._window[:self._count]
+        scratch = self._scratch[:self._count]
+        median = self._median(window)
+        np.subtract(window, median, out=scratch)
+        np.abs(scratch, out=scratch)
+        sigma = 1.4826 * self._median(scratch)
+        gate = max(DistanceConstants.FILTER_GATE_MIN_MM, DistanceConstants.FILTER_GATE_SIGMAS * sigma)
+        return abs(distance_mm - median) > gate
+
+    def _median(self, values: "np.ndarray") -> float:
+        """Median via an in-place sort of the scratch buffer (np.median allocates and is slow on tiny arrays)"""
+        count = len(values)
+        scratch = self._scratch[:count]
+        scratch[:] = values
+        scratch.sort()
+        middle = count // 2
+        if count % 2:
+            return float(scratch[middle])
+        return float(scratch[middle - 1] + scratch[middle]) / 2.0
+
+    def _smooth(self, distance_mm: float) -> float:
+        """Mode-specific estimate after an accepted reading"""
+        if self.mode == DistanceConstants.FILTER_MEDIAN:
+            return self._median(self._window[:self._count])
+
+        if self._estimate is None or self.mode == DistanceConstants.FILTER_NONE:
+            return distance_mm
+
+        if self.mode == DistanceConstants.FILTER_EMA:
+            return self._estimate + DistanceConstants.FILTER_EMA_ALPHA * (distance_mm - self._estimate)
+
+        # Kalman, random-walk model: predict, then correct with the reading
+        variance = self._variance + self._process_noise
+        gain = variance / (variance + self._measurement_noise)
+        self._variance = (1.0 - gain) * variance
+        return self._estimate + gain * (distance_mm - self._estimate)
+
+
+def record_trace(samples: int, truth: "np.ndarray") -> "np.ndarray":
+    """
+    <summary>Record readings from the simulated VL53L0X while the scene follows a ground-truth path</summary>
+    <param name="samples">Number of readings</param>
+    <param name="truth">True distance in mm per reading</param>
+    <returns>Raw readings in mm</returns>
+    """
+    from src.simulation.settings import settings
+    from src.simulation.vl53l0x import VL53L0X, Vl53l0xAccuracyMode
+
+    settings.configure(time_scale=0)
+    sensor = VL53L0X()
+    sensor.open()
+    sensor.start_ranging(Vl53l0xAccuracyMode.GOOD)
+    readings = np.empty(samples)
+    for index in range(samples):
+        settings.distance_override_mm = float(truth[index])
+        readings[index] = sensor.get_distance()
+    settings.distance_override_mm = None
+    return readings
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # Traces at 30 Hz: static object, approach from 1.2 m to 5 cm, and a step into close range.
+    # A recorded trace can be passed as a .npy/.csv file of (truth, reading) rows.
+    rate = 30
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+        rows = np.load(path) if path.endswith('.npy') else np.loadtxt(path, delimiter=',')
+        traces = {path: (rows[:, 0], rows[:, 1])}
+    else:
+        from src.simulation.settings import settings
+        settings.seed(7)
+        n = 30 * rate
+        paths = {
+            "static": np.full(n, 500.0),
+            "approach": np.linspace(1200.0, 50.0, n),
+            "step": np.where(np.arange(n) < n // 2, 800.0, 80.0),
+        }
+        traces = {name: (truth, record_trace(n, truth)) for name, truth in paths.items()}
+
+    threshold_mm = DistanceConstants.CLOSE_THRESHOLD_CM * 10
+    print(f"{'trace':10s} {'mode':9s} {'rmse mm':>8s} {'false close':>11s} {'detect lag ms':>13s} {'us/update':>9s}")
+    for name, (truth, readings) in traces.items():
+        raw_readings = [None if r <= 0 else float(r) for r in readings]
+        true_close = truth < threshold_mm
+        first_close = int(np.argmax(true_close)) if true_close.any() else None
+        # "unfiltered" is what the robot reacted to before: every reading as-is
+        for mode in ("unfiltered",) + DistanceConstants.FILTER_MODES:
+            started = time.perf_counter()
+            if mode == "unfiltered":
+                output = np.array([math.nan if r is None or r > DistanceConstants.MAX_DISTANCE_MM else r
+                                   for r in raw_readings])
+            else:
+                output = DistanceFilter(mode).filter_trace(raw_readings)
+            per_update = (time.perf_counter() - started) / len(raw_readings) * 1e6
+
+            valid = ~np.isnan(output)
+            rmse = float(np.sqrt(np.mean((output[valid] - truth[valid]) ** 2))) if valid.any() else math.nan
+            reported_close = valid & (output < threshold_mm)
+            false_close = int(np.sum(reported_close & ~true_close))
+            lag = "-"
+            if first_close is not None and reported_close[first_close:].any():
+                lag = f"{(int(np.argmax(reported_close[first_close:])) * 1000 / rate):.0f}"
+            print(f"{name:10s} {mode:9s} {rmse:8.1f} {false_close:11d} {lag:>13s} {per_update:9.1f}")
@@ -3,38 +3,106 @@
 Controls the VL53L0X Time-of-Flight distance sensor for proximity detection
 </summary>
 <hardware>VL53L0X Time-of-Flight Distance Sensor (I2C)</hardware>
-<dependencies>VL53L0X-python, smbus2</dependencies>
+<dependencies>VL53L0X-python, smbus2, RPi.GPIO (data-ready interrupt)</dependencies>
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional
+import threading
 import time
-try:
-    import VL53L0X
-except ImportError:
-    # Fallback for development environment
-    VL53L0X = None
+
+from config.hardware_pins import HardwarePins
+from src.core.constants.global_constants import ZoloConstants
+from src.core.interfaces.sensor_interface import SensorInterface
+from src.core.utils.calibration import CalibrationModel
+from src.core.utils.hardware_utils import HardwareUtils
+from src.core.utils.i2c_bus import get_i2c_bus
+from src.core.utils.lazy_import import lazy_import
+from src.core.utils.metrics import metrics
+from src.core.utils.retry_policy import CircuitOpenError
+
+# Imported on first initialize(); unavailable in development environment
+VL53L0X = lazy_import("VL53L0X", simulated="src.simulation.vl53l0x")
+GPIO = lazy_import("RPi.GPIO", simulated="src.simulation.gpio")
+np = lazy_import("numpy")
 
 from .constants import DistanceConstants
+from .distance_filter import DistanceFilter, clamp_reading
+from .timing_controller import TimingBudgetController
 
 
-class DistanceSensor:
+class DistanceSensor(SensorInterface):
     """
     <summary>
-    Manages VL53L0X distance sensor operations including ranging and calibration
+    Manages VL53L0X distance sensor operations including ranging and calibration.
+    Every measurement is published as a sample in millimeters. In continuous
+    mode a background reader ranges back-to-back at the timing-budget rate and
+    reads return the latest sample without touching the bus. When the GPIO1
+    data-ready line is wired, a read waits for its edge off the bus and then
+    fetches exactly one result; otherwise the library polls. With adaptive
+    timing the accuracy mode follows the scene: fast ranging while something
+    approaches, precise ranging while it is still.
     </summary>
     """
     
-    def __init__(self, i2c_address: int = DistanceConstants.DEFAULT_I2C_ADDRESS) -> None:
+    def __init__(self, i2c_address: int = DistanceConstants.DEFAULT_I2C_ADDRESS,
+                 interrupt_pin: Optional[int] = HardwarePins.DISTANCE_SENSOR_INTERRUPT) -> None:
         """
         <summary>Initialize distance sensor with I2C configuration</summary>
         <param name="i2c_address">I2C address of the VL53L0X sensor</param>
+        <param name="interrupt_pin">BCM pin wired to GPIO1 (data ready), None to always poll</param>
         <returns>None</returns>
         """
+        super().__init__()
         self.i2c_address = i2c_address
+        self.interrupt_pin = interrupt_pin
+        self._interrupt_armed = False
         self.sensor = None
+        self.bus = get_i2c_bus(DistanceConstants.I2C_BUS)
         self.is_initialized = False
-        self.measurement_mode = "single"
+        self.measurement_mode = DistanceConstants.DEFAULT_MODE
         self.timing_budget = DistanceConstants.TIMING_BUDGET_DEFAULT
+        self.accuracy = DistanceConstants.DEFAULT_ACCURACY
+        self.timing_controller: Optional[TimingBudgetController] = None
+        if DistanceConstants.ADAPTIVE_TIMING:
+            self.timing_controller = TimingBudgetController(self.accuracy)
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()  # stop flag of the current reader, a new one per reader
+        self._stopped_reader: Optional[threading.Thread] = None  # last stopped reader, may still be in a read
+        self._reader_lock = threading.Lock()
+        self._interval_average: Optional[float] = None  # smoothed seconds between continuous samples
+        self._result_due = 0.0  # time.monotonic() the next back-to-back measurement should complete
+        self.filter: Optional[DistanceFilter] = None
+        self._filter_lock = threading.Lock()
+        self.last_raw_distance: Optional[int] = None
+        self.calibration: Optional[CalibrationModel] = None
+        metrics.gauge(
+            "zolo_sensor_sample_age_seconds", "Age of the latest continuous measurement",
+            device=DistanceConstants.DEVICE_NAME
+        ).set_function(lambda: self.get_continuous_stats()["age"] or 0.0)
+        metrics.gauge(
+            "zolo_sensor_sample_rate_hz", "Achieved continuous measurement rate", device=DistanceConstants.DEVICE_NAME
+        ).set_function(lambda: self.get_continuous_stats()["rate_hz"] or 0.0)
+        self.read_seconds = metrics.histogram(
+            "zolo_sensor_read_seconds", "Sensor read latency", device=DistanceConstants.DEVICE_NAME
+        )
+        self.read_errors = metrics.counter(
+            "zolo_sensor_read_errors_total", "Failed sensor reads", device=DistanceConstants.DEVICE_NAME
+        )
+        self._ready_counts = {DistanceConstants.READY_INTERRUPT: 0, DistanceConstants.READY_POLLING: 0}
+        self._edge_timeouts = 0
+        self._ready_latency = {
+            path: metrics.histogram(
+                "zolo_sensor_ready_to_consumer_seconds", "Measurement end to sample delivery",
+                device=DistanceConstants.DEVICE_NAME, path=path
+            )
+            for path in self._ready_counts
+        }
+        self.mode_switches = metrics.counter(
+            "zolo_sensor_accuracy_switches_total", "Accuracy mode changes", device=DistanceConstants.DEVICE_NAME
+        )
+        metrics.gauge(
+            "zolo_sensor_timing_budget_seconds", "Current ranging timing budget", device=DistanceConstants.DEVICE_NAME
+        ).set_function(lambda: self.timing_budget / 1_000_000)
     
     def initialize(self) -> bool:
         """
@@ -42,11 +110,25 @@ class DistanceSensor:
         <returns>True if successful, False otherwise</returns>
         """
         try:
-            if VL53L0X:
-                self.sensor = VL53L0X.VL53L0X(i2c_address=self.i2c_address)
-                self.sensor.open()
-                self.sensor.start_ranging(VL53L0X.Vl53l0xAccuracyMode.BETTER)
+            if not self._wait_stopped_reader():
+                # Restarting on a read that is still stuck would leave two readers on the bus
+                print("Distance sensor initialization deferred: previous reader still blocked in a read")
+                return False
+            if self.filter is None and np.is_available():
+                self.filter = DistanceFilter()
+            if VL53L0X.is_available():
+                # Before ranging starts, so the first data-ready edge is seen
+                self._arm_interrupt()
+                self.sensor = VL53L0X.VL53L0X(i2c_bus=DistanceConstants.I2C_BUS, i2c_address=self.i2c_address)
+                with self.bus.transaction(DistanceConstants.DEVICE_NAME):
+                    self.sensor.open()
+                    self.sensor.start_ranging(self._accuracy_mode(self.accuracy))
+                    self.timing_budget = self.sensor.get_timing()
+                self._result_due = time.monotonic() + self.timing_budget / 1_000_000
+                self._on_timing_changed()
                 self.is_initialized = True
+                if self.measurement_mode == DistanceConstants.MODE_CONTINUOUS:
+                    return self._start_reader()
                 return True
             return False
         except Exception as e:
@@ -55,19 +137,145 @@ class DistanceSensor:
     
     def get_distance(self) -> Optional[float]:
         """
-        <summary>Get distance measurement in millimeters</summary>
+        <summary>Get distance in millimeters (latest continuous sample, or one ranging transaction in single mode)</summary>
         <returns>Distance in mm or None if failed</returns>
         """
         if not self.is_initialized:
             return None
         
+        if self._reader is not None:
+            # Continuous mode: plain attribute read, no lock and no bus access
+            sample = self._latest_sample
+            if sample is None or time.monotonic() - sample.timestamp > self._max_sample_age():
+                return None
+            return sample.value
+        return self._measure()
+    
+    def _measure(self) -> Optional[float]:
+        """
+        <summary>Wait for a result, fetch, filter and publish it (timestamped at the end of the measurement)</summary>
+        <returns>Filtered distance in mm or None if failed or nothing in range</returns>
+        """
+        ready_at = self._wait_data_ready()
+        if ready_at is None:
+            self._wait_result_due()
+        started = time.perf_counter()
         try:
-            # Skeleton implementation
-            return 0.0
+            distance = self._read_distance()
+            self.read_seconds.observe(time.perf_counter() - started)
+            if ready_at is not None:
+                path = DistanceConstants.READY_INTERRUPT
+            else:
+                # The blocking read returns as soon as its status poll sees the result
+                path = DistanceConstants.READY_POLLING
+                ready_at = time.monotonic()
+            self._result_due = ready_at + self.timing_budget / 1_000_000
+            self.last_raw_distance = distance
+            # Short returns are a very close object; only no-target readings and error codes are dropped
+            reading = clamp_reading(distance)
+            calibration = self.calibration
+            if calibration is not None and reading is not None:
+                reading = calibration.apply(reading)
+            if self.filter is not None:
+                with self._filter_lock:
+                    filtered = self.filter.update(reading)
+            else:
+                # numpy unavailable: raw readings
+                filtered = reading
+            status = DistanceConstants.STATUS_OK if filtered is not None else DistanceConstants.STATUS_OUT_OF_RANGE
+            self._ready_counts[path] += 1
+            self._ready_latency[path].observe(time.monotonic() - ready_at)
+            sample = self.publish(filtered, status, timestamp=ready_at)
+            controller = self.timing_controller
+            if controller is not None:
+                accuracy = controller.update(sample.timestamp, distance, filtered)
+                if accuracy != self.accuracy and not self._apply_accuracy(accuracy):
+                    controller.accuracy = self.accuracy
+            return filtered
+        except CircuitOpenError:
+            # Sensor is down, being probed in the background
+            self.read_errors.inc()
+            self.publish(None, DistanceConstants.STATUS_ERROR)
+            return None
         except Exception as e:
+            self.read_errors.inc()
+            self.publish(None, DistanceConstants.STATUS_ERROR)
             print(f"Distance measurement failed: {e}")
             return None
     
+    def _wait_data_ready(self) -> Optional[float]:
+        """
+        <summary>Block, without holding the I2C bus, until GPIO1 signals a completed measurement</summary>
+        <returns>time.monotonic() of the data-ready edge, or None to poll (no interrupt line or no edge in time)</returns>
+        """
+        if not self._interrupt_armed:
+            return None
+        try:
+            if GPIO.input(self.interrupt_pin) == GPIO.LOW:
+                # A result completed while the previous one was being processed
+                return time.monotonic()
+            timeout_ms = max(1, int(DistanceConstants.INTERRUPT_TIMEOUT_BUDGETS * self.timing_budget / 1000))
+            if GPIO.wait_for_edge(self.interrupt_pin, GPIO.FALLING, timeout=timeout_ms) is not None:
+                return time.monotonic()
+        except Exception as e:
+            print(f"Distance sensor data-ready wait failed: {e}")
+        # Missed edge or line not working: the polled read recovers and clears the interrupt
+        self._edge_timeouts += 1
+        return None
+    
+    def _wait_result_due(self) -> None:
+        """
+        <summary>Polled mode: sleep off the bus until the next measurement should be complete</summary>
+        <returns>None</returns>
+        """
+        # Otherwise the library polls the status register inside the transaction for up to a whole budget
+        delay = self._result_due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    @HardwareUtils.retry_on_failure(device=DistanceConstants.DEVICE_NAME, probe='_probe_sensor')
+    def _read_distance(self) -> int:
+        """
+        <summary>Read one ranging result from the sensor</summary>
+        <returns>Raw distance in mm</returns>
+        """
+        with self.bus.transaction(DistanceConstants.DEVICE_NAME, ZoloConstants.I2C_PRIORITY_RANGING):
+            return self.sensor.get_distance()
+    
+    def _probe_sensor(self) -> bool:
+        """
+        <summary>Check that the sensor answers on the bus (breaker probe - reads the timing budget, never ranges)</summary>
+        <returns>True if available</returns>
+        """
+        with self.bus.transaction(DistanceConstants.DEVICE_NAME):
+            self.sensor.get_timing()
+        return True
+    
+    def read_raw_distance(self) -> Optional[int]:
+        """
+        <summary>Range once without calibration, filtering or publishing (for calibration runs)</summary>
+        <returns>Raw distance in mm or None if failed</returns>
+        """
+        if not self.is_initialized:
+            return None
+        if self._wait_data_ready() is None:
+            self._wait_result_due()
+        try:
+            distance = self._read_distance()
+            self._result_due = time.monotonic() + self.timing_budget / 1_000_000
+            return distance
+        except Exception as e:
+            print(f"Distance measurement failed: {e}")
+            return None
+    
+    def set_calibration(self, calibration: Optional[CalibrationModel]) -> None:
+        """
+        <summary>Correct every raw reading with a fitted model before filtering (see config/sensor_calibration.py)</summary>
+        <param name="calibration">Compiled calibration model, None to use raw readings</param>
+        <returns>None</returns>
+        """
+        self.calibration = calibration
+    
     def get_distance_cm(self) -> Optional[float]:
         """
         <summary>Get distance measurement in centimeters</summary>
@@ -95,21 +303,237 @@ class DistanceSensor:
         <param name="mode">Measurement mode ('single' or 'continuous')</param>
         <returns>True if successful, False otherwise</returns>
         """
-        if mode in ["single", "continuous"]:
+        if mode in [DistanceConstants.MODE_SINGLE, DistanceConstants.MODE_CONTINUOUS]:
             self.measurement_mode = mode
+            if mode == DistanceConstants.MODE_SINGLE:
+                self._stop_reader()
+            elif self.is_initialized:
+                return self._start_reader()
             return True
         return False
     
+    def set_filter_mode(self, mode: str) -> bool:
+        """
+        <summary>Select the smoothing filter (see DistanceConstants.FILTER_*); restarts filtering</summary>
+        <param name="mode">Filter mode ('none', 'median', 'ema' or 'kalman')</param>
+        <returns>True if successful, False otherwise</returns>
+        """
+        if mode not in DistanceConstants.FILTER_MODES or not np.is_available():
+            return False
+        distance_filter = DistanceFilter(mode)
+        distance_filter.set_timing_budget(self.timing_budget)
+        with self._filter_lock:
+            self.filter = distance_filter
+        return True
+    
+    def get_continuous_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get background reader state, age of the latest measurement and achieved rate</summary>
+        <returns>Dictionary with 'running', 'age' (seconds) and 'rate_hz'</returns>
+        """
+        sample = self._latest_sample
+        interval = self._interval_average
+        return {
+            "running": self._reader is not None,
+            "age": time.monotonic() - sample.timestamp if sample else None,
+            "rate_hz": 1.0 / interval if interval else None
+        }
+    
+    def _start_reader(self) -> bool:
+        """
+        <summary>Start the background reader if it is not running</summary>
+        <returns>True if a reader is running, False while a stopped reader is still blocked in a read</returns>
+        """
+        with self._reader_lock:
+            if self._reader is not None:
+                return True
+            if not self._wait_stopped_reader():
+                print("Distance sensor reader not started: previous reader still blocked in a read")
+                return False
+            # Never reuse a stop flag: a reader still finishing its last read would miss it
+            stop = threading.Event()
+            self._reader_stop = stop
+            self._interval_average = None
+            self._reader = threading.Thread(target=self._read_continuously, args=(stop,),
+                                            name="zolo-distance-reader", daemon=True)
+            self._reader.start()
+            return True
+    
+    def _stop_reader(self, wait: bool = True) -> None:
+        """
+        <summary>Stop the background reader</summary>
+        <param name="wait">Wait at most one measurement for it to finish (False only signals)</param>
+        <returns>None</returns>
+        """
+        reader, self._reader = self._reader, None
+        if reader is None:
+            return
+        self._reader_stop.set()
+        self._stopped_reader = reader
+        if wait and reader is not threading.current_thread():
+            reader.join(self._max_sample_age())
+    
+    def _wait_stopped_reader(self) -> bool:
+        """
+        <summary>Give the last stopped reader one more measurement to finish</summary>
+        <returns>True if no stopped reader is still running</returns>
+        """
+        reader = self._stopped_reader
+        if reader is None:
+            return True
+        if reader is not threading.current_thread():
+            reader.join(self._max_sample_age())
+        if reader.is_alive():
+            return False
+        self._stopped_reader = None
+        return True
+    
+    def _read_continuously(self, stop: threading.Event) -> None:
+        """
+        <summary>Reader loop: each pass waits for the sensor to complete the next measurement (interrupt or polling)</summary>
+        <param name="stop">Stop flag of this reader</param>
+        <returns>None</returns>
+        """
+        smoothing = DistanceConstants.CONTINUOUS_RATE_SMOOTHING
+        last_timestamp = None
+        while not stop.is_set():
+            self._measure()
+            sample = self._latest_sample
+            if sample.status == DistanceConstants.STATUS_ERROR:
+                # Failed or circuit open: do not spin on an unavailable sensor
+                last_timestamp = None
+                stop.wait(self.timing_budget / 1_000_000)
+                continue
+            
+            timestamp = sample.timestamp
+            if last_timestamp is not None:
+                interval = timestamp - last_timestamp
+                average = self._interval_average
+                self._interval_average = interval if average is None else average + smoothing * (interval - average)
+            last_timestamp = timestamp
+    
+    def _max_sample_age(self) -> float:
+        """Age (seconds) beyond which a continuous sample counts as missing"""
+        return DistanceConstants.CONTINUOUS_MAX_AGE_BUDGETS * self.timing_budget / 1_000_000
+    
     def set_timing_budget(self, budget_us: int) -> bool:
         """
-        <summary>Set measurement timing budget in microseconds</summary>
+        <summary>Set measurement timing budget in microseconds (runs the accuracy mode with the closest budget; stops adaptive timing)</summary>
         <param name="budget_us">Timing budget in microseconds</param>
         <returns>True if successful, False otherwise</returns>
         """
-        if DistanceConstants.TIMING_BUDGET_MIN <= budget_us <= DistanceConstants.TIMING_BUDGET_MAX:
-            self.timing_budget = budget_us
+        if not DistanceConstants.TIMING_BUDGET_MIN <= budget_us <= DistanceConstants.TIMING_BUDGET_MAX:
+            return False
+        budgets = DistanceConstants.ACCURACY_BUDGETS_US
+        accuracy = min(budgets, key=lambda name: abs(budgets[name] - budget_us))
+        return self.set_accuracy(accuracy)
+    
+    def set_accuracy(self, accuracy: str) -> bool:
+        """
+        <summary>Run a fixed accuracy mode (stops adaptive timing)</summary>
+        <param name="accuracy">Accuracy mode (DistanceConstants.ACCURACY_*)</param>
+        <returns>True if successful, False otherwise</returns>
+        """
+        if accuracy not in DistanceConstants.ACCURACY_MODE_NAMES:
+            return False
+        self.timing_controller = None
+        return self._apply_accuracy(accuracy)
+    
+    def set_adaptive_timing(self, enabled: bool) -> None:
+        """
+        <summary>Let the accuracy mode follow the scene (fast while approaching, precise while still)</summary>
+        <param name="enabled">True to adapt, False to keep the current mode</param>
+        <returns>None</returns>
+        """
+        if not enabled:
+            self.timing_controller = None
+        elif self.timing_controller is None:
+            self.timing_controller = TimingBudgetController(self.accuracy)
+    
+    def get_timing_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get the accuracy mode and the achieved rate and noise per mode</summary>
+        <returns>Dictionary with 'accuracy', 'timing_budget', 'adaptive' and controller statistics</returns>
+        """
+        controller = self.timing_controller
+        stats = {
+            "accuracy": self.accuracy,
+            "timing_budget": self.timing_budget,
+            "adaptive": controller is not None
+        }
+        if controller is not None:
+            stats.update(controller.get_stats())
+        return stats
+    
+    def _apply_accuracy(self, accuracy: str) -> bool:
+        """
+        <summary>Restart ranging in another accuracy mode (called on the reading thread by the controller)</summary>
+        <param name="accuracy">Accuracy mode (DistanceConstants.ACCURACY_*)</param>
+        <returns>True if successful, False otherwise</returns>
+        """
+        if not self.is_initialized or not self.sensor:
+            # Picked up by initialize()
+            self.accuracy = accuracy
             return True
-        return False
+        try:
+            with self.bus.transaction(DistanceConstants.DEVICE_NAME, ZoloConstants.I2C_PRIORITY_RANGING):
+                self.sensor.stop_ranging()
+                self.sensor.start_ranging(self._accuracy_mode(accuracy))
+                self.timing_budget = self.sensor.get_timing()
+        except Exception as e:
+            print(f"Distance sensor accuracy change failed: {e}")
+            return False
+        self._result_due = time.monotonic() + self.timing_budget / 1_000_000
+        self.accuracy = accuracy
+        self.mode_switches.inc()
+        self._on_timing_changed()
+        return True
+    
+    def get_data_ready_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get how results were picked up and the measurement-end to delivery latency per path</summary>
+        <returns>Dictionary with interrupt state, reads per path, edge timeouts and mean latencies (seconds)</returns>
+        """
+        latency = {}
+        for path, histogram in self._ready_latency.items():
+            snapshot = histogram.snapshot()
+            latency[path] = snapshot['sum'] / snapshot['count'] if snapshot['count'] else None
+        return {
+            "interrupt_armed": self._interrupt_armed,
+            "interrupt_pin": self.interrupt_pin,
+            "reads": dict(self._ready_counts),
+            "edge_timeouts": self._edge_timeouts,
+            "latency": latency
+        }
+    
+    def _arm_interrupt(self) -> None:
+        """
+        <summary>Configure the GPIO1 data-ready input (the ST API sets GPIO1 to new-sample-ready, active low)</summary>
+        <returns>None</returns>
+        """
+        if self.interrupt_pin is None or self._interrupt_armed:
+            return
+        if not GPIO.is_available():
+            print(f"Distance sensor data-ready interrupt unavailable ({GPIO.get_error()}), polling")
+            return
+        try:
+            GPIO.setmode(GPIO.BCM)
+            # GPIO1 is open drain
+            GPIO.setup(self.interrupt_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            self._interrupt_armed = True
+        except Exception as e:
+            print(f"Distance sensor interrupt setup failed: {e}")
+    
+    def _on_timing_changed(self) -> None:
+        """Rescale the filter to the new budget and restart the rate estimate"""
+        with self._filter_lock:
+            if self.filter is not None:
+                self.filter.set_timing_budget(self.timing_budget)
+        self._interval_average = None
+    
+    def _accuracy_mode(self, accuracy: str) -> int:
+        """VL53L0X-python accuracy mode value"""
+        return getattr(VL53L0X.Vl53l0xAccuracyMode, DistanceConstants.ACCURACY_MODE_NAMES[accuracy])
     
     def calibrate(self, reference_distance_mm: float) -> bool:
         """
@@ -139,13 +563,118 @@ class DistanceSensor:
             "status": "ready"
         }
     
+    def is_ready(self) -> bool:
+        """
+        <summary>Check if the sensor is ranging</summary>
+        <returns>True if ready, False otherwise</returns>
+        """
+        return self.is_initialized
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        <summary>Get sensor status including the latest sample</summary>
+        <returns>Dictionary containing status information</returns>
+        """
+        status = {
+            "initialized": self.is_initialized,
+            "address": self.i2c_address,
+            "mode": self.measurement_mode,
+            "timing_budget": self.timing_budget,
+            "timing": self.get_timing_stats(),
+            "continuous": self.get_continuous_stats(),
+            "data_ready": self.get_data_ready_stats(),
+            "filter": self.filter.mode if self.filter else None,
+            "filter_stats": self.filter.get_stats() if self.filter else None,
+            "last_raw_distance": self.last_raw_distance,
+            "calibration": self.calibration.stats if self.calibration else None
+        }
+        status.update(self.get_stream_stats())
+        return status
+    
+    def stop_ranging(self) -> bool:
+        """
+        <summary>Stop continuous ranging (sensor stays open)</summary>
+        <returns>True if successful, False otherwise</returns>
+        """
+        if not self.is_initialized or not self.sensor:
+            return False
+        
+        self._stop_reader()
+        with self.bus.transaction(DistanceConstants.DEVICE_NAME):
+            self.sensor.stop_ranging()
+        self.is_initialized = False
+        return True
+    
+    def halt(self) -> None:
+        """
+        <summary>Emergency stop: signal the reader and stop ranging on a background thread (never blocks the caller)</summary>
+        <returns>None</returns>
+        """
+        if not self.is_initialized:
+            return
+        self._stop_reader(wait=False)
+        # stop_ranging() waits for the bus, which a read in progress may hold for a whole budget
+        threading.Thread(target=self.stop_ranging, name="zolo-distance-halt", daemon=True).start()
+    
     def cleanup(self) -> None:
         """
         <summary>Clean up distance sensor resources</summary>
         <returns>None</returns>
         """
+        self._stop_reader()
         if self.sensor:
-            self.sensor.stop_ranging()
-            self.sensor.close()
+            with self.bus.transaction(DistanceConstants.DEVICE_NAME):
+                if self.is_initialized:
+                    self.sensor.stop_ranging()
+                self.sensor.close()
             self.sensor = None
-        self.is_initialized = False
\ No newline at end of file
+        if self._interrupt_armed:
+            try:
+                GPIO.cleanup(self.interrupt_pin)
+            except Exception as e:
+                print(f"Distance sensor interrupt cleanup failed: {e}")
+            self._interrupt_armed = False
+        self.is_initialized = False
+
+
+if __name__ == "__main__":
+    # Data-ready paths on the simulated backend: continuous fast ranging woken by the
+    # GPIO1 interrupt vs. the polling read, while another device uses the shared bus.
+    #   python -m src.senses.proximity.vl53l0x.distance_sensor
+    from src.core.utils.lazy_import import set_backend
+    
+    set_backend(ZoloConstants.BACKEND_SIMULATED)
+    duration = 5.0
+    print(f"{'path':10s} {'rate Hz':>8s} {'end->consumer ms':>16s} {'p99 ms':>7s} {'bus busy':>8s} {'other device wait ms':>20s}")
+    for pin in (HardwarePins.DISTANCE_SENSOR_INTERRUPT, None):
+        sensor = DistanceSensor(interrupt_pin=pin)
+        sensor.initialize()
+        sensor.set_accuracy(DistanceConstants.ACCURACY_HIGH_SPEED)
+        device = sensor.sensor
+        latencies, waits = [], []
+        # Simulation only: the device records when each result it returns was completed
+        sensor.subscribe(lambda sample: latencies.append(time.monotonic() - device.last_ready_at))
+        
+        def other_device(stop: threading.Event) -> None:
+            while not stop.wait(0.01):
+                requested = time.monotonic()
+                with sensor.bus.transaction("other", ZoloConstants.I2C_PRIORITY_LUX):
+                    waits.append(time.monotonic() - requested)
+        
+        stop = threading.Event()
+        threading.Thread(target=other_device, args=(stop,), daemon=True).start()
+        busy_before = sensor.bus.get_stats()['busy_seconds']
+        sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+        time.sleep(duration)
+        sensor.set_measurement_mode(DistanceConstants.MODE_SINGLE)
+        stop.set()
+        busy = sensor.bus.get_stats()['busy_seconds'] - busy_before
+        stats = sensor.get_data_ready_stats()
+        sensor.cleanup()
+        
+        latencies.sort()
+        path = DistanceConstants.READY_INTERRUPT if stats['interrupt_armed'] else DistanceConstants.READY_POLLING
+        print(f"{path:10s} {len(latencies) / duration:8.1f} {sum(latencies) / len(latencies) * 1000:16.2f} "
+              f"{latencies[int(len(latencies) * 0.99)] * 1000:7.2f} {busy / duration:8.0%} "
+              f"{sum(waits) / len(waits) * 1000:20.2f}")
+        print(f"  reads {stats['reads']}, edge timeouts {stats['edge_timeouts']}")
@@ -0,0 +1,241 @@
+"""
+<summary>
+Adaptive timing budget for the VL53L0X: picks the accuracy mode from what the
+scene is doing - fast ranging while something approaches, precise ranging once
+the scene is still - and measures the rate and noise each mode achieves
+</summary>
+<hardware>VL53L0X Time-of-Flight Distance Sensor (I2C)</hardware>
+<dependencies>collections</dependencies>
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from .constants import DistanceConstants
+from .distance_filter import clamp_reading
+
+
+class TimingBudgetController:
+    """
+    <summary>
+    Chooses the accuracy mode after every reading (not thread-safe; one
+    instance per sensor). The approach speed is a least-squares slope over the
+    last ADAPTIVE_SPEED_WINDOW seconds of filtered readings. Speeding up is
+    immediate - on an approach, a new object in range, or a raw reading well
+    inside the estimate that the filter may still be rejecting as a spike -
+    while slowing down waits for the hold times, so a short pause does not
+    cost a 200 ms reading.
+    </summary>
+    """
+
+    def __init__(self, accuracy: str = DistanceConstants.DEFAULT_ACCURACY) -> None:
+        """
+        <summary>Create controller</summary>
+        <param name="accuracy">Accuracy mode the sensor is currently running</param>
+        <returns>None</returns>
+        """
+        self.accuracy = accuracy
+        self.speed_mm_s: Optional[float] = None  # positive while approaching
+        self.switches = 0
+        self._readings: Deque[Tuple[float, float]] = deque()
+        self._in_range = False
+        self._last_approach = -math.inf
+        self._still_since: Optional[float] = None
+        self._last_raw: Optional[float] = None
+        self._last_timestamp: Optional[float] = None
+        self._profiles: Dict[str, Dict[str, float]] = {}
+
+    def update(self, timestamp: float, raw_mm: Optional[float], distance_mm: Optional[float]) -> str:
+        """
+        <summary>Account one reading and choose the accuracy mode for the next ones</summary>
+        <param name="timestamp">Reading time (time.monotonic() seconds)</param>
+        <param name="raw_mm">Raw sensor reading in mm</param>
+        <param name="distance_mm">Filtered distance in mm, None while nothing is in range</param>
+        <returns>Accuracy mode to run (DistanceConstants.ACCURACY_*)</returns>
+        """
+        profile = self._profile(self.accuracy)
+        profile['samples'] += 1
+        if self._last_timestamp is not None:
+            profile['seconds'] += timestamp - self._last_timestamp
+        self._last_timestamp = timestamp
+
+        raw_mm = clamp_reading(raw_mm)
+        last_raw, self._last_raw = self._last_raw, raw_mm
+
+        if distance_mm is None:
+            # Nothing in range: a new object is caught at the balanced rate
+            self._readings.clear()
+            self._in_range = False
+            self._still_since = None
+            self.speed_mm_s = None
+            return self._choose(timestamp)
+
+        approaching = not self._in_range
+        self._in_range = True
+        if raw_mm is not None and raw_mm < distance_mm - DistanceConstants.FILTER_GATE_MIN_MM:
+            approaching = True
+
+        self.speed_mm_s = self._update_speed(timestamp, distance_mm)
+        if self.speed_mm_s is not None and self.speed_mm_s > DistanceConstants.ADAPTIVE_APPROACH_SPEED_MM_S:
+            approaching = True
+        if approaching:
+            self._last_approach = timestamp
+
+        if self.speed_mm_s is not None and abs(self.speed_mm_s) < DistanceConstants.ADAPTIVE_STATIC_SPEED_MM_S:
+            if self._still_since is None:
+                self._still_since = timestamp
+            if raw_mm is not None and last_raw is not None and abs(raw_mm - last_raw) < DistanceConstants.FILTER_GATE_MIN_MM:
+                # Still scene: reading-to-reading differences are pure sensor noise (variance 2 sigma^2)
+                variance = (raw_mm - last_raw) ** 2 / 2.0
+                average = profile['noise_variance']
+                profile['noise_variance'] = variance if average is None else \
+                    average + DistanceConstants.ADAPTIVE_NOISE_SMOOTHING * (variance - average)
+        else:
+            self._still_since = None
+        return self._choose(timestamp)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        <summary>Get the current decision and the achieved rate and noise per accuracy mode</summary>
+        <returns>Dictionary of controller statistics</returns>
+        """
+        profiles = {}
+        for accuracy, profile in self._profiles.items():
+            variance = profile['noise_variance']
+            profiles[accuracy] = {
+                'samples': int(profile['samples']),
+                'seconds': profile['seconds'],
+                'rate_hz': profile['samples'] / profile['seconds'] if profile['seconds'] else None,
+                'noise_mm': math.sqrt(variance) if variance is not None else None
+            }
+        return {
+            'accuracy': self.accuracy,
+            'speed_mm_s': self.speed_mm_s,
+            'switches': self.switches,
+            'profiles': profiles
+        }
+
+    def _choose(self, timestamp: float) -> str:
+        """Pick the accuracy mode from the approach and stillness times"""
+        if timestamp - self._last_approach < DistanceConstants.ADAPTIVE_FAST_HOLD:
+            accuracy = DistanceConstants.ADAPTIVE_FAST
+        elif self._still_since is not None and timestamp - self._still_since >= DistanceConstants.ADAPTIVE_STATIC_HOLD:
+            accuracy = DistanceConstants.ADAPTIVE_PRECISE
+        else:
+            accuracy = DistanceConstants.ADAPTIVE_BALANCED
+        if accuracy != self.accuracy:
+            self.accuracy = accuracy
+            self.switches += 1
+        return accuracy
+
+    def _update_speed(self, timestamp: float, distance_mm: float) -> Optional[float]:
+        """Least-squares approach speed (mm/s) over the speed window, None until 3 readings"""
+        readings = self._readings
+        readings.append((timestamp, distance_mm))
+        while len(readings) > 3 and timestamp - readings[0][0] > DistanceConstants.ADAPTIVE_SPEED_WINDOW:
+            readings.popleft()
+        if len(readings) < 3:
+            return None
+        mean_time = sum(t for t, _ in readings) / len(readings)
+        mean_distance = sum(d for _, d in readings) / len(readings)
+        spread = sum((t - mean_time) ** 2 for t, _ in readings)
+        if spread <= 0.0:
+            return None
+        slope = sum((t - mean_time) * (d - mean_distance) for t, d in readings) / spread
+        return -slope
+
+    def _profile(self, accuracy: str) -> Dict[str, Any]:
+        """Counters of one accuracy mode"""
+        profile = self._profiles.get(accuracy)
+        if profile is None:
+            profile = self._profiles[accuracy] = {'samples': 0, 'seconds': 0.0, 'noise_variance': None}
+        return profile
+
+
+if __name__ == "__main__":
+    import numpy as np
+
+    from src.simulation.settings import settings
+    from src.simulation.vl53l0x import VL53L0X, Vl53l0xAccuracyMode
+    from .distance_filter import DistanceFilter
+
+    # 30 s scene in simulated time: still at 90 cm, approach to 10 cm at 40 cm/s,
+    # still, back off, still. The sensor clock advances by the budget of each reading.
+    def truth_at(t: float) -> float:
+        if t < 8.0:
+            return 900.0
+        if t < 10.0:
+            return 900.0 - 400.0 * (t - 8.0)
+        if t < 18.0:
+            return 100.0
+        if t < 20.0:
+            return 100.0 + 400.0 * (t - 18.0)
+        return 900.0
+
+    moving = ((8.0, 10.0), (18.0, 20.0))
+    duration = 30.0
+    threshold_mm = DistanceConstants.PROXIMITY_THRESHOLD_CM * 10
+    crossing = 8.0 + (900.0 - threshold_mm) / 400.0
+
+    def run(fixed: Optional[str]) -> Dict[str, Any]:
+        settings.configure(time_scale=0)
+        settings.seed(3)
+        sensor = VL53L0X()
+        sensor.open()
+        distance_filter = DistanceFilter(DistanceConstants.FILTER_KALMAN)
+        controller = TimingBudgetController()
+        accuracy = None
+
+        def apply(new_accuracy: str) -> None:
+            sensor.stop_ranging()
+            sensor.start_ranging(getattr(Vl53l0xAccuracyMode, DistanceConstants.ACCURACY_MODE_NAMES[new_accuracy]))
+            distance_filter.set_timing_budget(sensor.get_timing())
+
+        accuracy = fixed or controller.accuracy
+        apply(accuracy)
+        t, times, truths, outputs = 0.0, [], [], []
+        while t < duration:
+            t += sensor.get_timing() / 1_000_000
+            settings.distance_override_mm = truth_at(t)
+            raw = sensor.get_distance()
+            value = distance_filter.update(float(raw))
+            times.append(t)
+            truths.append(truth_at(t))
+            outputs.append(math.nan if value is None else value)
+            if fixed is None:
+                wanted = controller.update(t, float(raw), value)
+                if wanted != accuracy:
+                    accuracy = wanted
+                    apply(accuracy)
+        settings.distance_override_mm = None
+
+        times, truths, outputs = np.array(times), np.array(truths), np.array(outputs)
+        in_motion = np.zeros(len(times), dtype=bool)
+        for start, end in moving:
+            in_motion |= (times >= start) & (times < end)
+        settled = ~in_motion
+        for start, end in moving:
+            # Skip the filter settling right after each movement
+            settled &= ~((times >= end) & (times < end + 1.0))
+        error = outputs - truths
+        detected = times[(times >= crossing) & (outputs < threshold_mm)]
+        return {
+            'rate_hz': len(times) / duration,
+            'still_rmse': float(np.sqrt(np.nanmean(error[settled] ** 2))),
+            'moving_rmse': float(np.sqrt(np.nanmean(error[in_motion] ** 2))),
+            'detect_ms': (detected[0] - crossing) * 1000 if len(detected) else math.nan,
+            'stats': controller.get_stats() if fixed is None else None
+        }
+
+    print(f"{'profile':12s} {'rate Hz':>8s} {'still rmse mm':>13s} {'moving rmse mm':>14s} {'detect ms':>9s}")
+    for name in (DistanceConstants.ADAPTIVE_FAST, DistanceConstants.ADAPTIVE_BALANCED,
+                 DistanceConstants.ADAPTIVE_PRECISE, None):
+        result = run(name)
+        print(f"{name or 'adaptive':12s} {result['rate_hz']:8.1f} {result['still_rmse']:13.1f} "
+              f"{result['moving_rmse']:14.1f} {result['detect_ms']:9.0f}")
+    for accuracy, profile in result['stats']['profiles'].items():
+        noise = profile['noise_mm']
+        print(f"  {accuracy:10s} {profile['seconds']:5.1f}s at {profile['rate_hz'] or 0:5.1f} Hz, "
+              f"noise {noise if noise is not None else math.nan:.1f} mm")
+    print(f"  {result['stats']['switches']} switches")
@@ -6,10 +6,18 @@ Controls the Arducam Raspberry Pi Camera Module 3 for vision capture and process
 <dependencies>libcamera, picamera2, opencv-python</dependencies>
 """
 
-from typing import Optional
-from picamera2 import Picamera2
-import cv2
-import numpy as np
+from __future__ import annotations
+
+import time
+from typing import Optional, Any
+
+from src.core.utils.lazy_import import lazy_import
+from src.core.utils.metrics import metrics
+from .constants import CameraConstants
+
+# Heavy dependencies are imported on first initialize()
+picamera2 = lazy_import("picamera2", simulated="src.simulation.picamera2")
+np = lazy_import("numpy")
 
 
 class CameraController:
@@ -28,17 +36,35 @@ class CameraController:
         """
         self.resolution = resolution
         self.fps = fps
-        self.camera: Optional[Picamera2] = None
+        self.camera: Optional[Any] = None
         self.is_initialized = False
+        self.frames_captured = metrics.counter(
+            "zolo_camera_frames_captured_total", "Frames captured", device=CameraConstants.DEVICE_NAME
+        )
+        self.frames_dropped = metrics.counter(
+            "zolo_camera_frames_dropped_total", "Capture attempts that returned no frame",
+            device=CameraConstants.DEVICE_NAME
+        )
+        self.capture_seconds = metrics.histogram(
+            "zolo_camera_capture_seconds", "Frame capture latency", device=CameraConstants.DEVICE_NAME
+        )
     
     def initialize(self) -> bool:
         """
         <summary>Initialize camera hardware and configuration</summary>
         <returns>True if successful, False otherwise</returns>
         """
+        if not picamera2.is_available():
+            print(f"Camera initialization failed: picamera2 unavailable ({picamera2.get_error()})")
+            return False
+        
         try:
-            self.camera = Picamera2()
-            # Basic initialization - skeleton implementation
+            self.camera = picamera2.Picamera2()
+            config = self.camera.create_still_configuration(
+                main={"size": self.resolution, "format": CameraConstants.DEFAULT_FORMAT}
+            )
+            self.camera.configure(config)
+            self.camera.start()
             self.is_initialized = True
             return True
         except Exception as e:
@@ -53,8 +79,19 @@ class CameraController:
         if not self.is_initialized:
             return None
         
-        # Skeleton implementation
-        return None
+        started = time.perf_counter()
+        try:
+            frame = self.camera.capture_array()
+        except Exception as e:
+            self.frames_dropped.inc()
+            print(f"Image capture failed: {e}")
+            return None
+        self.capture_seconds.observe(time.perf_counter() - started)
+        if frame is None:
+            self.frames_dropped.inc()
+        else:
+            self.frames_captured.inc()
+        return frame
     
     def start_preview(self) -> bool:
         """
@@ -90,6 +127,8 @@ class CameraController:
         <returns>None</returns>
         """
         if self.camera:
+            if self.camera.started:
+                self.camera.stop()
             self.camera.close()
             self.camera = None
         self.is_initialized = False
\ No newline at end of file
@@ -4,6 +4,9 @@
 class CameraConstants:
     """Camera configuration constants"""
     
+    # Device name (metrics)
+    DEVICE_NAME: str = "camera"
+    
     # Default camera settings
     DEFAULT_RESOLUTION: tuple = (1920, 1080)
     MAX_FPS: int = 30
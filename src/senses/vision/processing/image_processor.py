@@ -6,9 +6,15 @@ OpenCV-based image processing for object detection and visual analysis
 <dependencies>opencv-python, numpy</dependencies>
 """
 
+from __future__ import annotations
+
 from typing import Optional, Tuple, List
-import cv2
-import numpy as np
+
+from src.core.utils.lazy_import import lazy_import
+
+# OpenCV is imported on first use
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
 
 
 class ImageProcessor:
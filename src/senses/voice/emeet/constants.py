@@ -4,6 +4,9 @@
 class SpeakerConstants:
     """Speaker configuration constants"""
     
+    # Device name (circuit breaker / metrics)
+    DEVICE_NAME: str = "speaker"
+    
     # Audio settings
     DEFAULT_SAMPLE_RATE: int = 44100
     DEFAULT_CHANNELS: int = 2
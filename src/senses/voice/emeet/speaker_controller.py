@@ -6,10 +6,20 @@ Controls the EMEET M0 Plus speaker for audio output and playback
 <dependencies>pyaudio, sounddevice</dependencies>
 """
 
+from __future__ import annotations
+
 from typing import Optional
-import pyaudio
-import sounddevice as sd
-import numpy as np
+
+from src.core.utils.hardware_utils import HardwareUtils
+from src.core.utils.lazy_import import lazy_import
+from src.core.utils.metrics import metrics
+from src.core.utils.retry_policy import CircuitOpenError
+from .constants import SpeakerConstants
+
+# Audio backends are imported on first initialize()
+pyaudio = lazy_import("pyaudio", simulated="src.simulation.pyaudio")
+sd = lazy_import("sounddevice")
+np = lazy_import("numpy")
 
 
 class SpeakerController:
@@ -32,12 +42,19 @@ class SpeakerController:
         self.is_initialized = False
         self.is_playing = False
         self.volume = 0.5
+        self.underruns = metrics.counter(
+            "zolo_audio_underruns_total", "Output buffers the device ran out of", device=SpeakerConstants.DEVICE_NAME
+        )
     
     def initialize(self) -> bool:
         """
         <summary>Initialize speaker hardware and audio interface</summary>
         <returns>True if successful, False otherwise</returns>
         """
+        if not pyaudio.is_available():
+            print(f"Speaker initialization failed: pyaudio unavailable ({pyaudio.get_error()})")
+            return False
+        
         try:
             self.audio = pyaudio.PyAudio()
             self.is_initialized = True
@@ -55,8 +72,52 @@ class SpeakerController:
         if not self.is_initialized:
             return False
         
-        # Skeleton implementation
         self.is_playing = True
+        try:
+            samples = np.clip(np.asarray(audio_data, dtype=np.float32) * self.volume, -32768, 32767)
+            self._write_audio(samples.astype(np.int16).tobytes())
+            return True
+        except CircuitOpenError:
+            return False
+        except Exception as e:
+            print(f"Audio playback failed: {e}")
+            return False
+        finally:
+            self.is_playing = False
+    
+    @HardwareUtils.retry_on_failure(device=SpeakerConstants.DEVICE_NAME, probe='_probe_output')
+    def _write_audio(self, frames: bytes) -> None:
+        """
+        <summary>Open an output stream and write 16-bit PCM frames</summary>
+        <param name="frames">Raw audio bytes</param>
+        <returns>None</returns>
+        """
+        stream = self.audio.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.sample_rate,
+            output=True,
+            frames_per_buffer=SpeakerConstants.DEFAULT_CHUNK_SIZE
+        )
+        chunk_bytes = SpeakerConstants.DEFAULT_CHUNK_SIZE * self.channels * SpeakerConstants.BYTES_PER_SAMPLE
+        try:
+            for offset in range(0, len(frames), chunk_bytes):
+                try:
+                    stream.write(frames[offset:offset + chunk_bytes], exception_on_underflow=True)
+                except IOError as e:
+                    # Chunk was written, but the device starved before it arrived
+                    if e.errno != pyaudio.paOutputUnderflowed:
+                        raise
+                    self.underruns.inc()
+        finally:
+            stream.close()
+    
+    def _probe_output(self) -> bool:
+        """
+        <summary>Check that an output device is present (breaker probe - never plays audio)</summary>
+        <returns>True if available</returns>
+        """
+        self.audio.get_default_output_device_info()
         return True
     
     def stop_playback(self) -> bool:
@@ -108,8 +169,12 @@ class SpeakerController:
         <param name="duration">Duration in seconds</param>
         <returns>True if successful, False otherwise</returns>
         """
-        # Skeleton implementation
-        return True
+        if not self.is_initialized:
+            return False
+        
+        t = np.arange(int(self.sample_rate * duration)) / self.sample_rate
+        tone = np.sin(2 * np.pi * frequency * t) * 32767
+        return self.play_audio(np.repeat(tone, self.channels))
     
     def cleanup(self) -> None:
         """
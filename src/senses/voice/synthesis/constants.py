@@ -4,6 +4,9 @@
 class SynthesisConstants:
     """Text-to-speech configuration constants"""
     
+    # Device name (metrics)
+    DEVICE_NAME: str = "text_to_speech"
+    
     # Voice settings
     DEFAULT_RATE: int = 200  # words per minute
     MIN_RATE: int = 50
@@ -6,9 +6,21 @@ Text-to-speech synthesis using pyttsx3 and future Bittensor AI voice integration
 <dependencies>pyttsx3, numpy</dependencies>
 """
 
+from __future__ import annotations
+
+import shutil
+import time
 from typing import Optional, List
-import pyttsx3
-import numpy as np
+
+from src.core.constants.global_constants import ZoloConstants
+from src.core.utils.disk_cache import get_shared_cache
+from src.core.utils.lazy_import import lazy_import
+from src.core.utils.metrics import metrics
+from .constants import SynthesisConstants
+
+# Speech engine is imported on first initialize()
+pyttsx3 = lazy_import("pyttsx3", simulated="src.simulation.pyttsx3")
+np = lazy_import("numpy")
 
 
 class TextToSpeech:
@@ -27,15 +39,27 @@ class TextToSpeech:
         """
         self.voice_id = voice_id
         self.rate = rate
+        self.volume = SynthesisConstants.DEFAULT_VOLUME
         self.engine = None
         self.is_initialized = False
         self.is_speaking = False
+        self.speak_seconds = metrics.histogram(
+            "zolo_tts_speak_seconds", "Time from speak() to end of playback",
+            buckets=ZoloConstants.METRICS_SPEECH_BUCKETS, device=SynthesisConstants.DEVICE_NAME
+        )
+        self.speak_errors = metrics.counter(
+            "zolo_tts_errors_total", "Failed speech synthesis calls", device=SynthesisConstants.DEVICE_NAME
+        )
     
     def initialize(self) -> bool:
         """
         <summary>Initialize text-to-speech engine</summary>
         <returns>True if successful, False otherwise</returns>
         """
+        if not pyttsx3.is_available():
+            print(f"TTS engine initialization failed: pyttsx3 unavailable ({pyttsx3.get_error()})")
+            return False
+        
         try:
             self.engine = pyttsx3.init()
             self.engine.setProperty('rate', self.rate)
@@ -56,9 +80,19 @@ class TextToSpeech:
         if not self.is_initialized or not text:
             return False
         
-        # Skeleton implementation
         self.is_speaking = True
-        return True
+        started = time.perf_counter()
+        try:
+            self.engine.say(text)
+            self.engine.runAndWait()
+            self.speak_seconds.observe(time.perf_counter() - started)
+            return True
+        except Exception as e:
+            self.speak_errors.inc()
+            print(f"Speech synthesis failed: {e}")
+            return False
+        finally:
+            self.is_speaking = False
     
     def stop_speaking(self) -> bool:
         """
@@ -105,6 +139,7 @@ class TextToSpeech:
         if not self.is_initialized:
             return False
         
+        self.volume = volume
         self.engine.setProperty('volume', volume)
         return True
     
@@ -119,6 +154,29 @@ class TextToSpeech:
         # Skeleton implementation
         return []
     
+    def synthesize(self, text: str) -> Optional[str]:
+        """
+        <summary>Render speech to a WAV file, reusing the cached rendering of the same text and voice settings</summary>
+        <param name="text">Text to convert to speech</param>
+        <returns>Path of the cached WAV file or None if failed</returns>
+        """
+        if not self.is_initialized or not text:
+            return None
+        
+        def render(path: str) -> None:
+            self.engine.save_to_file(text, path)
+            self.engine.runAndWait()
+        
+        try:
+            path = get_shared_cache().get_or_compute_file(
+                "tts", (text, self.voice_id, self.rate, self.volume), render, suffix=".wav"
+            )
+            return str(path) if path else None
+        except Exception as e:
+            self.speak_errors.inc()
+            print(f"Speech synthesis failed: {e}")
+            return None
+    
     def save_to_file(self, text: str, filename: str) -> bool:
         """
         <summary>Save speech synthesis to audio file</summary>
@@ -126,8 +184,21 @@ class TextToSpeech:
         <param name="filename">Output filename</param>
         <returns>True if successful, False otherwise</returns>
         """
-        # Skeleton implementation
-        return True
+        if not self.is_initialized:
+            return False
+        
+        try:
+            cached = self.synthesize(text)
+            if cached:
+                shutil.copyfile(cached, filename)
+            else:
+                # Cache unavailable: render straight to the destination
+                self.engine.save_to_file(text, filename)
+                self.engine.runAndWait()
+            return True
+        except Exception as e:
+            print(f"Saving speech failed: {e}")
+            return False
     
     def cleanup(self) -> None:
         """
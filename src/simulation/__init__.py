@@ -0,0 +1,12 @@
+"""
+Simulated hardware backends for running and profiling Zolo off-device.
+
+Each module mimics the API of the hardware library it replaces (VL53L0X,
+adafruit_tsl2561, neopixel, picamera2, pyaudio, ...). Drivers pick them up
+through the lazy import layer when ZOLO_BACKEND=simulated (or 'auto').
+"""
+
+from .settings import settings, SimulationSettings
+from .constants import SimulationConstants
+
+__all__ = ['settings', 'SimulationSettings', 'SimulationConstants']
@@ -0,0 +1,163 @@
+"""
+<summary>
+Simulated adafruit_tsl2561 module - luminosity channels derived from the synthetic scene
+</summary>
+<hardware>None - simulates TSL2561 Luminosity Sensor (I2C)</hardware>
+<dependencies>time</dependencies>
+"""
+
+import time
+
+from .settings import settings
+
+# Saturation thresholds used by the Adafruit driver per integration time register
+CLIP_THRESHOLD = (4900, 37000, 65000)
+INTEGRATION_TIME = (13.7, 101.0, 402.0)
+
+
+class TSL2561:
+    """
+    <summary>
+    Simulated TSL2561. While enabled the ADCs integrate back to back and the
+    channel registers hold the counts of the last completed window, so reading
+    them never waits (counts are 0 until the first window after power-on
+    completes). Gain and integration time writes take effect when the next
+    window starts; powering the device up starts a window at once. gain
+    (0 = 1x, 1 = 16x) and integration_time (0/1/2) follow the Adafruit API.
+    </summary>
+    """
+
+    def __init__(self, i2c, address: int = 0x39) -> None:
+        self.i2c = i2c
+        self.address = address
+        self._gain = 0
+        self._integration_time = 1
+        self._enabled = False
+        self._window_start = 0.0
+        self._window_setting = (self._gain, self._integration_time)  # Registers the running window uses
+        self._counts = (0, 0)
+        self._light = []  # (monotonic time, scene lux) whenever a new level was seen, oldest first
+        settings.wait(0.005)
+        # The Adafruit constructor powers the device up
+        self.enabled = True
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._advance()
+        if value and not self._enabled:
+            self._window_start = time.monotonic()
+            self._window_setting = (self._gain, self._integration_time)
+        self._enabled = bool(value)
+
+    @property
+    def gain(self) -> int:
+        return self._gain
+
+    @gain.setter
+    def gain(self, value: int) -> None:
+        self._advance()
+        self._gain = value
+
+    @property
+    def integration_time(self) -> int:
+        return self._integration_time
+
+    @integration_time.setter
+    def integration_time(self, value: int) -> None:
+        self._advance()
+        self._integration_time = value
+
+    @property
+    def luminosity(self) -> tuple:
+        self._advance()
+        return self._counts
+
+    def _window_seconds(self, integration_time: int) -> float:
+        return settings.tsl2561_integration_ms[integration_time] / 1000 * settings.time_scale
+
+    def _advance(self) -> None:
+        """Latch the counts of every window completed by now"""
+        if not self._enabled:
+            return
+        now = time.monotonic()
+        lux = settings.scene_lux()
+        if self._window_seconds(self._integration_time) <= 0:
+            # No simulated time passes: every read sees a window completed at the current registers
+            self._window_setting = (self._gain, self._integration_time)
+            self._counts = self._integrate(*self._window_setting, lux)
+            return
+
+        # The scene is only observed here; a new level counts from the access that saw it
+        if not self._light or self._light[-1][1] != lux:
+            self._light.append((now, lux))
+        end = self._window_start + self._window_seconds(self._window_setting[1])
+        if end > now:
+            return
+        self._counts = self._integrate(*self._window_setting, self._mean_lux(self._window_start, end))
+        # Later windows run at the current registers; skip to the one in progress
+        self._window_setting = (self._gain, self._integration_time)
+        window = self._window_seconds(self._integration_time)
+        completed = int((now - end) // window)
+        self._window_start = end + completed * window
+        if completed:
+            self._counts = self._integrate(*self._window_setting,
+                                           self._mean_lux(self._window_start - window, self._window_start))
+        while len(self._light) > 1 and self._light[1][0] <= self._window_start:
+            self._light.pop(0)
+
+    def _mean_lux(self, start: float, end: float) -> float:
+        """Scene lux averaged over one window"""
+        total = 0.0
+        for index, (seen_at, lux) in enumerate(self._light):
+            until = self._light[index + 1][0] if index + 1 < len(self._light) else end
+            since = start if index == 0 else max(start, seen_at)
+            total += lux * max(0.0, min(end, until) - since)
+        return total / (end - start)
+
+    def _integrate(self, gain: int, integration_time: int, lux: float) -> tuple:
+        """Channel counts of one window at the given registers"""
+        scale = (INTEGRATION_TIME[integration_time] / 402.0) * (16 if gain else 1)
+        max_counts = settings.tsl2561_max_counts[integration_time]
+
+        broadband = lux * settings.tsl2561_counts_per_lux * scale
+        broadband = max(0.0, broadband + settings.gauss(1.0))
+        infrared = broadband * settings.tsl2561_ir_ratio
+        return (min(max_counts, int(broadband)), min(max_counts, int(infrared)))
+
+    @property
+    def broadband(self) -> int:
+        return self.luminosity[0]
+
+    @property
+    def infrared(self) -> int:
+        return self.luminosity[1]
+
+    @property
+    def lux(self):
+        return self._compute_lux(*self.luminosity)
+
+    def _compute_lux(self, ch0: int, ch1: int):
+        # Same piecewise approximation as the Adafruit driver (datasheet p. 23)
+        if ch0 == 0:
+            return None
+        if ch0 > CLIP_THRESHOLD[self.integration_time] or ch1 > CLIP_THRESHOLD[self.integration_time]:
+            return None
+        ratio = ch1 / ch0
+        if ratio <= 0.50:
+            lux = 0.0304 * ch0 - 0.062 * ch0 * ratio ** 1.4
+        elif ratio <= 0.61:
+            lux = 0.0224 * ch0 - 0.031 * ch1
+        elif ratio <= 0.80:
+            lux = 0.0128 * ch0 - 0.0153 * ch1
+        elif ratio <= 1.30:
+            lux = 0.00146 * ch0 - 0.00112 * ch1
+        else:
+            lux = 0.0
+        if self.gain == 0:
+            lux *= 16
+        lux *= 402.0 / INTEGRATION_TIME[self.integration_time]
+        return lux
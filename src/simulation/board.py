@@ -0,0 +1,9 @@
+"""Simulated CircuitPython board module - Raspberry Pi pin names"""
+
+SDA = 2
+SCL = 3
+
+# D0 .. D27 map to BCM GPIO numbers
+for _pin in range(28):
+    globals()[f"D{_pin}"] = _pin
+del _pin
@@ -0,0 +1,26 @@
+"""Simulated CircuitPython busio module"""
+
+import threading
+
+
+class I2C:
+    """Simulated I2C bus handle"""
+
+    def __init__(self, scl: int, sda: int, frequency: int = 100000) -> None:
+        self.scl = scl
+        self.sda = sda
+        self.frequency = frequency
+        self._lock = threading.Lock()
+
+    def try_lock(self) -> bool:
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self) -> None:
+        if self._lock.locked():
+            self._lock.release()
+
+    def scan(self) -> list:
+        return [0x29, 0x39]
+
+    def deinit(self) -> None:
+        pass
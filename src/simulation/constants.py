@@ -0,0 +1,61 @@
+"""Simulated hardware backend constants"""
+
+
+class SimulationConstants:
+    """Simulated device timing and signal constants"""
+    
+    # Global timing
+    TIME_SCALE: float = 1.0        # Multiplies every simulated latency (0 disables waiting)
+    JITTER_RATIO: float = 0.1      # Gaussian jitter as a fraction of the nominal latency
+    TIME_SCALE_ENV_VAR: str = "ZOLO_SIM_TIME_SCALE"
+    
+    # VL53L0X - timing budget per accuracy mode (microseconds)
+    VL53L0X_TIMING_BUDGETS_US: dict = {
+        'GOOD': 33000,
+        'BETTER': 66000,
+        'BEST': 200000,
+        'LONG_RANGE': 33000,
+        'HIGH_SPEED': 20000,
+    }
+    VL53L0X_BOOT_LATENCY: float = 0.05
+    VL53L0X_POLL_INTERVAL: float = 0.005    # Status polling period of the library's blocking read
+    VL53L0X_GPIO1_PIN: int = 12             # Data-ready line (HardwarePins.DISTANCE_SENSOR_INTERRUPT), None if unwired
+    DISTANCE_NOISE_MM: float = 5.0
+    DISTANCE_OUTLIER_RATE: float = 0.02     # Spurious short returns / out-of-range reads
+    DISTANCE_OUT_OF_RANGE_MM: int = 8190
+    DISTANCE_GAIN: float = 1.0             # Uncalibrated ranging error: measured = true * gain + offset
+    DISTANCE_OFFSET_MM: float = 0.0
+    
+    # TSL2561 - integration time per register value (milliseconds)
+    TSL2561_INTEGRATION_MS: dict = {0: 13.7, 1: 101.0, 2: 402.0}
+    TSL2561_MAX_COUNTS: dict = {0: 5047, 1: 37177, 2: 65535}
+    TSL2561_COUNTS_PER_LUX: float = 3.3     # Broadband counts per lux at 1x gain, 402 ms
+    TSL2561_IR_RATIO: float = 0.3
+    
+    # NeoPixel - WS2812 needs 24 bits at 1.25 us each per LED, plus latch
+    NEOPIXEL_US_PER_LED: float = 30.0
+    NEOPIXEL_LATCH_US: float = 80.0
+    
+    # GPIO - kernel edge interrupt to user-space wake-up
+    GPIO_INTERRUPT_LATENCY: float = 0.0001
+    
+    # Camera
+    CAMERA_STARTUP_LATENCY: float = 0.5
+    CAMERA_FRAME_RATE: float = 30.0
+    
+    # Audio
+    AUDIO_INIT_LATENCY: float = 0.05
+    AUDIO_TONE_HZ: float = 220.0
+    AUDIO_NOISE_LEVEL: float = 0.02
+    
+    # Speech
+    AMBIENT_NOISE_CALIBRATION: float = 1.0  # Default adjust_for_ambient_noise duration
+    TTS_INIT_LATENCY: float = 0.2
+    
+    # Synthetic scene
+    SCENE_BASE_DISTANCE_MM: float = 650.0
+    SCENE_DISTANCE_SWING_MM: float = 600.0
+    SCENE_DISTANCE_PERIOD: float = 30.0
+    SCENE_BASE_LUX: float = 300.0
+    SCENE_LUX_SWING: float = 0.5
+    SCENE_LUX_PERIOD: float = 120.0
@@ -0,0 +1,174 @@
+"""
+<summary>
+Simulated RPi.GPIO module - input levels are driven from code and edges wake
+waiters and event callbacks like the kernel edge interrupts would
+</summary>
+<hardware>None - simulates Raspberry Pi GPIO header</hardware>
+<dependencies>threading</dependencies>
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from .settings import settings
+
+BCM = 11
+BOARD = 10
+OUT = 0
+IN = 1
+LOW = 0
+HIGH = 1
+PUD_OFF = 20
+PUD_DOWN = 21
+PUD_UP = 22
+RISING = 31
+FALLING = 32
+BOTH = 33
+
+_mode: Optional[int] = None
+_condition = threading.Condition()
+_levels: Dict[int, int] = {}
+_directions: Dict[int, int] = {}
+_edge_counts: Dict[int, List[int]] = {}  # [rising, falling] per channel
+_detectors: Dict[int, Dict] = {}
+
+
+def setmode(mode: int) -> None:
+    global _mode
+    _mode = mode
+
+
+def getmode() -> Optional[int]:
+    return _mode
+
+
+def setwarnings(flag: bool) -> None:
+    pass
+
+
+def setup(channel: int, direction: int, pull_up_down: int = PUD_OFF, initial: int = LOW) -> None:
+    with _condition:
+        _directions[channel] = direction
+        if direction == IN:
+            _levels[channel] = HIGH if pull_up_down == PUD_UP else LOW
+        else:
+            _levels[channel] = initial
+        _edge_counts.setdefault(channel, [0, 0])
+
+
+def input(channel: int) -> int:
+    with _condition:
+        return _levels.get(channel, LOW)
+
+
+def output(channel: int, value: int) -> None:
+    if _directions.get(channel) != OUT:
+        raise RuntimeError(f"GPIO channel {channel} is not set up as an output")
+    _drive(channel, HIGH if value else LOW)
+
+
+def _matches(edge: int, rising: bool) -> bool:
+    return edge == BOTH or (edge == RISING) == rising
+
+
+def _drive(channel: int, level: int) -> None:
+    with _condition:
+        previous = _levels.get(channel, LOW)
+        _levels[channel] = level
+        if previous == level:
+            return
+        rising = level == HIGH
+        _edge_counts.setdefault(channel, [0, 0])[0 if rising else 1] += 1
+        _condition.notify_all()
+        detector = _detectors.get(channel)
+
+    if detector is None or not _matches(detector['edge'], rising):
+        return
+    now = time.monotonic()
+    bounce = (detector['bouncetime'] or 0) / 1000.0
+    if now - detector['last'] < bounce:
+        return
+    detector['last'] = now
+    detector['detected'] = True
+    if detector['callbacks']:
+        # RPi.GPIO runs callbacks on its own event thread
+        threading.Thread(target=_run_callbacks, args=(channel, list(detector['callbacks'])), daemon=True).start()
+
+
+def _run_callbacks(channel: int, callbacks: List[Callable[[int], None]]) -> None:
+    settings.wait(settings.gpio_interrupt_latency)
+    for callback in callbacks:
+        callback(channel)
+
+
+def add_event_detect(channel: int, edge: int, callback: Optional[Callable[[int], None]] = None,
+                     bouncetime: Optional[int] = None) -> None:
+    if channel in _detectors:
+        raise RuntimeError(f"Conflicting edge detection already enabled for GPIO channel {channel}")
+    _detectors[channel] = {
+        'edge': edge,
+        'bouncetime': bouncetime,
+        'callbacks': [callback] if callback else [],
+        'last': float('-inf'),
+        'detected': False,
+    }
+
+
+def add_event_callback(channel: int, callback: Callable[[int], None]) -> None:
+    if channel not in _detectors:
+        raise RuntimeError("Add event detection using add_event_detect first before adding a callback")
+    _detectors[channel]['callbacks'].append(callback)
+
+
+def remove_event_detect(channel: int) -> None:
+    _detectors.pop(channel, None)
+
+
+def event_detected(channel: int) -> bool:
+    detector = _detectors.get(channel)
+    if detector is None or not detector['detected']:
+        return False
+    detector['detected'] = False
+    return True
+
+
+def wait_for_edge(channel: int, edge: int, bouncetime: Optional[int] = None,
+                  timeout: Optional[int] = None) -> Optional[int]:
+    deadline = None if timeout is None else time.monotonic() + timeout / 1000.0
+
+    def edges() -> int:
+        rising, falling = _edge_counts.get(channel, (0, 0))
+        return {RISING: rising, FALLING: falling}.get(edge, rising + falling)
+
+    with _condition:
+        seen = edges()
+        while edges() == seen:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            _condition.wait(remaining)
+    settings.wait(settings.gpio_interrupt_latency)
+    return channel
+
+
+def cleanup(channel: Optional[int] = None) -> None:
+    with _condition:
+        channels = [channel] if channel is not None else list(_directions)
+        for pin in channels:
+            _directions.pop(pin, None)
+            _detectors.pop(pin, None)
+            _levels.pop(pin, None)
+        _condition.notify_all()
+
+
+# Simulation-only helpers
+
+def set_input(channel: int, level: int) -> None:
+    """
+    <summary>Drive an input pin as the external circuit would (e.g., a button press)</summary>
+    <param name="channel">GPIO channel</param>
+    <param name="level">HIGH or LOW</param>
+    <returns>None</returns>
+    """
+    _drive(channel, HIGH if level else LOW)
@@ -0,0 +1,53 @@
+"""
+<summary>
+Simulated Adafruit neopixel module - keeps pixel state in memory and charges WS2812 write time
+</summary>
+<hardware>None - simulates NeoPixel Ring (WS2812)</hardware>
+<dependencies>None</dependencies>
+"""
+
+from .settings import settings
+
+RGB = "RGB"
+GRB = "GRB"
+
+
+class NeoPixel:
+    """Simulated NeoPixel strip"""
+
+    def __init__(self, pin, n: int, *, bpp: int = 3, brightness: float = 1.0,
+                 auto_write: bool = True, pixel_order: str = None) -> None:
+        self.pin = pin
+        self.n = n
+        self.bpp = bpp
+        self.brightness = brightness
+        self.auto_write = auto_write
+        self.pixel_order = pixel_order or GRB
+        self._pixels = [(0, 0, 0)] * n
+        self.frames_shown = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, index):
+        return self._pixels[index]
+
+    def __setitem__(self, index, color) -> None:
+        if isinstance(index, slice):
+            self._pixels[index] = [tuple(c) for c in color]
+        else:
+            self._pixels[index] = tuple(color)
+        if self.auto_write:
+            self.show()
+
+    def fill(self, color) -> None:
+        self._pixels = [tuple(color)] * self.n
+        if self.auto_write:
+            self.show()
+
+    def show(self) -> None:
+        settings.wait((self.n * settings.neopixel_us_per_led + settings.neopixel_latch_us) / 1_000_000)
+        self.frames_shown += 1
+
+    def deinit(self) -> None:
+        self._pixels = [(0, 0, 0)] * self.n
@@ -0,0 +1,82 @@
+"""
+<summary>
+Simulated picamera2 module - produces synthetic frames at the configured frame rate
+</summary>
+<hardware>None - simulates Arducam Module 3 (CSI)</hardware>
+<dependencies>numpy</dependencies>
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .settings import settings
+
+
+class Picamera2:
+    """
+    <summary>
+    Simulated camera. capture_array() blocks until the next frame boundary and
+    returns a moving gradient with sensor noise.
+    </summary>
+    """
+
+    def __init__(self, camera_num: int = 0) -> None:
+        settings.wait(settings.camera_startup_latency)
+        self.camera_num = camera_num
+        self.camera_config: Optional[Dict[str, Any]] = None
+        self.controls: Dict[str, Any] = {}
+        self.started = False
+        self._size = (640, 480)
+        self._base: Optional[np.ndarray] = None
+        self._frame_index = 0
+        self._next_frame = 0.0
+
+    def create_still_configuration(self, main: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return {'use_case': 'still', 'main': dict(main or {'size': (1920, 1080), 'format': 'RGB888'}), **kwargs}
+
+    def create_preview_configuration(self, main: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return {'use_case': 'preview', 'main': dict(main or {'size': (640, 480), 'format': 'XRGB8888'}), **kwargs}
+
+    def create_video_configuration(self, main: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return {'use_case': 'video', 'main': dict(main or {'size': (1280, 720), 'format': 'RGB888'}), **kwargs}
+
+    def configure(self, camera_config: Dict[str, Any]) -> None:
+        self.camera_config = camera_config
+        self._size = tuple(camera_config.get('main', {}).get('size', self._size))
+        width, height = self._size
+        gradient = np.linspace(0, 255, width, dtype=np.float32)
+        self._base = np.broadcast_to(gradient[None, :, None], (height, width, 3)).astype(np.uint8)
+
+    def set_controls(self, controls: Dict[str, Any]) -> None:
+        self.controls.update(controls)
+
+    def start(self, show_preview: bool = False) -> None:
+        if self._base is None:
+            self.configure(self.create_preview_configuration())
+        self.started = True
+        self._next_frame = time.monotonic()
+
+    def stop(self) -> None:
+        self.started = False
+
+    def capture_array(self, name: str = "main") -> np.ndarray:
+        if not self.started:
+            raise RuntimeError("Camera must be started before capture")
+
+        frame_time = settings.latency(1.0 / settings.camera_frame_rate)
+        now = time.monotonic()
+        if now < self._next_frame:
+            time.sleep(self._next_frame - now)
+            now = self._next_frame
+        self._next_frame = now + frame_time
+
+        self._frame_index += 1
+        frame = np.roll(self._base, self._frame_index * 4, axis=1)
+        noise = np.random.randint(0, 8, size=frame.shape[:2], dtype=np.uint8)
+        return frame + noise[:, :, None]
+
+    def close(self) -> None:
+        self.started = False
+        self._base = None
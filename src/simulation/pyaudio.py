@@ -0,0 +1,129 @@
+"""
+<summary>
+Simulated PyAudio module - real-time paced input/output streams with a synthetic signal
+</summary>
+<hardware>None - simulates EMEET M0 Plus (USB audio)</hardware>
+<dependencies>numpy</dependencies>
+"""
+
+import time
+
+import numpy as np
+
+from .settings import settings
+
+paFloat32 = 1
+paInt32 = 2
+paInt24 = 4
+paInt16 = 8
+paInt8 = 16
+
+paInputOverflowed = -9981
+paOutputUnderflowed = -9980
+
+_SAMPLE_SIZES = {paFloat32: 4, paInt32: 4, paInt24: 3, paInt16: 2, paInt8: 1}
+
+
+def get_sample_size(format: int) -> int:
+    return _SAMPLE_SIZES[format]
+
+
+class Stream:
+    """
+    <summary>
+    Simulated stream. Reads and writes are paced against a stream clock so a
+    consumer that falls behind gets data immediately, like a real device buffer.
+    </summary>
+    """
+
+    def __init__(self, rate: int, channels: int, format: int, input: bool = False,
+                 output: bool = False, frames_per_buffer: int = 1024, **kwargs) -> None:
+        self.rate = rate
+        self.channels = channels
+        self.format = format
+        self.is_input = input
+        self.is_output = output
+        self.frames_per_buffer = frames_per_buffer
+        self._active = True
+        self._clock = time.monotonic()
+        self._phase = 0
+        self.frames_read = 0
+        self.frames_written = 0
+
+    def _advance(self, frames: int) -> bool:
+        """Pace one buffer; returns False if the caller fell behind the device"""
+        self._clock += settings.time_scale * frames / self.rate
+        delay = self._clock - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+            return True
+        # Fell behind (overrun/underrun) - resynchronise the clock
+        self._clock = time.monotonic()
+        return False
+
+    def read(self, num_frames: int, exception_on_overflow: bool = True) -> bytes:
+        self._advance(num_frames)
+        t = (np.arange(num_frames) + self._phase) / self.rate
+        self._phase += num_frames
+        signal = 0.3 * np.sin(2 * np.pi * settings.audio_tone_hz * t)
+        signal += np.random.normal(0.0, settings.audio_noise_level, num_frames)
+        samples = (np.clip(signal, -1.0, 1.0) * 32767).astype(np.int16)
+        if self.channels > 1:
+            samples = np.repeat(samples, self.channels)
+        self.frames_read += num_frames
+        return samples.tobytes()
+
+    def write(self, frames: bytes, num_frames: int = None, exception_on_underflow: bool = False) -> None:
+        if num_frames is None:
+            num_frames = len(frames) // (self.channels * get_sample_size(self.format))
+        on_time = self._advance(num_frames)
+        self.frames_written += num_frames
+        if not on_time and exception_on_underflow:
+            # Like PortAudio: the data was written, the underflow is reported afterwards
+            raise IOError(paOutputUnderflowed, "Output underflowed")
+
+    def get_read_available(self) -> int:
+        return self.frames_per_buffer
+
+    def start_stream(self) -> None:
+        self._active = True
+        self._clock = time.monotonic()
+
+    def stop_stream(self) -> None:
+        self._active = False
+
+    def is_active(self) -> bool:
+        return self._active
+
+    def close(self) -> None:
+        self._active = False
+
+
+class PyAudio:
+    """Simulated PortAudio host"""
+
+    def __init__(self) -> None:
+        settings.wait(settings.audio_init_latency)
+        self._streams = []
+
+    def open(self, *args, **kwargs) -> Stream:
+        stream = Stream(*args, **kwargs)
+        self._streams.append(stream)
+        return stream
+
+    def get_sample_size(self, format: int) -> int:
+        return get_sample_size(format)
+
+    def get_device_count(self) -> int:
+        return 1
+
+    def get_default_input_device_info(self) -> dict:
+        return {'index': 0, 'name': 'Simulated EMEET M0 Plus', 'maxInputChannels': 1, 'defaultSampleRate': 44100.0}
+
+    def get_default_output_device_info(self) -> dict:
+        return {'index': 0, 'name': 'Simulated EMEET M0 Plus', 'maxOutputChannels': 2, 'defaultSampleRate': 44100.0}
+
+    def terminate(self) -> None:
+        for stream in self._streams:
+            stream.close()
+        self._streams = []
@@ -0,0 +1,75 @@
+"""
+<summary>
+Simulated pyttsx3 module - speech takes as long as it would at the configured rate
+</summary>
+<hardware>None - simulates text-to-speech output</hardware>
+<dependencies>threading, wave</dependencies>
+"""
+
+import threading
+import wave
+from typing import Any, List, Optional
+
+from .settings import settings
+
+
+class Voice:
+    """Simulated voice description"""
+
+    def __init__(self, voice_id: str, name: str) -> None:
+        self.id = voice_id
+        self.name = name
+        self.languages = ['en']
+
+
+class Engine:
+    """Simulated speech engine"""
+
+    def __init__(self) -> None:
+        self._properties = {
+            'rate': 200,
+            'volume': 1.0,
+            'voice': 'sim-default',
+            'voices': [Voice('sim-default', 'Simulated Voice')],
+        }
+        self._queue: List[str] = []
+        self._stop = threading.Event()
+        self.utterances_spoken = 0
+
+    def setProperty(self, name: str, value: Any) -> None:
+        self._properties[name] = value
+
+    def getProperty(self, name: str) -> Any:
+        return self._properties.get(name)
+
+    def say(self, text: str, name: Optional[str] = None) -> None:
+        self._queue.append(text)
+
+    def _duration(self, text: str) -> float:
+        words = max(1, len(text.split()))
+        return words * 60.0 / max(1, self._properties['rate'])
+
+    def runAndWait(self) -> None:
+        self._stop.clear()
+        while self._queue:
+            text = self._queue.pop(0)
+            if self._stop.wait(settings.latency(self._duration(text))):
+                self._queue.clear()
+                break
+            self.utterances_spoken += 1
+
+    def save_to_file(self, text: str, filename: str, name: Optional[str] = None) -> None:
+        frames = int(self._duration(text) * 22050)
+        with wave.open(filename, 'wb') as output:
+            output.setnchannels(1)
+            output.setsampwidth(2)
+            output.setframerate(22050)
+            output.writeframes(b'\x00\x00' * frames)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def init(driverName: Optional[str] = None, debug: bool = False) -> Engine:
+    settings.wait(settings.tts_init_latency)
+    return Engine()
@@ -0,0 +1,116 @@
+"""
+<summary>
+Runtime-configurable settings and latency model shared by all simulated devices
+</summary>
+<hardware>None - simulated hardware backend</hardware>
+<dependencies>os, random, time</dependencies>
+"""
+
+import math
+import os
+import random
+import time
+from typing import Any, Optional
+
+from .constants import SimulationConstants
+
+
+class SimulationSettings:
+    """
+    <summary>
+    Mutable copy of SimulationConstants plus the synthetic scene the devices observe
+    </summary>
+    """
+
+    def __init__(self) -> None:
+        """
+        <summary>Initialize settings from SimulationConstants and environment</summary>
+        <returns>None</returns>
+        """
+        for name in dir(SimulationConstants):
+            if name.isupper():
+                setattr(self, name.lower(), getattr(SimulationConstants, name))
+
+        env_scale = os.environ.get(SimulationConstants.TIME_SCALE_ENV_VAR)
+        if env_scale:
+            self.time_scale = float(env_scale)
+
+        self.started_at = time.monotonic()
+        self.distance_override_mm: Optional[float] = None
+        self.lux_override: Optional[float] = None
+        self._random = random.Random()
+
+    def configure(self, **overrides: Any) -> None:
+        """
+        <summary>Override settings, e.g. configure(time_scale=0, distance_noise_mm=10)</summary>
+        <param name="overrides">Setting names (lower-case constant names) and values</param>
+        <returns>None</returns>
+        """
+        for name, value in overrides.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"Unknown simulation setting: {name}")
+            setattr(self, name, value)
+
+    def seed(self, value: int) -> None:
+        """
+        <summary>Seed the noise generator for reproducible runs</summary>
+        <param name="value">Seed value</param>
+        <returns>None</returns>
+        """
+        self._random.seed(value)
+
+    def latency(self, nominal: float) -> float:
+        """
+        <summary>Sample a latency around the nominal value</summary>
+        <param name="nominal">Nominal latency in seconds</param>
+        <returns>Scaled latency with jitter, never negative</returns>
+        """
+        jitter = self._random.gauss(0.0, nominal * self.jitter_ratio)
+        return max(0.0, (nominal + jitter) * self.time_scale)
+
+    def wait(self, nominal: float) -> float:
+        """
+        <summary>Block for a sampled latency</summary>
+        <param name="nominal">Nominal latency in seconds</param>
+        <returns>Seconds slept</returns>
+        """
+        delay = self.latency(nominal)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def gauss(self, sigma: float) -> float:
+        """Gaussian noise sample"""
+        return self._random.gauss(0.0, sigma)
+
+    def chance(self, probability: float) -> bool:
+        """True with the given probability"""
+        return self._random.random() < probability
+
+    def elapsed(self) -> float:
+        """Seconds since the simulation started"""
+        return time.monotonic() - self.started_at
+
+    def scene_distance_mm(self) -> float:
+        """
+        <summary>True distance to the nearest object in the synthetic scene</summary>
+        <returns>Distance in mm</returns>
+        """
+        if self.distance_override_mm is not None:
+            return self.distance_override_mm
+        phase = 2 * math.pi * self.elapsed() / self.scene_distance_period
+        return self.scene_base_distance_mm + self.scene_distance_swing_mm * math.cos(phase)
+
+    def scene_lux(self) -> float:
+        """
+        <summary>True ambient light level in the synthetic scene</summary>
+        <returns>Illuminance in lux</returns>
+        """
+        if self.lux_override is not None:
+            return self.lux_override
+        phase = 2 * math.pi * self.elapsed() / self.scene_lux_period
+        return self.scene_base_lux * (1.0 + self.scene_lux_swing * math.sin(phase))
+
+
+# Process-wide settings shared by every simulated device
+settings = SimulationSettings()
@@ -0,0 +1,70 @@
+"""
+<summary>
+Simulated speech_recognition module - realistic calibration and listen timing, no transcription
+</summary>
+<hardware>None - simulates microphone-based speech recognition</hardware>
+<dependencies>None</dependencies>
+"""
+
+from typing import Optional
+
+from .settings import settings
+
+
+class WaitTimeoutError(Exception):
+    """Raised when listen() hears no phrase before the timeout"""
+
+
+class UnknownValueError(Exception):
+    """Raised when speech could not be understood"""
+
+
+class RequestError(Exception):
+    """Raised when the recognition service is unreachable"""
+
+
+class AudioData:
+    """Captured audio"""
+
+    def __init__(self, frame_data: bytes, sample_rate: int, sample_width: int) -> None:
+        self.frame_data = frame_data
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+
+
+class Microphone:
+    """Simulated microphone source"""
+
+    def __init__(self, device_index: Optional[int] = None, sample_rate: int = 16000, chunk_size: int = 1024) -> None:
+        self.device_index = device_index
+        self.SAMPLE_RATE = sample_rate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = chunk_size
+
+    def __enter__(self) -> 'Microphone':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class Recognizer:
+    """Simulated recognizer - never hears a phrase"""
+
+    def __init__(self) -> None:
+        self.energy_threshold = 300
+        self.dynamic_energy_threshold = True
+        self.pause_threshold = 0.8
+
+    def adjust_for_ambient_noise(self, source: Microphone, duration: float = None) -> None:
+        settings.wait(duration if duration is not None else settings.ambient_noise_calibration)
+
+    def listen(self, source: Microphone, timeout: Optional[float] = None, phrase_time_limit: Optional[float] = None) -> AudioData:
+        settings.wait(timeout if timeout is not None else 1.0)
+        raise WaitTimeoutError("listening timed out while waiting for phrase to start")
+
+    def recognize_google(self, audio_data: AudioData, language: str = "en-US", **kwargs) -> str:
+        raise UnknownValueError()
+
+    def recognize_sphinx(self, audio_data: AudioData, language: str = "en-US", **kwargs) -> str:
+        raise UnknownValueError()
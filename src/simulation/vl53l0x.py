@@ -0,0 +1,143 @@
+"""
+<summary>
+Simulated VL53L0X-python module - time-of-flight ranging against the synthetic scene
+</summary>
+<hardware>None - simulates VL53L0X Time-of-Flight Distance Sensor (I2C)</hardware>
+<dependencies>time</dependencies>
+"""
+
+import math
+import threading
+import time
+
+from . import gpio
+from .settings import settings
+
+
+class Vl53l0xAccuracyMode:
+    """Accuracy modes matching the VL53L0X-python enum"""
+    GOOD = 0
+    BETTER = 1
+    BEST = 2
+    LONG_RANGE = 3
+    HIGH_SPEED = 4
+
+
+_MODE_NAMES = {
+    Vl53l0xAccuracyMode.GOOD: 'GOOD',
+    Vl53l0xAccuracyMode.BETTER: 'BETTER',
+    Vl53l0xAccuracyMode.BEST: 'BEST',
+    Vl53l0xAccuracyMode.LONG_RANGE: 'LONG_RANGE',
+    Vl53l0xAccuracyMode.HIGH_SPEED: 'HIGH_SPEED',
+}
+
+
+class VL53L0X:
+    """
+    <summary>
+    Simulated sensor in back-to-back ranging mode: a new measurement completes
+    every timing budget and get_distance() polls until the next one is ready.
+    GPIO1 goes low when a measurement completes and back high when the result
+    is read (new-sample-ready interrupt, active low, as configured by the ST API).
+    </summary>
+    """
+
+    def __init__(self, i2c_bus: int = 1, i2c_address: int = 0x29, tca9548a_num: int = 255, tca9548a_addr: int = 0) -> None:
+        self.i2c_bus = i2c_bus
+        self.i2c_address = i2c_address
+        self._is_open = False
+        self._ranging = False
+        self._mode = Vl53l0xAccuracyMode.GOOD
+        self._timing_us = settings.vl53l0x_timing_budgets_us['GOOD']
+        self._next_ready = 0.0
+        self._lock = threading.Lock()
+        self._interrupt_condition = threading.Condition()
+        self._generation = 0
+        self.last_ready_at = 0.0  # Simulation only: completion time of the last result read
+
+    def open(self) -> None:
+        settings.wait(settings.vl53l0x_boot_latency)
+        self._is_open = True
+
+    def close(self) -> None:
+        self.stop_ranging()
+        self._is_open = False
+
+    def start_ranging(self, mode: int = Vl53l0xAccuracyMode.GOOD) -> None:
+        if not self._is_open:
+            raise RuntimeError("VL53L0X not open")
+        self._mode = mode
+        self._timing_us = settings.vl53l0x_timing_budgets_us[_MODE_NAMES[mode]]
+        with self._interrupt_condition:
+            self._ranging = True
+            self._next_ready = time.monotonic() + self._timing_us / 1_000_000 * settings.time_scale
+            self._generation += 1
+            self._interrupt_condition.notify_all()
+        self._clear_interrupt()
+        if settings.vl53l0x_gpio1_pin is not None:
+            threading.Thread(target=self._drive_interrupt, args=(self._generation,), daemon=True).start()
+
+    def stop_ranging(self) -> None:
+        with self._interrupt_condition:
+            self._ranging = False
+            self._interrupt_condition.notify_all()
+
+    def get_timing(self) -> int:
+        return self._timing_us
+
+    def get_distance(self) -> int:
+        if not self._ranging:
+            return -1
+
+        with self._lock:
+            budget = settings.latency(self._timing_us / 1_000_000)
+            now = time.monotonic()
+            ready = self._next_ready
+            if now < ready:
+                # Poll the status register until the measurement is done
+                poll = settings.vl53l0x_poll_interval * settings.time_scale
+                wait = ready - now
+                if poll > 0:
+                    wait = math.ceil(wait / poll) * poll
+                time.sleep(wait)
+                now = ready
+            with self._interrupt_condition:
+                self.last_ready_at = ready
+                # Back-to-back: the next measurement started when this one completed
+                self._next_ready = max(ready + budget, now)
+                self._interrupt_condition.notify_all()
+        self._clear_interrupt()
+
+        # Longer timing budgets average more photons and are less noisy
+        sigma = settings.distance_noise_mm * math.sqrt(33000 / self._timing_us)
+        if settings.chance(settings.distance_outlier_rate):
+            if settings.chance(0.5):
+                return settings.distance_out_of_range_mm
+            return int(20 + abs(settings.gauss(20.0)))
+
+        distance = settings.scene_distance_mm() * settings.distance_gain + settings.distance_offset_mm
+        distance += settings.gauss(sigma)
+        if distance > 2000:
+            return settings.distance_out_of_range_mm
+        return max(0, int(round(distance)))
+
+    def _clear_interrupt(self) -> None:
+        """Reading the result clears the interrupt: GPIO1 released high"""
+        if settings.vl53l0x_gpio1_pin is not None:
+            gpio.set_input(settings.vl53l0x_gpio1_pin, gpio.HIGH)
+
+    def _drive_interrupt(self, generation: int) -> None:
+        """Pull GPIO1 low when each measurement completes until ranging restarts or stops"""
+        signalled = None
+        while True:
+            with self._interrupt_condition:
+                if not self._ranging or self._generation != generation:
+                    return
+                ready = self._next_ready
+                delay = ready - time.monotonic()
+                if ready == signalled or delay > 0:
+                    # Wait for the result to be read, or for the measurement to complete
+                    self._interrupt_condition.wait(delay if ready != signalled else None)
+                    continue
+                signalled = ready
+            gpio.set_input(settings.vl53l0x_gpio1_pin, gpio.LOW)
@@ -0,0 +1,79 @@
+"""
+<summary>
+Shared pytest setup: every test runs against the simulated backend
+</summary>
+<hardware>None - simulated devices</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Selected before any driver module reads it
+os.environ.setdefault("ZOLO_BACKEND", "simulated")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.settings import settings  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def simulated_scene():
+    """Real-time simulation with a fixed seed; scene overrides cleared after each test"""
+    settings.configure(time_scale=1.0)
+    settings.seed(1)
+    yield settings
+    settings.distance_override_mm = None
+    settings.lux_override = None
+
+
+@pytest.fixture
+def wait_until():
+    """wait_until(predicate, timeout): poll until predicate() is true, returns its last value"""
+    def wait(predicate, timeout: float = 2.0, interval: float = 0.005) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(interval)
+        return bool(predicate())
+    return wait
+
+
+@pytest.fixture
+def threads_named():
+    """threads_named(name): live threads with the given name"""
+    def named(name: str) -> list:
+        return [thread for thread in threading.enumerate() if thread.name == name and thread.is_alive()]
+    return named
+
+
+@pytest.fixture
+def block_reads():
+    """block_reads(sensor): the device's next read blocks until release is set; returns (entered, release)"""
+    def block(sensor):
+        device = sensor.sensor
+        original = device.get_distance
+        entered, release = threading.Event(), threading.Event()
+
+        def stuck_read():
+            entered.set()
+            release.wait(5.0)
+            device.get_distance = original
+            return original()
+
+        device.get_distance = stuck_read
+        return entered, release
+    return block
+
+
+@pytest.fixture
+def robot():
+    """ZoloRobot with no components; tests attach the ones they need"""
+    import main
+    robot = main.ZoloRobot()
+    yield robot
+    robot.cleanup()
@@ -0,0 +1,97 @@
+"""
+<summary>
+Sensor calibration: fitted models survive a save/load round trip and correct
+the simulated sensors' readings
+</summary>
+<hardware>None - simulated devices</hardware>
+<dependencies>pytest, numpy</dependencies>
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from config.sensor_calibration import SensorCalibration  # noqa: E402
+from src.core.constants.global_constants import ZoloConstants  # noqa: E402
+from src.core.utils.calibration import CalibrationModel  # noqa: E402
+from src.senses.light.tsl2561 import LightSensor  # noqa: E402
+from src.senses.proximity.vl53l0x import DistanceSensor  # noqa: E402
+
+METHODS = (ZoloConstants.CALIBRATION_LEAST_SQUARES, ZoloConstants.CALIBRATION_PIECEWISE)
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("log_scale", (False, True))
+def test_model_round_trips_through_json(method, log_scale):
+    pairs = [(reference, reference * 1.08 + 15.0) for reference in (50.0, 100.0, 200.0, 500.0, 1000.0, 1500.0)]
+    model = CalibrationModel.fit(pairs, method, (30.0, 2000.0), log_scale=log_scale)
+
+    loaded = CalibrationModel.from_dict(json.loads(json.dumps(model.to_dict())))
+    assert loaded.to_dict() == model.to_dict()
+    for measured in (10.0, 69.0, 555.5, 1999.0, 2500.0):
+        assert loaded.apply(measured) == pytest.approx(model.apply(measured))
+
+
+@pytest.fixture
+def ranging_error(monkeypatch, simulated_scene):
+    """Uncalibrated simulated VL53L0X: measured = true * 1.08 + 15 mm, no outliers"""
+    monkeypatch.setattr(simulated_scene, 'distance_gain', 1.08)
+    monkeypatch.setattr(simulated_scene, 'distance_offset_mm', 15.0)
+    monkeypatch.setattr(simulated_scene, 'distance_outlier_rate', 0.0)
+    simulated_scene.configure(time_scale=0.05)
+    return simulated_scene
+
+
+def test_distance_calibration_survives_save_and_load(tmp_path, ranging_error):
+    sensor = DistanceSensor()
+    assert sensor.initialize()
+    try:
+        calibration = SensorCalibration()
+        assert calibration.calibrate_distance_sensor(sensor)
+        path = str(tmp_path / "sensor_calibration.json")
+        assert calibration.save_calibration(path)
+        sensor.set_calibration(None)
+
+        loaded = SensorCalibration()
+        assert loaded.load_calibration(path)
+        assert loaded.is_sensor_calibrated('distance_sensor')
+        assert loaded.get_calibration_data('distance_sensor') == calibration.get_calibration_data('distance_sensor')
+        assert loaded.apply_calibration('distance_sensor', sensor)
+
+        ranging_error.distance_override_mm = 400.0
+        sensor.get_distance()  # Measurement started before the scene changed
+        readings = [sensor.read_raw_distance() for _ in range(5)]
+        assert min(readings) > 420.0
+        corrected = [sensor.calibration.apply(reading) for reading in readings]
+        assert sum(corrected) / len(corrected) == pytest.approx(400.0, abs=10.0)
+    finally:
+        sensor.cleanup()
+
+
+def test_light_calibration_survives_save_and_load(tmp_path, monkeypatch, simulated_scene):
+    # Uncalibrated channel response: 20% more counts than the lux formula expects
+    monkeypatch.setattr(simulated_scene, 'tsl2561_counts_per_lux', simulated_scene.tsl2561_counts_per_lux * 1.2)
+    sensor = LightSensor()
+    sensor.set_auto_range(True)
+    assert sensor.initialize()
+    try:
+        calibration = SensorCalibration()
+        # Bright levels only: short windows keep the run fast
+        assert calibration.calibrate_light_sensor(sensor, reference_levels=[100, 300, 1000, 3000])
+        path = str(tmp_path / "sensor_calibration.json")
+        assert calibration.save_calibration(path)
+
+        loaded = SensorCalibration()
+        assert loaded.load_calibration(path)
+        assert loaded.apply_calibration('light_sensor', sensor)
+        simulated_scene.lux_override = 300.0
+        # The window completed before the change, then the one that straddles it
+        sensor.read_raw_lux()
+        sensor.read_raw_lux()
+        raw = sensor.read_raw_lux()
+        assert raw == pytest.approx(360.0, rel=0.05)
+        assert sensor.calibration.apply(raw) == pytest.approx(300.0, rel=0.05)
+    finally:
+        sensor.cleanup()
@@ -0,0 +1,26 @@
+"""
+<summary>
+Camera capture on demand: no frames while idle, one when an object comes close
+</summary>
+<hardware>None - simulated devices</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+from src.senses.proximity.vl53l0x import DistanceConstants
+from src.senses.vision.camera import CameraController
+
+
+def test_camera_captures_only_on_events(robot):
+    camera = robot.camera = CameraController(resolution=(64, 48))
+    assert camera.initialize()
+    # No periodic grab: the camera is not a polled sense
+    assert robot._build_sense_source('camera') is None
+    captured = camera.frames_captured.value
+
+    robot._handle_distance(DistanceConstants.CLOSE_THRESHOLD_CM * 2)
+    assert camera.frames_captured.value == captured
+    assert robot.latest_frame is None
+
+    robot._handle_distance(DistanceConstants.CLOSE_THRESHOLD_CM / 2)
+    assert camera.frames_captured.value == captured + 1
+    assert robot.latest_frame is not None
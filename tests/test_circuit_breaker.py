@@ -0,0 +1,123 @@
+"""
+<summary>
+Circuit breaker state machine: opening at the threshold, a single half-open
+trial, closing, probe backoff, and the retry decorator's explicit probes
+</summary>
+<hardware>None</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import time
+
+import pytest
+
+from src.core.constants.global_constants import ZoloConstants
+from src.core.utils.hardware_utils import HardwareUtils
+from src.core.utils.retry_policy import CircuitBreaker, CircuitOpenError
+
+
+def _open_breaker(breaker: CircuitBreaker, probe=None) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(probe)
+
+
+def test_opens_at_threshold_and_fails_fast():
+    breaker = CircuitBreaker('device', failure_threshold=3, reset_timeout=60.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == ZoloConstants.CIRCUIT_CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == ZoloConstants.CIRCUIT_OPEN
+    assert not breaker.allow()
+    assert breaker.get_metrics()['fast_failures'] == 1
+
+
+def test_half_open_lets_one_trial_through():
+    breaker = CircuitBreaker('device', failure_threshold=1, reset_timeout=0.05)
+    _open_breaker(breaker)
+    assert not breaker.allow()
+    time.sleep(0.1)
+
+    assert breaker.allow()
+    assert breaker.state == ZoloConstants.CIRCUIT_HALF_OPEN
+    # Everyone else fails fast while the trial is in flight
+    assert not any(breaker.allow() for _ in range(5))
+
+    breaker.record_success()
+    assert breaker.state == ZoloConstants.CIRCUIT_CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker('device', failure_threshold=1, reset_timeout=0.05)
+    _open_breaker(breaker)
+    time.sleep(0.1)
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == ZoloConstants.CIRCUIT_OPEN
+    assert not breaker.allow()
+    time.sleep(0.1)
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_probe_backs_off_then_closes(wait_until):
+    results = [False, False, True]
+    probed_at = []
+
+    def probe():
+        probed_at.append(time.monotonic())
+        return results[len(probed_at) - 1]
+
+    breaker = CircuitBreaker('device', failure_threshold=1, reset_timeout=0.05)
+    opened_at = time.monotonic()
+    _open_breaker(breaker, probe)
+    # With a background probe no call is let through as a trial
+    time.sleep(0.07)
+    assert not breaker.allow()
+
+    assert wait_until(lambda: breaker.state == ZoloConstants.CIRCUIT_CLOSED)
+    assert len(probed_at) == 3
+    intervals = [b - a for a, b in zip([opened_at] + probed_at, probed_at)]
+    assert intervals[0] >= 0.05
+    assert intervals[1] >= 0.1
+    assert intervals[2] >= 0.2
+    assert breaker.get_metrics()['probes'] == 3
+    assert breaker.allow()
+
+
+def test_retry_decorator_requires_probe():
+    with pytest.raises(ValueError):
+        HardwareUtils.retry_on_failure(device='device')
+
+
+def test_retry_decorator_probes_instead_of_replaying(monkeypatch, wait_until):
+    breaker = CircuitBreaker('decorated', failure_threshold=1, reset_timeout=0.05)
+    monkeypatch.setitem(CircuitBreaker._registry, 'decorated', breaker)
+
+    class _Device:
+        def __init__(self) -> None:
+            self.writes = []
+            self.probes = 0
+
+        @HardwareUtils.retry_on_failure(max_retries=0, device='decorated', probe='_probe')
+        def write(self, value: int) -> None:
+            self.writes.append(value)
+            raise IOError("device gone")
+
+        def _probe(self) -> bool:
+            self.probes += 1
+            return True
+
+    device = _Device()
+    with pytest.raises(IOError):
+        device.write(1)
+    with pytest.raises(CircuitOpenError):
+        device.write(2)
+
+    assert wait_until(lambda: breaker.state == ZoloConstants.CIRCUIT_CLOSED)
+    assert device.probes == 1
+    assert device.writes == [1]
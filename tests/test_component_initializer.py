@@ -0,0 +1,68 @@
+"""
+<summary>
+Component initializer: initialization bounded by the timeout, including a
+component whose initialize() never returns
+</summary>
+<hardware>None</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+
+from src.core.runtime import ComponentInitializer, RuntimeConstants
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _Component:
+    """initialize() returns the given result once release is set"""
+
+    def __init__(self, result: bool = True, hang: bool = False) -> None:
+        self.result = result
+        self.release = threading.Event()
+        if not hang:
+            self.release.set()
+
+    def initialize(self) -> bool:
+        self.release.wait()
+        return self.result
+
+
+def test_slow_component_times_out_and_finishes_late(wait_until):
+    slow = _Component(hang=True)
+    completed = []
+    initializer = ComponentInitializer(timeout=0.2)
+    initializer.start({'fast': _Component(), 'broken': _Component(result=False), 'slow': slow},
+                      on_complete=lambda name, success: completed.append((name, success)))
+
+    assert initializer.wait_for(['fast'])
+    assert not initializer.wait_for(['fast', 'slow'])
+    report = initializer.get_report()
+    assert report['fast']['state'] == RuntimeConstants.INIT_STATE_READY
+    assert report['broken']['state'] == RuntimeConstants.INIT_STATE_FAILED
+    assert report['slow']['state'] == RuntimeConstants.INIT_STATE_TIMED_OUT
+
+    slow.release.set()
+    assert wait_until(lambda: ('slow', True) in completed)
+    assert initializer.is_ready('slow')
+
+
+def test_hung_initialize_does_not_block_exit():
+    script = textwrap.dedent("""
+        import threading
+        from src.core.runtime import ComponentInitializer
+
+        class Hung:
+            def initialize(self):
+                threading.Event().wait()
+
+        initializer = ComponentInitializer(timeout=0.1)
+        initializer.start({'camera': Hung()})
+        assert not initializer.wait_for(['camera'])
+    """)
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, timeout=10, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,98 @@
+"""
+<summary>
+Component supervisor: heartbeat timeouts and in-place restarts, generic and
+with a stalled distance reader
+</summary>
+<hardware>None - simulated devices</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.runtime import AsyncRuntime, ComponentSupervisor, RuntimeConstants
+from src.senses.proximity.vl53l0x import DistanceConstants, DistanceSensor
+
+
+class _Component:
+    """Component whose work is driven by the test"""
+
+    def __init__(self) -> None:
+        self.is_initialized = False
+        self.initializations = 0
+
+    def initialize(self) -> bool:
+        self.initializations += 1
+        self.is_initialized = True
+        return True
+
+    def cleanup(self) -> None:
+        self.is_initialized = False
+
+
+@pytest.fixture
+def fast_restarts(monkeypatch):
+    monkeypatch.setattr(RuntimeConstants, 'SHUTDOWN_COMPONENT_TIMEOUT', 0.2)
+    monkeypatch.setattr(RuntimeConstants, 'RESTART_BACKOFF_BASE', 0.2)
+
+
+def test_silent_component_is_restarted(fast_restarts, wait_until):
+    component = _Component()
+    component.initialize()
+    supervisor = ComponentSupervisor(timeout=0.2)
+    supervisor.watch('device', component)
+    supervisor.start()
+    try:
+        assert wait_until(lambda: supervisor.get_report()['device']['restarts'] == 1)
+        assert component.initializations == 2
+    finally:
+        supervisor.stop()
+
+
+def test_heartbeats_keep_component_running(fast_restarts):
+    supervisor = ComponentSupervisor(timeout=0.2)
+    supervisor.watch('device', _Component())
+    supervisor.start()
+    try:
+        for _ in range(10):
+            supervisor.heartbeat('device')
+            time.sleep(0.05)
+        assert supervisor.get_report()['device']['restarts'] == 0
+    finally:
+        supervisor.stop()
+
+
+def test_stalled_distance_reader_is_restarted(robot, fast_restarts, block_reads, wait_until, threads_named):
+    sensor = robot.distance_sensor = DistanceSensor()
+    sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+    assert sensor.initialize()
+    robot.supervisor.timeout = 0.3
+    robot.runtime = AsyncRuntime(supervisor=robot.supervisor)
+    assert robot._attach_sense(robot.runtime, 'distance_sensor')
+    robot.supervisor.start()
+    runner = threading.Thread(target=robot.runtime.run, daemon=True)
+    runner.start()
+    try:
+        assert wait_until(lambda: sensor.get_sample() is not None)
+        entered, release = block_reads(sensor)
+        try:
+            assert entered.wait(2.0)
+            # No samples are published while the reader is stuck, so no heartbeats either
+            assert wait_until(lambda: robot.supervisor.get_report()['distance_sensor']['state']
+                              != RuntimeConstants.SUPERVISOR_STATE_HEALTHY, timeout=1.0)
+            assert len(threads_named("zolo-distance-reader")) <= 1
+        finally:
+            release.set()
+
+        report = lambda: robot.supervisor.get_report()['distance_sensor']
+        assert wait_until(lambda: report()['restarts'] >= 1
+                          and report()['state'] == RuntimeConstants.SUPERVISOR_STATE_HEALTHY, timeout=5.0)
+        sequence = sensor.get_sample().sequence
+        assert wait_until(lambda: sensor.get_sample().sequence > sequence)
+        assert len(threads_named("zolo-distance-reader")) == 1
+    finally:
+        robot.runtime.request_stop()
+        runner.join(2.0)
+        robot.supervisor.stop()
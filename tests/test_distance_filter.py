@@ -0,0 +1,76 @@
+"""
+<summary>
+Distance filter: range handling, spike rejection and acceptance of a jump
+that persists
+</summary>
+<hardware>None</hardware>
+<dependencies>pytest, numpy</dependencies>
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.senses.proximity.vl53l0x import DistanceConstants  # noqa: E402
+from src.senses.proximity.vl53l0x.distance_filter import DistanceFilter, clamp_reading  # noqa: E402
+
+
+def settle(distance_filter: DistanceFilter, distance_mm: float, readings: int = 10):
+    for index in range(readings):
+        value = distance_filter.update(distance_mm + (index % 3 - 1))
+    return value
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (None, None),
+    (-1, None),
+    (0, None),
+    (DistanceConstants.NO_TARGET_MM, None),
+    (DistanceConstants.NO_TARGET_MM + 1, None),
+    (12, DistanceConstants.MIN_DISTANCE_MM),
+    (450, 450.0),
+    (2300, DistanceConstants.MAX_DISTANCE_MM),
+])
+def test_clamp_reading(raw, expected):
+    assert clamp_reading(raw) == expected
+
+
+@pytest.mark.parametrize("mode", DistanceConstants.FILTER_MODES)
+def test_short_returns_are_a_very_close_object(mode):
+    distance_filter = DistanceFilter(mode)
+    settle(distance_filter, 60.0)
+    for _ in range(DistanceConstants.FILTER_MAX_REJECTS * 3):
+        value = distance_filter.update(15)
+    assert value == pytest.approx(DistanceConstants.MIN_DISTANCE_MM, abs=2.0)
+    assert distance_filter.get_stats()['out_of_range'] == 0
+
+
+@pytest.mark.parametrize("mode", DistanceConstants.FILTER_MODES)
+def test_single_spike_is_rejected(mode):
+    distance_filter = DistanceFilter(mode)
+    before = settle(distance_filter, 500.0)
+    assert distance_filter.update(1500.0) == before
+    assert distance_filter.update(25.0) == before
+    assert distance_filter.get_stats()['spikes'] == 2
+    assert settle(distance_filter, 500.0, 1) == pytest.approx(500.0, abs=5.0)
+
+
+@pytest.mark.parametrize("mode", DistanceConstants.FILTER_MODES)
+def test_persistent_jump_is_accepted(mode):
+    distance_filter = DistanceFilter(mode)
+    before = settle(distance_filter, 800.0)
+    for _ in range(DistanceConstants.FILTER_MAX_REJECTS - 1):
+        assert distance_filter.update(80.0) == before
+    assert distance_filter.update(80.0) == pytest.approx(80.0)
+    assert settle(distance_filter, 80.0) == pytest.approx(80.0, abs=2.0)
+
+
+def test_no_target_resets_after_max_rejects():
+    distance_filter = DistanceFilter()
+    before = settle(distance_filter, 500.0)
+    for _ in range(DistanceConstants.FILTER_MAX_REJECTS - 1):
+        assert distance_filter.update(DistanceConstants.NO_TARGET_MM) == before
+    assert distance_filter.update(-1) is None
+    assert distance_filter.get_stats()['out_of_range'] == DistanceConstants.FILTER_MAX_REJECTS
+    # Nothing remembered from the old object
+    assert distance_filter.update(1200.0) == pytest.approx(1200.0)
@@ -0,0 +1,92 @@
+"""Continuous ranging reader lifecycle and polled bus use on the simulated VL53L0X"""
+
+import time
+
+import pytest
+
+from src.senses.proximity.vl53l0x import DistanceConstants, DistanceSensor
+
+READER = "zolo-distance-reader"
+
+
+@pytest.fixture
+def sensor():
+    sensor = DistanceSensor()
+    assert sensor.initialize()
+    yield sensor
+    sensor.cleanup()
+
+
+def test_continuous_mode_publishes_fresh_samples(sensor, simulated_scene, wait_until):
+    simulated_scene.distance_override_mm = 400.0
+    assert sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+    assert wait_until(lambda: sensor.get_distance() is not None)
+    assert abs(sensor.get_distance() - 400.0) < 50
+
+
+def test_reader_restart_while_read_is_stuck(sensor, block_reads, wait_until, threads_named):
+    assert sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+    assert wait_until(lambda: sensor.get_sample() is not None)
+    entered, release = block_reads(sensor)
+    try:
+        assert entered.wait(2.0)
+        # Stop gives up waiting after one measurement; the old reader is still in the read
+        sensor.set_measurement_mode(DistanceConstants.MODE_SINGLE)
+        assert len(threads_named(READER)) == 1
+        assert not sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+        assert len(threads_named(READER)) == 1
+    finally:
+        release.set()
+
+    # The stuck reader sees its own stop flag once the read returns
+    assert wait_until(lambda: not threads_named(READER))
+    assert sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+    sequence = sensor.get_sample().sequence
+    assert wait_until(lambda: sensor.get_sample().sequence > sequence)
+    assert len(threads_named(READER)) == 1
+
+
+def test_reinitialize_waits_for_stuck_reader(sensor, block_reads, wait_until, threads_named):
+    assert sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+    entered, release = block_reads(sensor)
+    try:
+        assert entered.wait(2.0)
+        sensor._stop_reader()
+        sensor.is_initialized = False
+        # What a supervisor restart does after cleanup() timed out on the stuck bus
+        assert not sensor.initialize()
+        assert len(threads_named(READER)) == 1
+    finally:
+        release.set()
+    assert wait_until(lambda: not threads_named(READER))
+    assert sensor.initialize()
+    assert wait_until(lambda: len(threads_named(READER)) == 1)
+
+
+def test_polled_read_holds_bus_only_to_fetch():
+    sensor = DistanceSensor(interrupt_pin=None)
+    assert sensor.initialize()
+    try:
+        assert sensor.set_accuracy(DistanceConstants.ADAPTIVE_PRECISE)
+        budget = sensor.timing_budget / 1_000_000
+        device = sensor.sensor
+        fetch = device.get_distance
+        holds = []
+
+        def timed_fetch():
+            # Runs inside the bus transaction
+            started = time.monotonic()
+            try:
+                return fetch()
+            finally:
+                holds.append(time.monotonic() - started)
+
+        device.get_distance = timed_fetch
+        started = time.monotonic()
+        for _ in range(5):
+            assert sensor.get_distance() is not None
+        # Still one measurement per budget, but waited for off the bus
+        assert time.monotonic() - started >= 4 * budget
+        assert max(holds) < 0.5 * budget, holds
+    finally:
+        sensor.cleanup()
@@ -0,0 +1,103 @@
+"""
+<summary>
+Emergency stop halt bound with the robot's real halt set: the button is
+pressed while the runtime is stuck in a sense handler that never returns,
+the distance reader is ranging and another device holds the I2C bus
+</summary>
+<hardware>None - simulated devices</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import threading
+import time
+
+from config.hardware_pins import HardwarePins
+from src.core.runtime import AsyncRuntime, RuntimeConstants, SenseSource
+from src.core.utils.i2c_bus import get_i2c_bus
+from src.senses.eyes.neopixel import NeoPixelController
+from src.senses.hearing.emeet import MicrophoneController
+from src.senses.light.tsl2561 import LightSensor
+from src.senses.proximity.vl53l0x import DistanceConstants, DistanceSensor
+from src.senses.voice.emeet import SpeakerController
+from src.senses.voice.synthesis import TextToSpeech
+from src.simulation import gpio as sim_gpio
+
+BUS_HOLD = 0.2  # Longer than the halt bound
+
+
+def test_halt_set_meets_bound_with_blocked_runtime(robot, wait_until):
+    robot.eyes = NeoPixelController(pin_number=HardwarePins.NEOPIXEL_DATA, led_count=12)
+    robot.speaker = SpeakerController()
+    robot.text_to_speech = TextToSpeech()
+    robot.microphone = MicrophoneController()
+    robot.distance_sensor = DistanceSensor()
+    robot.distance_sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+    robot.light_sensor = LightSensor()
+    for component in (robot.eyes, robot.speaker, robot.text_to_speech, robot.microphone,
+                      robot.distance_sensor, robot.light_sensor):
+        assert component.initialize()
+    assert wait_until(lambda: robot.distance_sensor.get_sample() is not None)
+
+    robot.estop = robot._build_emergency_stop()
+    assert robot.estop.start()
+
+    handler_entered = threading.Event()
+    loop_entered = threading.Event()
+    release = threading.Event()
+
+    def never_returns(value) -> None:
+        handler_entered.set()
+        release.wait()
+
+    def block_loop() -> None:
+        loop_entered.set()
+        release.wait()
+
+    robot.runtime = AsyncRuntime()
+    robot.runtime.register_sense(SenseSource('stuck', reader=lambda: True, handler=never_returns, min_interval=0.01))
+    runner = threading.Thread(target=robot.runtime.run, daemon=True)
+
+    bus = get_i2c_bus()
+    stop_bus = threading.Event()
+    bus_held = threading.Event()
+
+    def hog_bus() -> None:
+        while not stop_bus.is_set():
+            with bus.transaction("test"):
+                bus_held.set()
+                time.sleep(BUS_HOLD)
+
+    hog = threading.Thread(target=hog_bus, daemon=True)
+    robot.eyes.set_color((0, 255, 0))
+    runner.start()
+    hog.start()
+    try:
+        # The dispatcher waits on the stuck handler; then the event loop thread itself is stuck
+        assert handler_entered.wait(1.0)
+        robot.runtime.loop.call_soon_threadsafe(block_loop)
+        assert loop_entered.wait(1.0)
+        assert bus_held.wait(1.0)
+        pressed_at = time.perf_counter()
+        sim_gpio.set_input(HardwarePins.EMERGENCY_STOP, sim_gpio.LOW)
+        assert robot.estop.triggered.wait(1.0)
+        assert wait_until(lambda: robot.estop.get_activations())
+        sim_gpio.set_input(HardwarePins.EMERGENCY_STOP, sim_gpio.HIGH)
+    finally:
+        release.set()
+        stop_bus.set()
+        hog.join()
+
+    activation = robot.estop.get_activations()[0]
+    assert activation['source'] == 'gpio'
+    assert not activation['errors']
+    assert set(activation['actions']) == {
+        'eyes', 'speaker', 'text_to_speech', 'microphone', 'distance_sensor', 'light_sensor'
+    }
+    assert activation['halted_at'] - pressed_at < RuntimeConstants.ESTOP_HALT_BOUND, activation['actions']
+    assert robot.eyes.pixels[0] == (0, 0, 0)
+    # Once released, the runtime sees the stop the halt requested
+    runner.join(2.0)
+    assert not runner.is_alive()
+
+    # The drivers finish shutting down once the bus is free
+    assert wait_until(lambda: not robot.distance_sensor.is_initialized and not robot.light_sensor.is_initialized)
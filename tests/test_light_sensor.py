@@ -0,0 +1,118 @@
+"""
+<summary>
+TSL2561 light sensor against the simulated backend: auto-ranging and read
+pacing by the current integration window
+</summary>
+<hardware>None - simulated devices</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.runtime.async_runtime import AsyncRuntime
+from src.core.runtime.constants import RuntimeConstants
+from src.senses.light.tsl2561 import LightConstants, LightSensor
+
+
+@pytest.fixture
+def sensor():
+    light = LightSensor()
+    light.set_auto_range(True)
+    assert light.initialize()
+    yield light
+    light.cleanup()
+
+
+def channel_reads(sensor: LightSensor) -> int:
+    return sum(sensor.auto_ranger.get_stats()['reads'].values())
+
+
+def read_paced(sensor: LightSensor, reads: int):
+    """Read once per current integration window, as the runtime does; returns the last value"""
+    for _ in range(reads):
+        value = sensor.get_luminosity()
+        time.sleep(LightConstants.INTEGRATION_WINDOW_MS[sensor.integration_time] / 1000)
+    return value
+
+
+@pytest.mark.parametrize("lux, window_ms", [
+    (30000.0, LightConstants.INTEGRATION_TIME_FAST),
+    (0.5, LightConstants.INTEGRATION_TIME_SLOW),
+])
+def test_auto_range_settles_on_window_for_light_level(sensor, simulated_scene, lux, window_ms):
+    simulated_scene.lux_override = lux
+    value = read_paced(sensor, 4)
+    assert sensor.integration_time == window_ms
+    assert value == pytest.approx(lux, rel=0.2)
+
+
+def test_read_returns_last_window_without_waiting(sensor, simulated_scene):
+    simulated_scene.lux_override = 0.5
+    read_paced(sensor, 6)
+    assert sensor.integration_time == LightConstants.INTEGRATION_TIME_SLOW
+    sequence = sensor.get_sample().sequence
+
+    started = time.monotonic()
+    value = sensor.get_luminosity()
+    assert time.monotonic() - started < 0.01
+    assert sensor.get_sample().sequence == sequence + 1
+    assert value == pytest.approx(0.5, rel=0.2)
+
+
+def test_reads_within_a_window_skip_the_bus(sensor, simulated_scene):
+    simulated_scene.lux_override = 300.0
+    read_paced(sensor, 3)
+    sensor.get_luminosity()
+    sample = sensor.get_sample()
+    reads = channel_reads(sensor)
+
+    for _ in range(20):
+        assert sensor.get_luminosity() == sample.value
+    assert channel_reads(sensor) == reads
+    assert sensor.get_sample().sequence == sample.sequence
+
+    time.sleep(LightConstants.INTEGRATION_WINDOW_MS[sensor.integration_time] / 1000)
+    sensor.get_luminosity()
+    assert channel_reads(sensor) == reads + 1
+
+
+def test_raw_reads_wait_for_a_new_window(sensor, simulated_scene):
+    simulated_scene.lux_override = 300.0
+    read_paced(sensor, 3)
+    window = LightConstants.INTEGRATION_WINDOW_MS[sensor.integration_time] / 1000
+    reads = channel_reads(sensor)
+
+    started = time.monotonic()
+    for _ in range(3):
+        assert sensor.read_raw_lux() == pytest.approx(300.0, rel=0.1)
+    assert time.monotonic() - started >= 2 * window
+    assert channel_reads(sensor) == reads + 3
+
+
+def test_runtime_paces_light_by_current_window(robot, sensor, simulated_scene):
+    simulated_scene.lux_override = 30000.0
+    robot.light_sensor = sensor
+    robot.runtime = AsyncRuntime()
+    assert robot._attach_sense(robot.runtime, 'light_sensor')
+    source = robot.runtime._sources[RuntimeConstants.SENSE_LIGHT]
+    runner = threading.Thread(target=robot.runtime.run, daemon=True)
+    runner.start()
+    try:
+        # Bright: 13 ms windows; then dark, where auto-ranging moves to 402 ms
+        time.sleep(0.5)
+        assert sensor.integration_time == LightConstants.INTEGRATION_TIME_FAST
+        simulated_scene.lux_override = 0.5
+        time.sleep(0.5)
+        assert sensor.integration_time == LightConstants.INTEGRATION_TIME_SLOW
+        assert source.get_min_interval() == pytest.approx(0.402)
+
+        reads = channel_reads(sensor)
+        time.sleep(1.0)
+        # One read per 402 ms window, not one per 13 ms
+        assert channel_reads(sensor) - reads <= 3
+    finally:
+        robot.runtime.request_stop()
+        runner.join(2.0)
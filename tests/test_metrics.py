@@ -0,0 +1,68 @@
+"""
+<summary>
+Sharded metrics: per-thread cells of exited threads are folded into the
+totals instead of accumulating
+</summary>
+<hardware>None</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import gc
+import threading
+
+import pytest
+
+from src.core.utils.metrics import Counter, Histogram
+
+THREADS = 200
+
+
+def run_threads(target) -> None:
+    for _ in range(THREADS):
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+
+def test_exited_threads_fold_into_counter_total():
+    counter = Counter("test_counter", "", {})
+    counter.inc()
+    run_threads(lambda: counter.inc(2))
+
+    assert counter.value == 1 + 2 * THREADS
+    # The retired totals plus the one live (main) thread
+    assert len(counter._cells) == 2
+
+
+def test_exited_threads_fold_into_histogram():
+    histogram = Histogram("test_seconds", "", {}, buckets=(0.1, 1.0))
+    run_threads(lambda: (histogram.observe(0.05), histogram.observe(5.0)))
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 2 * THREADS
+    assert snapshot['sum'] == pytest.approx(5.05 * THREADS)
+    assert snapshot['buckets'] == [(0.1, THREADS), (1.0, THREADS), (float('inf'), 2 * THREADS)]
+    assert len(histogram._cells) == 1
+
+
+def test_concurrent_reads_see_every_increment_once():
+    counter = Counter("test_concurrent", "", {})
+    stop = threading.Event()
+    seen = []
+
+    def read() -> None:
+        while not stop.is_set():
+            seen.append(counter.value)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        run_threads(counter.inc)
+    finally:
+        stop.set()
+        reader.join()
+    # Retiring a cell never counts it twice or drops it
+    assert seen == sorted(seen)
+    assert max(seen) <= THREADS
+    assert counter.value == THREADS
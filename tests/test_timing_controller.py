@@ -0,0 +1,98 @@
+"""
+<summary>
+Adaptive VL53L0X timing budget: accuracy mode chosen from what the scene is
+doing, and the runtime pacing that follows it
+</summary>
+<hardware>None - simulated devices</hardware>
+<dependencies>pytest</dependencies>
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.runtime import AsyncRuntime
+from src.senses.proximity.vl53l0x import DistanceConstants, DistanceSensor
+from src.senses.proximity.vl53l0x.timing_controller import TimingBudgetController
+
+RATE_HZ = 30
+
+
+def feed(controller: TimingBudgetController, start: float, seconds: float, distance_mm, raw_mm=None):
+    """Feed readings at RATE_HZ; distance_mm may be a function of the time since start. Returns the end time"""
+    steps = int(seconds * RATE_HZ)
+    for step in range(steps):
+        elapsed = step / RATE_HZ
+        distance = distance_mm(elapsed) if callable(distance_mm) else distance_mm
+        controller.update(start + elapsed, distance if raw_mm is None else raw_mm, distance)
+    return start + steps / RATE_HZ
+
+
+def test_new_object_ranges_fast_then_precise_once_still():
+    controller = TimingBudgetController()
+    now = feed(controller, 0.0, 0.1, 600.0)
+    assert controller.accuracy == DistanceConstants.ADAPTIVE_FAST
+
+    feed(controller, now, DistanceConstants.ADAPTIVE_FAST_HOLD + DistanceConstants.ADAPTIVE_STATIC_HOLD + 0.2, 600.0)
+    assert controller.accuracy == DistanceConstants.ADAPTIVE_PRECISE
+    assert controller.get_stats()['profiles'][DistanceConstants.ADAPTIVE_PRECISE]['noise_mm'] is not None
+
+
+def test_approach_switches_to_fast_at_once():
+    controller = TimingBudgetController()
+    now = feed(controller, 0.0, 4.0, 900.0)
+    assert controller.accuracy == DistanceConstants.ADAPTIVE_PRECISE
+
+    speed = 2 * DistanceConstants.ADAPTIVE_APPROACH_SPEED_MM_S
+    # Detected before the speed window has filled with approach readings
+    feed(controller, now, DistanceConstants.ADAPTIVE_SPEED_WINDOW * 0.75, lambda t: 900.0 - speed * t)
+    assert controller.accuracy == DistanceConstants.ADAPTIVE_FAST
+    assert controller.speed_mm_s > DistanceConstants.ADAPTIVE_APPROACH_SPEED_MM_S
+
+
+def test_raw_jump_inside_estimate_counts_as_approach():
+    controller = TimingBudgetController()
+    now = feed(controller, 0.0, 4.0, 900.0)
+    # The filter still rejects the close reading as a spike and reports 900 mm
+    controller.update(now, 300.0, 900.0)
+    assert controller.accuracy == DistanceConstants.ADAPTIVE_FAST
+
+
+def test_nothing_in_range_settles_on_balanced():
+    controller = TimingBudgetController()
+    now = feed(controller, 0.0, 0.1, 600.0)
+    feed(controller, now, DistanceConstants.ADAPTIVE_FAST_HOLD + 0.1, None, raw_mm=DistanceConstants.NO_TARGET_MM)
+    assert controller.accuracy == DistanceConstants.ADAPTIVE_BALANCED
+    assert controller.speed_mm_s is None
+
+
+def test_distance_sense_follows_published_samples(robot, simulated_scene, wait_until):
+    sensor = robot.distance_sensor = DistanceSensor()
+    sensor.set_measurement_mode(DistanceConstants.MODE_CONTINUOUS)
+    assert sensor.initialize()
+    assert sensor.set_accuracy(DistanceConstants.ADAPTIVE_PRECISE)
+    polls = []
+    sensor.get_distance_cm = lambda: polls.append(1)
+    heartbeats = []
+    robot.runtime = AsyncRuntime(supervisor=SimpleNamespace(heartbeat=heartbeats.append))
+    assert robot._attach_sense(robot.runtime, 'distance_sensor')
+    runner = threading.Thread(target=robot.runtime.run, daemon=True)
+    runner.start()
+    try:
+        assert wait_until(lambda: heartbeats)
+        sequence = sensor.get_sample().sequence
+        count = len(heartbeats)
+        time.sleep(1.0)
+        # One delivery per measurement at the current budget, no polling of the cached sample
+        assert len(heartbeats) - count == pytest.approx(sensor.get_sample().sequence - sequence, abs=1)
+        assert len(heartbeats) - count <= 1.0 / (sensor.timing_budget / 1_000_000) + 1
+        assert not polls
+
+        events = robot.runtime.events_dispatched
+        simulated_scene.distance_override_mm = 100
+        assert wait_until(lambda: robot.runtime.events_dispatched > events)
+    finally:
+        robot.runtime.request_stop()
+        runner.join(2.0)